@@ -0,0 +1,85 @@
+"""
+Persistent on-disk cache for external API responses
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+
+class ApiResponseCache:
+    """SQLite-backed cache mapping (domain, endpoint, params) to JSON responses"""
+    
+    def __init__(self, path, ttl):
+        """
+        Args:
+            path (str): SQLite database file
+            ttl (int): Seconds before a cached response expires
+        """
+        self.ttl = ttl
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses "
+            "(key TEXT PRIMARY KEY, body BLOB NOT NULL, expires_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS responses_expires_at ON responses (expires_at)"
+        )
+        self._conn.commit()
+        self.purge_expired()
+    
+    def purge_expired(self):
+        """Delete expired responses so the database doesn't grow without bound"""
+        try:
+            with self._lock:
+                self._conn.execute("DELETE FROM responses WHERE expires_at < ?", (time.time(),))
+                self._conn.commit()
+        except sqlite3.Error as e:
+            self.logger.error(f"API cache purge error: {str(e)}")
+    
+    @staticmethod
+    def make_key(domain, endpoint, params):
+        """Hash the request so API keys and phone numbers are never stored in clear text"""
+        raw = f"{domain}|{endpoint}|{json.dumps(params, sort_keys=True, default=str)}"
+        return hashlib.sha256(raw.encode()).hexdigest()
+    
+    def get(self, domain, endpoint, params):
+        """Return the cached response for a request, or None if missing or expired"""
+        key = self.make_key(domain, endpoint, params)
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT body, expires_at FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+            if not row or row[1] < time.time():
+                return None
+            return json.loads(row[0])
+        except (sqlite3.Error, ValueError) as e:
+            self.logger.error(f"API cache read error: {str(e)}")
+            return None
+    
+    def set(self, domain, endpoint, params, data, ttl=None):
+        """Store a JSON-serializable response for a request; ttl overrides the cache default"""
+        key = self.make_key(domain, endpoint, params)
+        try:
+            body = json.dumps(data, default=str).encode()
+            now = time.time()
+            with self._lock:
+                # Writes are rare next to reads, so sweep expired rows here as well
+                self._conn.execute("DELETE FROM responses WHERE expires_at < ?", (now,))
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, body, expires_at) VALUES (?, ?, ?)",
+                    (key, body, now + (self.ttl if ttl is None else ttl))
+                )
+                self._conn.commit()
+        except (sqlite3.Error, TypeError) as e:
+            self.logger.error(f"API cache write error: {str(e)}")
+    
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
@@ -1,31 +1,164 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import json
+import asyncio
+import bisect
+import hashlib
+import html
+import string
+from collections import deque
+from itertools import islice
+from types import MappingProxyType
 from datetime import datetime
 import logging
+from numbers import Integral
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+import queue
+import atexit
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from phone_intelligence import PhoneIntelligence
-from config import Config
-import folium
-from streamlit_folium import st_folium
-import plotly.express as px
-import plotly.graph_objects as go
-from reportlab.lib.pagesizes import letter, A4
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.lib import colors
+from config import Config, ApiKeys
+from rate_limiter import AsyncRateLimiter
+from serialization import dumps_json, record_to_csv, frame_to_csv
+from gui_components import wide_download_button
 from io import BytesIO
+from urllib.parse import quote
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('phone_intelligence.log'),
+# folium, plotly and reportlab are imported inside the functions that use
+# them so Streamlit reruns and cold starts don't pay for unused libraries
+
+# Configure logging once per process; Streamlit re-executes this module on every rerun
+if not logging.getLogger().handlers:
+    _log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+    _log_handlers = [
+        RotatingFileHandler('phone_intelligence.log', maxBytes=5_000_000, backupCount=3),
         logging.StreamHandler()
     ]
+    for _handler in _log_handlers:
+        _handler.setFormatter(_log_formatter)
+    
+    # Log records are queued and written by a background listener thread
+    _log_queue = queue.SimpleQueue()
+    _log_listener = QueueListener(_log_queue, *_log_handlers)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+    
+    logging.basicConfig(level=logging.INFO, handlers=[QueueHandler(_log_queue)])
+
+# Upper bound on parallel batch lookups regardless of the configured plan
+MAX_BATCH_CONCURRENCY = 8
+
+# Distinct API key sets that keep a PhoneIntelligence instance (session + SQLite handle) alive
+PHONE_INTEL_CACHE_ENTRIES = 16
+
+# Rows read from an uploaded CSV per batch chunk
+CSV_CHUNK_SIZE = 500
+
+# Batch result rows rendered in the browser; the full set is downloadable
+MAX_DISPLAY_ROWS = 500
+
+# Rendered map documents kept in memory; each folium page is tens of KB
+MAP_CACHE_ENTRIES = 256
+
+# Quick example numbers offered on the single-number page
+EXAMPLES = ("+1-555-123-4567", "+44 20 7946 0958", "+49 30 12345678", "+81 3-1234-5678")
+
+# Flat result fields shown and exported for batch analyses
+BATCH_RESULT_COLUMNS = (
+    'country', 'region', 'carrier', 'line_type', 'timezone',
+    'country_code', 'risk_score', 'error'
 )
 
+# Risk score buckets: scores above each threshold move up one level
+RISK_THRESHOLDS = (40, 70)
+RISK_LEVELS = ("Low", "Medium", "High")
+RISK_COLORS = ("#10b981", "#f59e0b", "#ef4444")
+
+def risk_bucket(risk_score):
+    """Return the (level, color) pair for a 0-100 risk score"""
+    index = bisect.bisect_left(RISK_THRESHOLDS, risk_score)
+    return RISK_LEVELS[index], RISK_COLORS[index]
+
+# Page-wide styles, injected once via inject_css
+CSS_BLOCK = """
+<style>
+.main-header {
+    background: linear-gradient(90deg, #1e3a8a 0%, #3b82f6 100%);
+    padding: 2rem;
+    border-radius: 10px;
+    margin-bottom: 2rem;
+    text-align: center;
+    color: white;
+}
+.metric-card {
+    background: #f8fafc;
+    padding: 1rem;
+    border-radius: 8px;
+    border-left: 4px solid #3b82f6;
+    margin: 0.5rem 0;
+}
+.metric-strip {
+    display: flex;
+    gap: 1rem;
+}
+.metric-strip .metric-card { flex: 1; }
+.risk-high { border-left-color: #ef4444; }
+.risk-medium { border-left-color: #f59e0b; }
+.risk-low { border-left-color: #10b981; }
+.sidebar-section {
+    background: #f1f5f9;
+    padding: 1rem;
+    border-radius: 8px;
+    margin: 1rem 0;
+}
+.osint-banner {
+    padding: 1rem;
+    border-radius: 8px;
+    color: white;
+    margin: 1rem 0;
+}
+.osint-banner-email { background: linear-gradient(90deg, #3b82f6 0%, #1d4ed8 100%); }
+.osint-banner-social { background: linear-gradient(90deg, #8b5cf6 0%, #7c3aed 100%); }
+</style>
+"""
+
+# Key metric card shown in the analysis overview
+METRIC_CARD_HTML = """
+<div class="metric-card">
+    <h4>{icon} {label}</h4>
+    <h3>{value}</h3>
+</div>
+"""
+
+# Section banners in the OSINT view; styled by CSS_BLOCK
+EMAIL_BANNER_HTML = '<div class="osint-banner osint-banner-email"><h4>📧 Email Addresses Found</h4></div>'
+SOCIAL_BANNER_HTML = '<div class="osint-banner osint-banner-social"><h4>📱 Social Media Profiles Found</h4></div>'
+
+@st.cache_resource
+def inject_css():
+    """Emit the page stylesheet; Streamlit replays the cached element on reruns"""
+    st.markdown(CSS_BLOCK, unsafe_allow_html=True)
+
+@st.cache_resource
+def get_analysis_executor():
+    """Return the worker pool that runs single-number analyses off the script thread"""
+    return ThreadPoolExecutor(max_workers=MAX_BATCH_CONCURRENCY, thread_name_prefix="analysis")
+
+def get_api_keys():
+    """Return this session's API keys, defaulting to the environment configuration"""
+    return st.session_state.get('api_keys') or ApiKeys()
+
+@st.cache_resource(max_entries=PHONE_INTEL_CACHE_ENTRIES)
+def get_phone_intel(keys_fingerprint, _api_keys):
+    """Return a PhoneIntelligence instance shared across reruns and sessions with the same keys
+    
+    Evicted instances close their HTTP session and SQLite connection once garbage collected.
+    """
+    return PhoneIntelligence(_api_keys)
+
 def main():
     st.set_page_config(
         page_title="Phone Intelligence Tool",
@@ -34,34 +167,7 @@ def main():
         initial_sidebar_state="expanded"
     )
     
-    st.markdown("""
-    <style>
-    .main-header {
-        background: linear-gradient(90deg, #1e3a8a 0%, #3b82f6 100%);
-        padding: 2rem;
-        border-radius: 10px;
-        margin-bottom: 2rem;
-        text-align: center;
-        color: white;
-    }
-    .metric-card {
-        background: #f8fafc;
-        padding: 1rem;
-        border-radius: 8px;
-        border-left: 4px solid #3b82f6;
-        margin: 0.5rem 0;
-    }
-    .risk-high { border-left-color: #ef4444; }
-    .risk-medium { border-left-color: #f59e0b; }
-    .risk-low { border-left-color: #10b981; }
-    .sidebar-section {
-        background: #f1f5f9;
-        padding: 1rem;
-        border-radius: 8px;
-        margin: 1rem 0;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    inject_css()
     
     st.markdown("""
     <div class="main-header">
@@ -91,6 +197,21 @@ def main():
             twilio_token = st.text_input("Twilio Auth Token", type="password", help="For security analysis")
             hibp_key = st.text_input("HaveIBeenPwned API Key", type="password", help="For breach data")
             
+            max_concurrent = st.number_input(
+                "Max Concurrent Requests",
+                min_value=1,
+                max_value=MAX_BATCH_CONCURRENCY,
+                value=min(Config.MAX_CONCURRENT_REQUESTS, MAX_BATCH_CONCURRENCY),
+                help="Parallel lookups during batch analysis"
+            )
+            max_rps = st.number_input(
+                "Max Requests per Second",
+                min_value=0.1,
+                value=float(Config.MAX_REQUESTS_PER_SECOND),
+                step=0.5,
+                help="Match this to your API plan's rate limit"
+            )
+            
             if st.button("💾 Save Configuration"):
                 save_api_config(numverify_key, twilio_sid, twilio_token, hibp_key)
                 st.success("Configuration saved!")
@@ -99,9 +220,12 @@ def main():
         
         # Analysis Options
         st.markdown("### ⚙️ Analysis Options")
-        include_osint = st.checkbox("Include OSINT data", value=True)
-        include_security = st.checkbox("Security analysis", value=True)
-        include_geolocation = st.checkbox("Geographic analysis", value=True)
+        # Options only apply on submit, so toggling one doesn't rerun the app
+        with st.form("analysis_options"):
+            include_osint = st.checkbox("Include OSINT data", value=True)
+            include_security = st.checkbox("Security analysis", value=True)
+            include_geolocation = st.checkbox("Geographic analysis", value=True)
+            st.form_submit_button("Apply Options")
         
         st.markdown("---")
         
@@ -139,12 +263,13 @@ def main():
         """, unsafe_allow_html=True)
     
     # Initialize phone intelligence
-    phone_intel = PhoneIntelligence()
+    api_keys = get_api_keys()
+    phone_intel = get_phone_intel(api_keys.fingerprint(), api_keys)
     
     if analysis_mode == "Single Number":
         single_number_analysis(phone_intel, include_osint, include_security, include_geolocation)
     elif analysis_mode == "Batch Analysis":
-        batch_analysis(phone_intel)
+        batch_analysis(phone_intel, max_concurrent, max_rps)
     else:
         real_time_monitor(phone_intel)
 
@@ -155,21 +280,27 @@ def single_number_analysis(phone_intel, include_osint, include_security, include
     if 'current_results' not in st.session_state:
         st.session_state.current_results = None
     if 'analysis_history' not in st.session_state:
-        st.session_state.analysis_history = []
-    
-    col1, col2, col3 = st.columns([3, 1, 1])
+        st.session_state.analysis_history = deque(maxlen=Config.ANALYSIS_HISTORY_LIMIT)
     
-    with col1:
-        phone_input = st.text_input(
-            "Enter phone number:",
-            placeholder="e.g., +1-555-123-4567, (555) 123-4567, +44 20 7946 0958",
-            help="Enter phone number in any format. International format recommended."
-        )
+    form_col, clear_col = st.columns([4, 1])
     
-    with col2:
-        analyze_button = st.button("🔍 Analyze", type="primary", use_container_width=True)
+    # Typing in the form doesn't trigger reruns until Analyze is submitted
+    with form_col:
+        with st.form("single_analysis", border=False):
+            col1, col2 = st.columns([3, 1])
+            
+            with col1:
+                phone_input = st.text_input(
+                    "Enter phone number:",
+                    key="phone_input",
+                    placeholder="e.g., +1-555-123-4567, (555) 123-4567, +44 20 7946 0958",
+                    help="Enter phone number in any format. International format recommended."
+                )
+            
+            with col2:
+                analyze_button = st.form_submit_button("🔍 Analyze", type="primary", use_container_width=True)
     
-    with col3:
+    with clear_col:
         clear_button = st.button("🗑️ Clear", use_container_width=True)
         if clear_button:
             if 'current_results' in st.session_state:
@@ -177,14 +308,17 @@ def single_number_analysis(phone_intel, include_osint, include_security, include
             st.rerun()
     
     st.markdown("**Quick Examples:**")
-    example_cols = st.columns(4)
-    examples = ["+1-555-123-4567", "+44 20 7946 0958", "+49 30 12345678", "+81 3-1234-5678"]
+    example_cols = st.columns(len(EXAMPLES))
     
-    for i, example in enumerate(examples):
+    # The callback fills the input before the rerun, so no extra st.rerun() is needed
+    for i, example in enumerate(EXAMPLES):
         with example_cols[i]:
-            if st.button(f"📱 {example}", key=f"example_{i}"):
-                st.session_state.phone_input = example
-                st.rerun()
+            st.button(
+                f"📱 {example}",
+                key=f"example_{i}",
+                on_click=st.session_state.update,
+                kwargs={'phone_input': example}
+            )
     
     if analyze_button and phone_input:
         with st.spinner("🔄 Analyzing phone number..."):
@@ -198,8 +332,15 @@ def single_number_analysis(phone_intel, include_osint, include_security, include
                 status_text.text("Parsing phone number...")
                 progress_bar.progress(25)
                 
-                # Perform analysis
-                results = phone_intel.analyze_phone_number(phone_input)
+                # Perform analysis on a worker thread and animate progress while it runs
+                future = get_analysis_executor().submit(analyze_number, phone_intel, phone_input)
+                progress = 25
+                while not future.done():
+                    time.sleep(0.1)
+                    progress = min(progress + 1, 49)
+                    progress_bar.progress(progress)
+                
+                results = future.result()
                 progress_bar.progress(50)
                 
                 if results.get('error'):
@@ -215,8 +356,7 @@ def single_number_analysis(phone_intel, include_osint, include_security, include
                     'timestamp': datetime.now(),
                     'phone_number': phone_input,
                     'risk_score': results.get('risk_score', 0),
-                    'country': results.get('country', 'Unknown'),
-                    'results': results
+                    'country': results.get('country', 'Unknown')
                 })
                 
                 progress_bar.progress(100)
@@ -239,19 +379,141 @@ def single_number_analysis(phone_intel, include_osint, include_security, include
             st.markdown("---")
             st.markdown("### 📊 Analysis History")
             
-            history_df = pd.DataFrame([
-                {
-                    'Time': h['timestamp'].strftime('%H:%M:%S'),
-                    'Phone Number': h['phone_number'][:8] + '***',
-                    'Country': h['country'],
-                    'Risk Score': h['risk_score']
-                }
-                for h in st.session_state.analysis_history[-5:]  # Show last 5 analyses
-            ])
+            # Show last 5 analyses
+            history_df = pd.json_normalize(
+                list(st.session_state.analysis_history)[-5:], max_level=0
+            )[['timestamp', 'phone_number', 'country', 'risk_score']]
+            history_df = pd.DataFrame({
+                'Time': pd.to_datetime(history_df['timestamp']).dt.strftime('%H:%M:%S'),
+                'Phone Number': history_df['phone_number'].str[:8] + '***',
+                'Country': history_df['country'],
+                'Risk Score': history_df['risk_score']
+            })
             
             st.dataframe(history_df, use_container_width=True)
 
-def batch_analysis(phone_intel):
+class AnalysisFailed(Exception):
+    """Raised out of cached_analyze so st.cache_data never stores a failed analysis"""
+    
+    def __init__(self, results):
+        super().__init__(results.get('error'))
+        self.results = results
+
+@st.cache_data(ttl=Config.CACHE_TTL, max_entries=1024, show_spinner=False)
+def cached_analyze(_phone_intel, phone_key, keys_fingerprint):
+    """Analyze a phone number, reusing successful results for the same number and key set across reruns"""
+    results = _phone_intel.analyze_phone_number(phone_key)
+    if 'error' in results:
+        raise AnalysisFailed(results)
+    return results
+
+def analyze_number(phone_intel, phone_input):
+    """Analyze phone_input through the results cache, keyed on its E.164 form"""
+    phone_key = phone_intel.normalize_number(phone_input) or phone_input
+    try:
+        results = cached_analyze(phone_intel, phone_key, phone_intel.api_keys.fingerprint())
+    except AnalysisFailed as e:
+        return e.results
+    results['input_number'] = phone_input
+    return results
+
+async def _analyze_async(phone_intel, phone_number):
+    """Run a single analysis on a worker thread so batch lookups overlap"""
+    return await asyncio.to_thread(analyze_number, phone_intel, phone_number)
+
+def run_batch_analysis(phone_intel, numbers, progress_bar=None,
+                       max_concurrent=Config.MAX_CONCURRENT_REQUESTS,
+                       max_rps=Config.MAX_REQUESTS_PER_SECOND,
+                       progress_range=(0.0, 1.0)):
+    """
+    Analyze phone numbers concurrently within provider rate limits
+    
+    Args:
+        phone_intel: PhoneIntelligence instance
+        numbers (list): Phone numbers to analyze
+        progress_bar: Optional Streamlit progress bar updated as analyses complete
+        max_concurrent (int): Maximum analyses in flight at once
+        max_rps (float): Maximum analyses started per second
+        progress_range (tuple): (start, end) fractions of the progress bar this
+                                call fills, for callers analyzing in chunks
+        
+    Returns:
+        list: Analysis results in the same order as numbers
+    """
+    if not numbers:
+        return []
+    
+    max_concurrent = max(1, min(int(max_concurrent), MAX_BATCH_CONCURRENCY))
+    
+    # Analyze each distinct E.164 number once and broadcast back to input order
+    keys = [phone_intel.normalize_number(number) or number for number in numbers]
+    unique_keys = list(dict.fromkeys(keys))
+    
+    async def _gather():
+        results = [None] * len(unique_keys)
+        semaphore = asyncio.Semaphore(max_concurrent)
+        limiter = AsyncRateLimiter(max_rps, backoff_until=lambda: phone_intel.rate_limited_until)
+        
+        async def _indexed(index, number):
+            async with semaphore:
+                await limiter.acquire()
+                return index, await _analyze_async(phone_intel, number)
+        
+        done = 0
+        for next_result in asyncio.as_completed([_indexed(i, k) for i, k in enumerate(unique_keys)]):
+            index, result = await next_result
+            results[index] = result
+            done += 1
+            if progress_bar is not None:
+                start, end = progress_range
+                progress_bar.progress(min(1.0, start + (end - start) * done / len(unique_keys)))
+        
+        return results
+    
+    lookup = dict(zip(unique_keys, asyncio.run(_gather())))
+    return [lookup[key] for key in keys]
+
+def read_phone_csv(uploaded_file):
+    """Open a chunked reader over the phone_number column of an uploaded CSV"""
+    uploaded_file.seek(0)
+    return pd.read_csv(
+        uploaded_file,
+        chunksize=CSV_CHUNK_SIZE,
+        usecols=['phone_number'],
+        dtype={'phone_number': 'string'}
+    )
+
+def build_batch_dataframe(numbers, batch_results):
+    """Assemble batch results into a flat DataFrame, one column list at a time"""
+    columns = {'phone_number': list(numbers)}
+    columns.update({col: [] for col in BATCH_RESULT_COLUMNS})
+    
+    for result in batch_results:
+        for col in BATCH_RESULT_COLUMNS:
+            columns[col].append(result.get(col))
+    
+    return pd.DataFrame(columns)
+
+@st.cache_data(show_spinner=False)
+def results_to_csv(results_df):
+    """Encode batch results as CSV bytes for download"""
+    return frame_to_csv(results_df)
+
+def display_batch_results(results_df, total_rows, csv_data):
+    """Render at most MAX_DISPLAY_ROWS batch results and offer the full set as CSV"""
+    if total_rows > MAX_DISPLAY_ROWS:
+        st.caption(f"Showing first {MAX_DISPLAY_ROWS} of {total_rows} rows; download the full CSV below.")
+    st.dataframe(results_df.head(MAX_DISPLAY_ROWS), use_container_width=True)
+    
+    st.download_button(
+        label="📥 Download Results",
+        data=csv_data,
+        file_name=f"batch_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+        mime="text/csv"
+    )
+
+def batch_analysis(phone_intel, max_concurrent=Config.MAX_CONCURRENT_REQUESTS,
+                   max_rps=Config.MAX_REQUESTS_PER_SECOND):
     """Batch analysis interface"""
     st.markdown("### 📊 Batch Analysis")
     
@@ -261,33 +523,54 @@ def batch_analysis(phone_intel):
     uploaded_file = st.file_uploader("Choose a CSV file", type="csv")
     
     if uploaded_file is not None:
-        df = pd.read_csv(uploaded_file)
+        try:
+            with read_phone_csv(uploaded_file) as reader:
+                preview_df = reader.get_chunk(5)
+        except StopIteration:
+            preview_df = pd.DataFrame(columns=['phone_number'])
+        except ValueError:
+            st.error("❌ CSV file must contain a 'phone_number' column")
+            return
+        
         st.write("Preview of uploaded data:")
-        st.dataframe(df.head())
+        st.dataframe(preview_df)
         
         if st.button("🚀 Start Batch Analysis"):
-            batch_results = []
             progress_bar = st.progress(0)
+            status_text = st.empty()
+            csv_buffer = BytesIO()
+            display_frames = []
+            processed = 0
+            rows_read = 0
+            # Row count estimated from line breaks (header included); only scales the progress bar
+            estimated_rows = max(1, uploaded_file.getvalue().count(b"\n"))
             
-            for i, row in df.iterrows():
-                phone_number = row.get('phone_number', '')
-                if phone_number:
-                    result = phone_intel.analyze_phone_number(phone_number)
-                    batch_results.append(result)
-                    progress_bar.progress((i + 1) / len(df))
-            
-            # Display batch results
-            results_df = pd.DataFrame(batch_results)
-            st.dataframe(results_df)
+            # Analyze the upload chunk by chunk so the raw CSV is never fully in memory
+            with read_phone_csv(uploaded_file) as reader:
+                for chunk in reader:
+                    numbers = [num for num in chunk['phone_number'].dropna().tolist() if num.strip()]
+                    progress_range = (rows_read / estimated_rows, (rows_read + len(chunk)) / estimated_rows)
+                    rows_read += len(chunk)
+                    batch_results = run_batch_analysis(phone_intel, numbers, progress_bar, max_concurrent, max_rps,
+                                                       progress_range=progress_range)
+                    
+                    chunk_df = build_batch_dataframe(numbers, batch_results)
+                    # Header only at the start of the file, even when leading chunks had no valid numbers
+                    csv_buffer.write(frame_to_csv(chunk_df, header=csv_buffer.tell() == 0))
+                    
+                    # Only keep as many rows as will be rendered
+                    if processed < MAX_DISPLAY_ROWS:
+                        display_frames.append(chunk_df.head(MAX_DISPLAY_ROWS - processed))
+                    
+                    processed += len(numbers)
+                    status_text.text(f"Analyzed {processed} numbers...")
+            progress_bar.progress(1.0)
             
-            # Download results
-            csv = results_df.to_csv(index=False)
-            st.download_button(
-                label="📥 Download Results",
-                data=csv,
-                file_name=f"batch_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                mime="text/csv"
-            )
+            if display_frames:
+                results_df = pd.concat(display_frames, ignore_index=True)
+            else:
+                results_df = build_batch_dataframe([], [])
+            display_batch_results(results_df, processed, csv_buffer.getvalue())
     
     # Manual input option
     st.markdown("---")
@@ -302,17 +585,20 @@ def batch_analysis(phone_intel):
     if st.button("🔍 Analyze Manual Input") and manual_numbers:
         numbers = [num.strip() for num in manual_numbers.split('\n') if num.strip()]
         
-        batch_results = []
         progress_bar = st.progress(0)
-        
-        for i, number in enumerate(numbers):
-            result = phone_intel.analyze_phone_number(number)
-            batch_results.append(result)
-            progress_bar.progress((i + 1) / len(numbers))
+        batch_results = run_batch_analysis(phone_intel, numbers, progress_bar, max_concurrent, max_rps)
         
         # Display results
-        results_df = pd.DataFrame(batch_results)
-        st.dataframe(results_df)
+        results_df = build_batch_dataframe(numbers, batch_results)
+        display_batch_results(results_df, len(results_df), results_to_csv(results_df))
+
+def compute_monitor_stats(results):
+    """Derive monitor statistics from the latest analysis results"""
+    security_data = results.get('security_analysis', {})
+    return {
+        'alerts_today': 1 if risk_bucket(results.get('risk_score', 0))[0] == "High" else 0,
+        'risk_detections': len(security_data.get('risk_indicators', []))
+    }
 
 def real_time_monitor(phone_intel):
     """Real-time monitoring interface with actual functionality"""
@@ -324,19 +610,22 @@ def real_time_monitor(phone_intel):
         st.markdown("#### Active Monitoring")
         
         # Phone number input for monitoring
-        monitor_phone = st.text_input("Phone Number to Monitor", placeholder="+1234567890")
+        with st.form("monitor_form"):
+            monitor_phone = st.text_input("Phone Number to Monitor", placeholder="+1234567890")
+            start_monitoring = st.form_submit_button("🔍 Start Monitoring", type="primary")
         
         col_a, col_b = st.columns(2)
         with col_a:
-            if st.button("🔍 Start Monitoring", type="primary"):
+            if start_monitoring:
                 if monitor_phone:
                     with st.spinner("Initializing real-time monitoring..."):
                         # Perform initial analysis
-                        results = phone_intel.analyze_phone_number(monitor_phone)
+                        results = analyze_number(phone_intel, monitor_phone)
                         if 'error' not in results:
                             st.session_state['monitoring_active'] = True
                             st.session_state['monitored_number'] = monitor_phone
                             st.session_state['monitor_results'] = results
+                            st.session_state['monitor_stats'] = compute_monitor_stats(results)
                             st.success("✅ Monitoring started successfully!")
                         else:
                             st.error(f"❌ Error: {results['error']}")
@@ -347,6 +636,7 @@ def real_time_monitor(phone_intel):
             if st.button("⏹️ Stop Monitoring"):
                 st.session_state['monitoring_active'] = False
                 st.session_state['monitored_number'] = None
+                st.session_state.pop('monitor_stats', None)
                 st.info("Monitoring stopped")
         
         # Display monitoring status
@@ -361,8 +651,10 @@ def real_time_monitor(phone_intel):
                 with st.spinner("Refreshing monitoring data..."):
                     current_number = st.session_state.get('monitored_number')
                     if current_number:
-                        updated_results = phone_intel.analyze_phone_number(current_number)
+                        # Bypass the results cache and every lookup cache so a refresh always fetches live data
+                        updated_results = phone_intel.analyze_phone_number(current_number, fresh=True)
                         st.session_state['monitor_results'] = updated_results
+                        st.session_state['monitor_stats'] = compute_monitor_stats(updated_results)
                         st.success("Data refreshed!")
             
             # Display current monitoring results
@@ -390,9 +682,10 @@ def real_time_monitor(phone_intel):
                 
                 # Risk monitoring
                 risk_score = results.get('risk_score', 0)
-                if risk_score > 70:
+                risk_level, _ = risk_bucket(risk_score)
+                if risk_level == "High":
                     st.error(f"⚠️ **High Risk Detected:** {risk_score}/100")
-                elif risk_score > 40:
+                elif risk_level == "Medium":
                     st.warning(f"⚡ **Medium Risk:** {risk_score}/100")
                 else:
                     st.success(f"✅ **Low Risk:** {risk_score}/100")
@@ -412,19 +705,15 @@ def real_time_monitor(phone_intel):
     with col2:
         st.markdown("#### 📈 Monitor Statistics")
         
-        # Calculate statistics
+        # Statistics are computed when monitoring starts or refreshes, not per rerun
         active_monitors = 1 if st.session_state.get('monitoring_active', False) else 0
-        
-        # Generate some realistic metrics
-        import random
-        alerts_today = random.randint(0, 5) if active_monitors > 0 else 0
+        monitor_stats = st.session_state.get('monitor_stats', {}) if active_monitors else {}
         numbers_tracked = 1 if active_monitors > 0 else 0
-        risk_detections = random.randint(0, 2) if active_monitors > 0 else 0
         
         st.metric("Active Monitors", active_monitors)
-        st.metric("Alerts Today", alerts_today)
+        st.metric("Alerts Today", monitor_stats.get('alerts_today', 0))
         st.metric("Numbers Tracked", numbers_tracked)
-        st.metric("Risk Detections", risk_detections)
+        st.metric("Risk Detections", monitor_stats.get('risk_detections', 0))
         
         # Monitoring features
         st.markdown("#### 🛠️ Monitor Features")
@@ -441,17 +730,11 @@ def real_time_monitor(phone_intel):
         activity_alerts = st.checkbox("Activity Change Alerts", value=True)
         new_data_alerts = st.checkbox("New Data Discovery Alerts", value=True)
 
-def display_enhanced_results(results, include_osint, include_security, include_geolocation):
-    """Enhanced results display with better visualization"""
-    
-    st.markdown("## 📋 Analysis Overview")
+@st.cache_data(show_spinner=False)
+def build_risk_gauge(risk_score, risk_color):
+    """Build the risk score gauge, cached per (score, color) across reruns"""
+    import plotly.graph_objects as go
     
-    # Risk score visualization
-    risk_score = results.get('risk_score', 0)
-    risk_level = "High" if risk_score > 70 else "Medium" if risk_score > 40 else "Low"
-    risk_color = "#ef4444" if risk_score > 70 else "#f59e0b" if risk_score > 40 else "#10b981"
-    
-    # Create gauge chart for risk score
     fig = go.Figure(go.Indicator(
         mode = "gauge+number+delta",
         value = risk_score,
@@ -474,6 +757,18 @@ def display_enhanced_results(results, include_osint, include_security, include_g
         }
     ))
     fig.update_layout(height=300)
+    return fig
+
+def display_enhanced_results(results, include_osint, include_security, include_geolocation):
+    """Enhanced results display with better visualization"""
+    st.markdown("## 📋 Analysis Overview")
+    
+    # Risk score visualization
+    risk_score = results.get('risk_score', 0)
+    risk_level, risk_color = risk_bucket(risk_score)
+    
+    # Create gauge chart for risk score
+    fig = build_risk_gauge(int(round(risk_score)), risk_color)
     
     col1, col2 = st.columns([1, 2])
     
@@ -493,12 +788,10 @@ def display_enhanced_results(results, include_osint, include_security, include_g
             metric_cols = st.columns(2)
             for j, (label, value, icon) in enumerate(metrics_data[i:i+2]):
                 with metric_cols[j]:
-                    st.markdown(f"""
-                    <div class="metric-card">
-                        <h4>{icon} {label}</h4>
-                        <h3>{value}</h3>
-                    </div>
-                    """, unsafe_allow_html=True)
+                    st.markdown(
+                        METRIC_CARD_HTML.format(icon=icon, label=label, value=value),
+                        unsafe_allow_html=True
+                    )
     
     tabs = ["🔍 Details", "🗺️ Geographic", "🔒 Security", "🌐 OSINT", "⚙️ Technical", "📊 Export"]
     tab_objects = st.tabs(tabs)
@@ -560,204 +853,499 @@ def display_detailed_info(results):
         for key, value in network_data.items():
             st.write(f"• **{key}:** {value}")
 
+# Map common numeric country calling codes to ISO codes (read-only)
+NUMERIC_TO_ISO = MappingProxyType({
+    1: 'US',    # United States/Canada
+    44: 'GB',   # United Kingdom
+    49: 'DE',   # Germany
+    33: 'FR',   # France
+    39: 'IT',   # Italy
+    34: 'ES',   # Spain
+    81: 'JP',   # Japan
+    86: 'CN',   # China
+    91: 'IN',   # India
+    55: 'BR',   # Brazil
+    52: 'MX',   # Mexico
+    7: 'RU',    # Russia
+    61: 'AU',   # Australia
+    31: 'NL',   # Netherlands
+    41: 'CH',   # Switzerland
+    43: 'AT',   # Austria
+    45: 'DK',   # Denmark
+    46: 'SE',   # Sweden
+    47: 'NO',   # Norway
+    48: 'PL',   # Poland
+    90: 'TR',   # Turkey
+    82: 'KR',   # South Korea
+    66: 'TH',   # Thailand
+    65: 'SG',   # Singapore
+    60: 'MY',   # Malaysia
+    62: 'ID',   # Indonesia
+    63: 'PH',   # Philippines
+    84: 'VN',   # Vietnam
+    20: 'EG',   # Egypt
+    27: 'ZA',   # South Africa
+    54: 'AR',   # Argentina
+    56: 'CL',   # Chile
+    57: 'CO',   # Colombia
+    51: 'PE',   # Peru
+    58: 'VE',   # Venezuela
+    32: 'BE',   # Belgium
+    30: 'GR',   # Greece
+    351: 'PT',  # Portugal
+    353: 'IE',  # Ireland
+    358: 'FI',  # Finland
+    372: 'EE',  # Estonia
+    371: 'LV',  # Latvia
+    370: 'LT',  # Lithuania
+    420: 'CZ',  # Czech Republic
+    421: 'SK',  # Slovakia
+    386: 'SI',  # Slovenia
+    385: 'HR',  # Croatia
+    381: 'RS',  # Serbia
+    380: 'UA',  # Ukraine
+    375: 'BY',  # Belarus
+    374: 'AM',  # Armenia
+    995: 'GE',  # Georgia
+    994: 'AZ',  # Azerbaijan
+    998: 'UZ',  # Uzbekistan
+    996: 'KG',  # Kyrgyzstan
+    992: 'TJ',  # Tajikistan
+    993: 'TM',  # Turkmenistan
+    977: 'NP',  # Nepal
+    880: 'BD',  # Bangladesh
+    94: 'LK',   # Sri Lanka
+    95: 'MM',   # Myanmar
+    855: 'KH',  # Cambodia
+    856: 'LA',  # Laos
+    673: 'BN',  # Brunei
+    852: 'HK',  # Hong Kong
+    853: 'MO',  # Macau
+    886: 'TW',  # Taiwan
+})
+
+def _build_calling_code_trie(code_map):
+    """Build a digit trie over calling codes for longest-prefix lookups"""
+    trie = {}
+    for code, iso in code_map.items():
+        node = trie
+        for digit in str(code):
+            node = node.setdefault(digit, {})
+        node['_iso'] = iso
+    return trie
+
+CALLING_CODE_TRIE = _build_calling_code_trie(NUMERIC_TO_ISO)
+
+def lookup_iso(digits):
+    """Return the ISO code for the longest calling-code prefix of digits, or None"""
+    node = CALLING_CODE_TRIE
+    iso = None
+    for digit in str(digits):
+        node = node.get(digit)
+        if node is None:
+            break
+        iso = node.get('_iso', iso)
+    return iso
+
+# Approximate geographic centers for country/region ISO codes (read-only)
+COUNTRY_COORDS = MappingProxyType({
+    # North America
+    'US': (39.8283, -98.5795),  # Geographic center of US
+    'CA': (56.1304, -106.3468), # Geographic center of Canada
+    'MX': (23.6345, -102.5528), # Geographic center of Mexico
+    
+    # Europe
+    'GB': (54.7023, -3.2765),   # More accurate UK center
+    'DE': (51.1657, 10.4515),   # Geographic center of Germany
+    'FR': (46.6034, 2.2137),    # More accurate France center
+    'IT': (42.6384, 12.6741),   # More accurate Italy center
+    'ES': (40.0028, -4.0031),   # More accurate Spain center
+    'NL': (52.1326, 5.2913),    # Netherlands center
+    'CH': (46.8182, 8.2275),    # Switzerland center
+    'AT': (47.5162, 14.5501),   # Austria center
+    'DK': (56.2639, 9.5018),    # Denmark center
+    'SE': (60.1282, 18.6435),   # Sweden center
+    'NO': (60.4720, 8.4689),    # Norway center
+    'PL': (51.9194, 19.1451),   # Poland center
+    'BE': (50.5039, 4.4699),    # Belgium center
+    'GR': (39.0742, 21.8243),   # Greece center
+    'PT': (39.3999, -8.2245),   # Portugal center
+    'IE': (53.1424, -7.6921),   # Ireland center
+    'FI': (61.9241, 25.7482),   # Finland center
+    'EE': (58.5953, 25.0136),   # Estonia center
+    'LV': (56.8796, 24.6032),   # Latvia center
+    'LT': (55.1694, 23.8813),   # Lithuania center
+    'CZ': (49.8175, 15.4730),   # Czech Republic center
+    'SK': (48.6690, 19.6990),   # Slovakia center
+    'SI': (46.1512, 14.9955),   # Slovenia center
+    'HR': (45.1000, 15.2000),   # Croatia center
+    'RS': (44.0165, 21.0059),   # Serbia center
+    'UA': (48.3794, 31.1656),   # Ukraine center
+    'BY': (53.7098, 27.9534),   # Belarus center
+    'TR': (38.9637, 35.2433),   # Turkey center
+    
+    # Asia
+    'JP': (36.2048, 138.2529),  # Geographic center of Japan
+    'CN': (35.8617, 104.1954),  # Geographic center of China
+    'IN': (20.5937, 78.9629),   # Geographic center of India
+    'KR': (35.9078, 127.7669),  # South Korea center
+    'TH': (15.8700, 100.9925),  # Thailand center
+    'SG': (1.3521, 103.8198),   # Singapore center
+    'MY': (4.2105, 101.9758),   # Malaysia center
+    'ID': (-0.7893, 113.9213),  # Indonesia center
+    'PH': (12.8797, 121.7740),  # Philippines center
+    'VN': (14.0583, 108.2772),  # Vietnam center
+    'BD': (23.6850, 90.3563),   # Bangladesh center
+    'LK': (7.8731, 80.7718),    # Sri Lanka center
+    'MM': (21.9162, 95.9560),   # Myanmar center
+    'KH': (12.5657, 104.9910),  # Cambodia center
+    'LA': (19.8563, 102.4955),  # Laos center
+    'BN': (4.5353, 114.7277),   # Brunei center
+    'HK': (22.3193, 114.1694),  # Hong Kong center
+    'MO': (22.1987, 113.5439),  # Macau center
+    'TW': (23.6978, 120.9605),  # Taiwan center
+    'NP': (28.3949, 84.1240),   # Nepal center
+    'AM': (40.0691, 45.0382),   # Armenia center
+    'GE': (42.3154, 43.3569),   # Georgia center
+    'AZ': (40.1431, 47.5769),   # Azerbaijan center
+    'UZ': (41.3775, 64.5853),   # Uzbekistan center
+    'KG': (41.2044, 74.7661),   # Kyrgyzstan center
+    'TJ': (38.8610, 71.2761),   # Tajikistan center
+    'TM': (38.9697, 59.5563),   # Turkmenistan center
+    
+    # Oceania
+    'AU': (-25.2744, 133.7751), # Geographic center of Australia
+    'NZ': (-40.9006, 174.8860), # New Zealand center
+    
+    # South America
+    'BR': (-14.2350, -51.9253), # Geographic center of Brazil
+    'AR': (-38.4161, -63.6167), # Argentina center
+    'CL': (-35.6751, -71.5430), # Chile center
+    'CO': (4.5709, -74.2973),   # Colombia center
+    'PE': (-9.1900, -75.0152),  # Peru center
+    'VE': (6.4238, -66.5897),   # Venezuela center
+    'UY': (-32.5228, -55.7658), # Uruguay center
+    'PY': (-23.4425, -58.4438), # Paraguay center
+    'BO': (-16.2902, -63.5887), # Bolivia center
+    'EC': (-1.8312, -78.1834),  # Ecuador center
+    'GY': (4.8604, -58.9302),   # Guyana center
+    'SR': (3.9193, -56.0278),   # Suriname center
+    
+    # Africa
+    'EG': (26.0975, 30.0444),   # Egypt center
+    'ZA': (-30.5595, 22.9375),  # South Africa center
+    'NG': (9.0820, 8.6753),     # Nigeria center
+    'KE': (-0.0236, 37.9062),   # Kenya center
+    'ET': (9.1450, 40.4897),    # Ethiopia center
+    'GH': (7.9465, -1.0232),    # Ghana center
+    'MA': (31.7917, -7.0926),   # Morocco center
+    'TN': (33.8869, 9.5375),    # Tunisia center
+    'DZ': (28.0339, 1.6596),    # Algeria center
+    'LY': (26.3351, 17.2283),   # Libya center
+    
+    # Middle East
+    'SA': (23.8859, 45.0792),   # Saudi Arabia center
+    'AE': (23.4241, 53.8478),   # UAE center
+    'QA': (25.3548, 51.1839),   # Qatar center
+    'KW': (29.3117, 47.4818),   # Kuwait center
+    'BH': (25.9304, 50.6378),   # Bahrain center
+    'OM': (21.4735, 55.9754),   # Oman center
+    'YE': (15.5527, 48.5164),   # Yemen center
+    'JO': (30.5852, 36.2384),   # Jordan center
+    'LB': (33.8547, 35.8623),   # Lebanon center
+    'SY': (34.8021, 38.9968),   # Syria center
+    'IQ': (33.2232, 43.6793),   # Iraq center
+    'IR': (32.4279, 53.6880),   # Iran center
+    'IL': (31.0461, 34.8516),   # Israel center
+    'PS': (31.9522, 35.2332),   # Palestine center
+    
+    # Russia and former Soviet states
+    'RU': (61.5240, 105.3188),  # Geographic center of Russia
+})
+
+# Coordinates keyed by both ISO code and numeric calling code (read-only)
+COORDS_BY_CODE = MappingProxyType({
+    **COUNTRY_COORDS,
+    **{code: COUNTRY_COORDS[iso] for code, iso in NUMERIC_TO_ISO.items() if iso in COUNTRY_COORDS}
+})
+
 def get_country_coordinates(country_code):
     """Get more accurate coordinates for country/region centers with expanded coverage"""
-    # Convert integer country codes to ISO codes
+    if not country_code:
+        return None
+    
+    coords = COORDS_BY_CODE.get(country_code)
+    if coords is not None:
+        return coords
+    
+    # Calling codes outside the table fall back to a prefix match, defaulting to US
     if isinstance(country_code, int):
-        # Map common numeric country codes to ISO codes
-        numeric_to_iso = {
-            1: 'US',    # United States/Canada
-            44: 'GB',   # United Kingdom
-            49: 'DE',   # Germany
-            33: 'FR',   # France
-            39: 'IT',   # Italy
-            34: 'ES',   # Spain
-            81: 'JP',   # Japan
-            86: 'CN',   # China
-            91: 'IN',   # India
-            55: 'BR',   # Brazil
-            52: 'MX',   # Mexico
-            7: 'RU',    # Russia
-            61: 'AU',   # Australia
-            31: 'NL',   # Netherlands
-            41: 'CH',   # Switzerland
-            43: 'AT',   # Austria
-            45: 'DK',   # Denmark
-            46: 'SE',   # Sweden
-            47: 'NO',   # Norway
-            48: 'PL',   # Poland
-            90: 'TR',   # Turkey
-            82: 'KR',   # South Korea
-            66: 'TH',   # Thailand
-            65: 'SG',   # Singapore
-            60: 'MY',   # Malaysia
-            62: 'ID',   # Indonesia
-            63: 'PH',   # Philippines
-            84: 'VN',   # Vietnam
-            20: 'EG',   # Egypt
-            27: 'ZA',   # South Africa
-            54: 'AR',   # Argentina
-            56: 'CL',   # Chile
-            57: 'CO',   # Colombia
-            51: 'PE',   # Peru
-            58: 'VE',   # Venezuela
-            32: 'BE',   # Belgium
-            30: 'GR',   # Greece
-            351: 'PT',  # Portugal
-            353: 'IE',  # Ireland
-            358: 'FI',  # Finland
-            372: 'EE',  # Estonia
-            371: 'LV',  # Latvia
-            370: 'LT',  # Lithuania
-            420: 'CZ',  # Czech Republic
-            421: 'SK',  # Slovakia
-            386: 'SI',  # Slovenia
-            385: 'HR',  # Croatia
-            381: 'RS',  # Serbia
-            380: 'UA',  # Ukraine
-            375: 'BY',  # Belarus
-            374: 'AM',  # Armenia
-            995: 'GE',  # Georgia
-            994: 'AZ',  # Azerbaijan
-            998: 'UZ',  # Uzbekistan
-            996: 'KG',  # Kyrgyzstan
-            992: 'TJ',  # Tajikistan
-            993: 'TM',  # Turkmenistan
-            977: 'NP',  # Nepal
-            880: 'BD',  # Bangladesh
-            94: 'LK',   # Sri Lanka
-            95: 'MM',   # Myanmar
-            855: 'KH',  # Cambodia
-            856: 'LA',  # Laos
-            673: 'BN',  # Brunei
-            852: 'HK',  # Hong Kong
-            853: 'MO',  # Macau
-            886: 'TW',  # Taiwan
-        }
-        country_code = numeric_to_iso.get(country_code, 'US')  # Default to US if not found
+        return COUNTRY_COORDS.get(lookup_iso(country_code) or 'US')
+    return COUNTRY_COORDS.get(str(country_code).upper())
+
+# ISO codes sorted once, with their centers as a contiguous (N, 2) float32 array
+_SORTED_ISO_CODES = np.array(sorted(COUNTRY_COORDS))
+_SORTED_ISO_COORDS = np.array([COUNTRY_COORDS[code] for code in _SORTED_ISO_CODES], dtype=np.float32)
+
+def get_country_coordinates_batch(country_codes):
+    """Vectorised get_country_coordinates for many codes at once
     
-    # Ensure country_code is a string and convert to uppercase
-    if country_code:
-        country_code = str(country_code).upper()
-    else:
-        return None
+    Library API for bulk callers such as exports and notebooks; the UI plots one
+    number at a time through get_country_coordinates.
     
-    coords_map = {
-        # North America
-        'US': [39.8283, -98.5795],  # Geographic center of US
-        'CA': [56.1304, -106.3468], # Geographic center of Canada
-        'MX': [23.6345, -102.5528], # Geographic center of Mexico
-        
-        # Europe
-        'GB': [54.7023, -3.2765],   # More accurate UK center
-        'DE': [51.1657, 10.4515],   # Geographic center of Germany
-        'FR': [46.6034, 2.2137],    # More accurate France center
-        'IT': [42.6384, 12.6741],   # More accurate Italy center
-        'ES': [40.0028, -4.0031],   # More accurate Spain center
-        'NL': [52.1326, 5.2913],    # Netherlands center
-        'CH': [46.8182, 8.2275],    # Switzerland center
-        'AT': [47.5162, 14.5501],   # Austria center
-        'DK': [56.2639, 9.5018],    # Denmark center
-        'SE': [60.1282, 18.6435],   # Sweden center
-        'NO': [60.4720, 8.4689],    # Norway center
-        'PL': [51.9194, 19.1451],   # Poland center
-        'BE': [50.5039, 4.4699],    # Belgium center
-        'GR': [39.0742, 21.8243],   # Greece center
-        'PT': [39.3999, -8.2245],   # Portugal center
-        'IE': [53.1424, -7.6921],   # Ireland center
-        'FI': [61.9241, 25.7482],   # Finland center
-        'EE': [58.5953, 25.0136],   # Estonia center
-        'LV': [56.8796, 24.6032],   # Latvia center
-        'LT': [55.1694, 23.8813],   # Lithuania center
-        'CZ': [49.8175, 15.4730],   # Czech Republic center
-        'SK': [48.6690, 19.6990],   # Slovakia center
-        'SI': [46.1512, 14.9955],   # Slovenia center
-        'HR': [45.1000, 15.2000],   # Croatia center
-        'RS': [44.0165, 21.0059],   # Serbia center
-        'UA': [48.3794, 31.1656],   # Ukraine center
-        'BY': [53.7098, 27.9534],   # Belarus center
-        'TR': [38.9637, 35.2433],   # Turkey center
+    Args:
+        country_codes: Iterable or NumPy array of ISO codes or numeric calling codes
         
-        # Asia
-        'JP': [36.2048, 138.2529],  # Geographic center of Japan
-        'CN': [35.8617, 104.1954],  # Geographic center of China
-        'IN': [20.5937, 78.9629],   # Geographic center of India
-        'KR': [35.9078, 127.7669],  # South Korea center
-        'TH': [15.8700, 100.9925],  # Thailand center
-        'SG': [1.3521, 103.8198],   # Singapore center
-        'MY': [4.2105, 101.9758],   # Malaysia center
-        'ID': [-0.7893, 113.9213],  # Indonesia center
-        'PH': [12.8797, 121.7740],  # Philippines center
-        'VN': [14.0583, 108.2772],  # Vietnam center
-        'BD': [23.6850, 90.3563],   # Bangladesh center
-        'LK': [7.8731, 80.7718],    # Sri Lanka center
-        'MM': [21.9162, 95.9560],   # Myanmar center
-        'KH': [12.5657, 104.9910],  # Cambodia center
-        'LA': [19.8563, 102.4955],  # Laos center
-        'BN': [4.5353, 114.7277],   # Brunei center
-        'HK': [22.3193, 114.1694],  # Hong Kong center
-        'MO': [22.1987, 113.5439],  # Macau center
-        'TW': [23.6978, 120.9605],  # Taiwan center
-        'NP': [28.3949, 84.1240],   # Nepal center
-        'AM': [40.0691, 45.0382],   # Armenia center
-        'GE': [42.3154, 43.3569],   # Georgia center
-        'AZ': [40.1431, 47.5769],   # Azerbaijan center
-        'UZ': [41.3775, 64.5853],   # Uzbekistan center
-        'KG': [41.2044, 74.7661],   # Kyrgyzstan center
-        'TJ': [38.8610, 71.2761],   # Tajikistan center
-        'TM': [38.9697, 59.5563],   # Turkmenistan center
-        
-        # Oceania
-        'AU': [-25.2744, 133.7751], # Geographic center of Australia
-        'NZ': [-40.9006, 174.8860], # New Zealand center
-        
-        # South America
-        'BR': [-14.2350, -51.9253], # Geographic center of Brazil
-        'AR': [-38.4161, -63.6167], # Argentina center
-        'CL': [-35.6751, -71.5430], # Chile center
-        'CO': [4.5709, -74.2973],   # Colombia center
-        'PE': [-9.1900, -75.0152],  # Peru center
-        'VE': [6.4238, -66.5897],   # Venezuela center
-        'UY': [-32.5228, -55.7658], # Uruguay center
-        'PY': [-23.4425, -58.4438], # Paraguay center
-        'BO': [-16.2902, -63.5887], # Bolivia center
-        'EC': [-1.8312, -78.1834],  # Ecuador center
-        'GY': [4.8604, -58.9302],   # Guyana center
-        'SR': [3.9193, -56.0278],   # Suriname center
+    Returns:
+        (N, 2) float32 array of lat/lng; rows for unknown or empty codes are NaN
+    """
+    # Integral also matches NumPy integer scalars; empty codes map to '' and stay NaN
+    iso_codes = np.array([
+        '' if not code
+        else (lookup_iso(int(code)) or 'US') if isinstance(code, Integral)
+        else str(code).upper()
+        for code in country_codes
+    ], dtype=str)
+    coords = np.full((len(iso_codes), 2), np.nan, dtype=np.float32)
+    if not len(iso_codes):
+        return coords
+    
+    idx = np.searchsorted(_SORTED_ISO_CODES, iso_codes)
+    idx_clipped = np.minimum(idx, len(_SORTED_ISO_CODES) - 1)
+    found = _SORTED_ISO_CODES[idx_clipped] == iso_codes
+    coords[found] = _SORTED_ISO_COORDS[idx_clipped[found]]
+    return coords
+
+def session_map_html(state_key, fingerprint, build_html):
+    """Return the map HTML kept in session state, rebuilding it only when the fingerprint changes
+    
+    Re-emitting byte-identical HTML lets the frontend keep the existing iframe
+    instead of reloading it (and re-initialising the Maps API) on unrelated reruns.
+    """
+    stored = st.session_state.get(state_key)
+    if stored and stored[0] == fingerprint:
+        return stored[1]
+    
+    map_html = build_html()
+    st.session_state[state_key] = (fingerprint, map_html)
+    return map_html
+
+def display_location_summary(country, region, timezone, country_code, country_coords, accuracy_note):
+    """Render the two-column location facts under a map, one element per column"""
+    col1, col2 = st.columns(2)
+    with col1:
+        st.info(
+            f"🌍 **Country:** {country}  \n"
+            f"📍 **Region:** {region}  \n"
+            f"✅ **Accuracy:** {accuracy_note}"
+        )
+    
+    with col2:
+        st.info(
+            f"🕐 **Time Zone:** {timezone}  \n"
+            f"🏳️ **Country Code:** +{country_code}  \n"
+            f"📐 **Coordinates:** {country_coords[0]:.4f}, {country_coords[1]:.4f}"
+        )
+
+# Styles for the Google Maps embed, whitespace-collapsed once at import
+GMAPS_CSS = " ".join("""
+    #map {
+        height: 500px;
+        width: 100%;
+        border-radius: 8px;
+        box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+    }
+    .info-window {
+        font-family: Arial, sans-serif;
+        max-width: 300px;
+    }
+    .info-title {
+        font-size: 16px;
+        font-weight: bold;
+        color: #1976d2;
+        margin-bottom: 8px;
+    }
+    .info-item {
+        margin: 4px 0;
+        font-size: 14px;
+    }
+    .info-label {
+        font-weight: bold;
+        color: #333;
+    }
+    .error-message {
+        padding: 20px;
+        text-align: center;
+        font-family: Arial, sans-serif;
+        color: #d32f2f;
+        background-color: #ffebee;
+        border-radius: 8px;
+        margin: 20px;
+    }
+""".split())
+
+# Google Maps embed page; popup fields are substituted as JSON string literals
+GMAPS_TEMPLATE = string.Template("""\
+<!DOCTYPE html>
+<html>
+<head>
+    <title>Phone Number Location Analysis</title>
+    <script src="https://maps.googleapis.com/maps/api/js?key=$api_key&libraries=geometry&callback=initMap" async defer></script>
+    <style>$gmaps_css</style>
+</head>
+<body>
+    <div id="map"></div>
+    <div id="error-container" style="display: none;">
+        <div class="error-message">
+            <h3>🚫 Google Maps Loading Error</h3>
+            <p>Please check your API key and ensure:</p>
+            <ul style="text-align: left; display: inline-block;">
+                <li>Maps JavaScript API is enabled</li>
+                <li>API key has proper permissions</li>
+                <li>Billing is set up (if required)</li>
+                <li>No domain restrictions blocking this site</li>
+            </ul>
+        </div>
+    </div>
+    
+    <script>
+        function initMap() {
+            try {
+                // Center coordinates
+                const center = {lat: $lat, lng: $lng};
+                
+                // Create map with enhanced styling
+                const map = new google.maps.Map(document.getElementById('map'), {
+                    zoom: 8,
+                    center: center,
+                    mapTypeId: 'roadmap',
+                    styles: [
+                        {
+                            featureType: 'all',
+                            elementType: 'geometry.fill',
+                            stylers: [{saturation: -80}]
+                        },
+                        {
+                            featureType: 'road',
+                            elementType: 'geometry',
+                            stylers: [{visibility: 'simplified'}]
+                        }
+                    ]
+                });
+                
+                // Create info window content
+                const infoContent = `
+                    <div class="info-window">
+                        <div class="info-title">📱 Phone Number Origin</div>
+                        <div class="info-item"><span class="info-label">Country:</span> $${$country_js}</div>
+                        <div class="info-item"><span class="info-label">Region:</span> $${$region_js}</div>
+                        <div class="info-item"><span class="info-label">Carrier:</span> $${$carrier_js}</div>
+                        <div class="info-item"><span class="info-label">Time Zone:</span> $${$timezone_js}</div>
+                        <div class="info-item"><span class="info-label">Coordinates:</span> $coords_text</div>
+                        <div class="info-item" style="margin-top: 8px; font-style: italic; color: #666;">
+                            📍 Location shows approximate country/region center
+                        </div>
+                    </div>
+                `;
+                
+                // Create marker with custom icon
+                const marker = new google.maps.Marker({
+                    position: center,
+                    map: map,
+                    title: 'Phone Number Location',
+                    icon: {
+                        url: '/app/static/phone_marker.svg',
+                        scaledSize: new google.maps.Size(32, 32),
+                        anchor: new google.maps.Point(16, 32)
+                    }
+                });
+                
+                // Create info window
+                const infoWindow = new google.maps.InfoWindow({
+                    content: infoContent
+                });
+                
+                // Show info window on marker click
+                marker.addListener('click', () => {
+                    infoWindow.open(map, marker);
+                });
+                
+                // Create accuracy circles
+                // Large circle (50km radius)
+                const largeCircle = new google.maps.Circle({
+                    strokeColor: '#1976d2',
+                    strokeOpacity: 0.8,
+                    strokeWeight: 2,
+                    fillColor: '#1976d2',
+                    fillOpacity: 0.1,
+                    map: map,
+                    center: center,
+                    radius: 50000 // 50km
+                });
+                
+                // Small circle (10km radius - high confidence)
+                const smallCircle = new google.maps.Circle({
+                    strokeColor: '#4caf50',
+                    strokeOpacity: 0.8,
+                    strokeWeight: 2,
+                    fillColor: '#4caf50',
+                    fillOpacity: 0.2,
+                    map: map,
+                    center: center,
+                    radius: 10000 // 10km
+                });
+                
+                // Auto-open info window
+                setTimeout(() => {
+                    infoWindow.open(map, marker);
+                }, 1000);
+                
+            } catch (error) {
+                console.error('Google Maps initialization error:', error);
+                showError();
+            }
+        }
         
-        # Africa
-        'EG': [26.0975, 30.0444],   # Egypt center
-        'ZA': [-30.5595, 22.9375],  # South Africa center
-        'NG': [9.0820, 8.6753],     # Nigeria center
-        'KE': [-0.0236, 37.9062],   # Kenya center
-        'ET': [9.1450, 40.4897],    # Ethiopia center
-        'GH': [7.9465, -1.0232],    # Ghana center
-        'MA': [31.7917, -7.0926],   # Morocco center
-        'TN': [33.8869, 9.5375],    # Tunisia center
-        'DZ': [28.0339, 1.6596],    # Algeria center
-        'LY': [26.3351, 17.2283],   # Libya center
+        function showError() {
+            document.getElementById('map').style.display = 'none';
+            document.getElementById('error-container').style.display = 'block';
+        }
         
-        # Middle East
-        'SA': [23.8859, 45.0792],   # Saudi Arabia center
-        'AE': [23.4241, 53.8478],   # UAE center
-        'QA': [25.3548, 51.1839],   # Qatar center
-        'KW': [29.3117, 47.4818],   # Kuwait center
-        'BH': [25.9304, 50.6378],   # Bahrain center
-        'OM': [21.4735, 55.9754],   # Oman center
-        'YE': [15.5527, 48.5164],   # Yemen center
-        'JO': [30.5852, 36.2384],   # Jordan center
-        'LB': [33.8547, 35.8623],   # Lebanon center
-        'SY': [34.8021, 38.9968],   # Syria center
-        'IQ': [33.2232, 43.6793],   # Iraq center
-        'IR': [32.4279, 53.6880],   # Iran center
-        'IL': [31.0461, 34.8516],   # Israel center
-        'PS': [31.9522, 35.2332],   # Palestine center
+        // Handle API loading errors
+        window.gm_authFailure = function() {
+            console.error('Google Maps API authentication failed');
+            showError();
+        };
         
-        # Russia and former Soviet states
-        'RU': [61.5240, 105.3188],  # Geographic center of Russia
-    }
-    
-    return coords_map.get(country_code)
+        // Fallback error handling
+        window.addEventListener('error', function(e) {
+            if (e.message && e.message.includes('Google')) {
+                showError();
+            }
+        });
+    </script>
+</body>
+</html>
+""")
+
+@st.cache_data(show_spinner=False, max_entries=MAP_CACHE_ENTRIES)
+def build_gmaps_html(_api_key, api_key_hash, country, region, carrier, timezone, lat, lng):
+    """Build the Google Maps embed HTML; api_key_hash stands in for the unhashed key"""
+    def js_text(value):
+        # HTML-escaped for the info window, then JSON-encoded into a JS expression
+        return json.dumps(html.escape(str(value)))
+    
+    return GMAPS_TEMPLATE.substitute(
+        gmaps_css=GMAPS_CSS,
+        api_key=quote(_api_key, safe=''),
+        lat=float(lat),
+        lng=float(lng),
+        coords_text=f"{lat:.4f}, {lng:.4f}",
+        country_js=js_text(country),
+        region_js=js_text(region),
+        carrier_js=js_text(carrier),
+        timezone_js=js_text(timezone)
+    )
 
 def display_enhanced_map_with_google(results):
     """Enhanced map display using Google Maps with better accuracy"""
@@ -785,208 +1373,31 @@ def display_enhanced_map_with_google(results):
         """)
         return
     
-    if results.get('country_code'):
-        country_coords = get_country_coordinates(results.get('country_code'))
+    country_code = results.get('country_code')
+    if country_code:
+        country_coords = get_country_coordinates(country_code)
         
         if country_coords:
+            country = results.get('country', 'Unknown')
+            region = results.get('region', 'Unknown')
+            carrier = results.get('carrier', 'Unknown')
+            timezone = results.get('timezone', 'Unknown')
             
             # Create Google Maps HTML with enhanced features
-            google_maps_html = f"""
-            <!DOCTYPE html>
-            <html>
-            <head>
-                <title>Phone Number Location Analysis</title>
-                <script src="https://maps.googleapis.com/maps/api/js?key={google_maps_api_key}&libraries=geometry&callback=initMap" async defer></script>
-                <style>
-                    #map {{
-                        height: 500px;
-                        width: 100%;
-                        border-radius: 8px;
-                        box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-                    }}
-                    .info-window {{
-                        font-family: Arial, sans-serif;
-                        max-width: 300px;
-                    }}
-                    .info-title {{
-                        font-size: 16px;
-                        font-weight: bold;
-                        color: #1976d2;
-                        margin-bottom: 8px;
-                    }}
-                    .info-item {{
-                        margin: 4px 0;
-                        font-size: 14px;
-                    }}
-                    .info-label {{
-                        font-weight: bold;
-                        color: #333;
-                    }}
-                    .error-message {{
-                        padding: 20px;
-                        text-align: center;
-                        font-family: Arial, sans-serif;
-                        color: #d32f2f;
-                        background-color: #ffebee;
-                        border-radius: 8px;
-                        margin: 20px;
-                    }}
-                </style>
-            </head>
-            <body>
-                <div id="map"></div>
-                <div id="error-container" style="display: none;">
-                    <div class="error-message">
-                        <h3>🚫 Google Maps Loading Error</h3>
-                        <p>Please check your API key and ensure:</p>
-                        <ul style="text-align: left; display: inline-block;">
-                            <li>Maps JavaScript API is enabled</li>
-                            <li>API key has proper permissions</li>
-                            <li>Billing is set up (if required)</li>
-                            <li>No domain restrictions blocking this site</li>
-                        </ul>
-                    </div>
-                </div>
-                
-                <script>
-                    function initMap() {{
-                        try {{
-                            // Center coordinates
-                            const center = {{lat: {country_coords[0]}, lng: {country_coords[1]}}};
-                            
-                            // Create map with enhanced styling
-                            const map = new google.maps.Map(document.getElementById('map'), {{
-                                zoom: 8,
-                                center: center,
-                                mapTypeId: 'roadmap',
-                                styles: [
-                                    {{
-                                        featureType: 'all',
-                                        elementType: 'geometry.fill',
-                                        stylers: [{{saturation: -80}}]
-                                    }},
-                                    {{
-                                        featureType: 'road',
-                                        elementType: 'geometry',
-                                        stylers: [{{visibility: 'simplified'}}]
-                                    }}
-                                ]
-                            }});
-                            
-                            // Create info window content
-                            const infoContent = `
-                                <div class="info-window">
-                                    <div class="info-title">📱 Phone Number Origin</div>
-                                    <div class="info-item"><span class="info-label">Country:</span> {results.get('country', 'Unknown')}</div>
-                                    <div class="info-item"><span class="info-label">Region:</span> {results.get('region', 'Unknown')}</div>
-                                    <div class="info-item"><span class="info-label">Carrier:</span> {results.get('carrier', 'Unknown')}</div>
-                                    <div class="info-item"><span class="info-label">Time Zone:</span> {results.get('timezone', 'Unknown')}</div>
-                                    <div class="info-item"><span class="info-label">Coordinates:</span> {country_coords[0]:.4f}, {country_coords[1]:.4f}</div>
-                                    <div class="info-item" style="margin-top: 8px; font-style: italic; color: #666;">
-                                        📍 Location shows approximate country/region center
-                                    </div>
-                                </div>
-                            `;
-                            
-                            // Create marker with custom icon
-                            const marker = new google.maps.Marker({{
-                                position: center,
-                                map: map,
-                                title: 'Phone Number Location',
-                                icon: {{
-                                    url: 'data:image/svg+xml;charset=UTF-8,' + encodeURIComponent(`
-                                        <svg xmlns="http://www.w3.org/2000/svg" width="32" height="32" viewBox="0 0 24 24" fill="#1976d2">
-                                            <path d="M6.62 10.79c1.44 2.83 3.76 5.14 6.59 6.59l2.2-2.2c.27-.27.67-.36 1.02-.24 1.12.37 2.33.57 3.57.57.55 0 1 .45 1 1V20c0 .55-.45 1-1 1-9.39 0-17-7.61-17-17 0-.55.45-1 1-1h3.5c.55 0 1 .45 1 1 0 1.25.2 2.45.57 3.57.11.35.03.74-.25 1.02l-2.2 2.2z"/>
-                                        </svg>
-                                    `),
-                                    scaledSize: new google.maps.Size(32, 32),
-                                    anchor: new google.maps.Point(16, 32)
-                                }}
-                            }});
-                            
-                            // Create info window
-                            const infoWindow = new google.maps.InfoWindow({{
-                                content: infoContent
-                            }});
-                            
-                            // Show info window on marker click
-                            marker.addListener('click', () => {{
-                                infoWindow.open(map, marker);
-                            }});
-                            
-                            // Create accuracy circles
-                            // Large circle (50km radius)
-                            const largeCircle = new google.maps.Circle({{
-                                strokeColor: '#1976d2',
-                                strokeOpacity: 0.8,
-                                strokeWeight: 2,
-                                fillColor: '#1976d2',
-                                fillOpacity: 0.1,
-                                map: map,
-                                center: center,
-                                radius: 50000 // 50km
-                            }});
-                            
-                            // Small circle (10km radius - high confidence)
-                            const smallCircle = new google.maps.Circle({{
-                                strokeColor: '#4caf50',
-                                strokeOpacity: 0.8,
-                                strokeWeight: 2,
-                                fillColor: '#4caf50',
-                                fillOpacity: 0.2,
-                                map: map,
-                                center: center,
-                                radius: 10000 // 10km
-                            }});
-                            
-                            // Auto-open info window
-                            setTimeout(() => {{
-                                infoWindow.open(map, marker);
-                            }}, 1000);
-                            
-                        }} catch (error) {{
-                            console.error('Google Maps initialization error:', error);
-                            showError();
-                        }}
-                    }}
-                    
-                    function showError() {{
-                        document.getElementById('map').style.display = 'none';
-                        document.getElementById('error-container').style.display = 'block';
-                    }}
-                    
-                    // Handle API loading errors
-                    window.gm_authFailure = function() {{
-                        console.error('Google Maps API authentication failed');
-                        showError();
-                    }};
-                    
-                    // Fallback error handling
-                    window.addEventListener('error', function(e) {{
-                        if (e.message && e.message.includes('Google')) {{
-                            showError();
-                        }}
-                    }});
-                </script>
-            </body>
-            </html>
-            """
+            api_key_hash = hashlib.blake2b(google_maps_api_key.encode(), digest_size=8).hexdigest()
+            map_args = (api_key_hash, country, region, carrier, timezone, country_coords[0], country_coords[1])
+            google_maps_html = session_map_html(
+                '_gmaps_map',
+                map_args,
+                lambda: build_gmaps_html(google_maps_api_key, *map_args)
+            )
             
             # Display the Google Maps
             st.components.v1.html(google_maps_html, height=520)
             
             # Additional geographic info with accuracy notes
-            col1, col2 = st.columns(2)
-            with col1:
-                st.info(f"🌍 **Country:** {results.get('country', 'Unknown')}")
-                st.info(f"📍 **Region:** {results.get('region', 'Unknown')}")
-                st.success("✅ **Accuracy:** Enhanced Google Maps positioning")
+            display_location_summary(country, region, timezone, country_code, country_coords, "Enhanced Google Maps positioning")
             
-            with col2:
-                st.info(f"🕐 **Time Zone:** {results.get('timezone', 'Unknown')}")
-                st.info(f"🏳️ **Country Code:** +{results.get('country_code', 'Unknown')}")
-                st.info(f"📐 **Coordinates:** {country_coords[0]:.4f}, {country_coords[1]:.4f}")
-                
             # Enhanced accuracy information
             st.success("🎯 **Google Maps Integration:** Enhanced location accuracy with satellite imagery and street-level detail")
             st.info("📊 **Accuracy Indicators:** Blue circle (±50km general area), Green circle (±10km high confidence)")
@@ -996,77 +1407,94 @@ def display_enhanced_map_with_google(results):
     else:
         st.warning("⚠️ **No country code available** for geographic analysis.")
 
+# Folium marker popup; fields are HTML-escaped before substitution
+FOLIUM_POPUP_TEMPLATE = string.Template("""
+<div style="font-family: Arial, sans-serif; min-width: 200px;">
+    <h4 style="color: #1976d2; margin-bottom: 10px;">📱 Phone Number Origin</h4>
+    <p><strong>Country:</strong> $country</p>
+    <p><strong>Region:</strong> $region</p>
+    <p><strong>Carrier:</strong> $carrier</p>
+    <p><strong>Time Zone:</strong> $timezone</p>
+    <p><strong>Coordinates:</strong> $coords_text</p>
+    <p style="font-style: italic; color: #666; margin-top: 10px;">
+        📍 Location shows approximate country/region center
+    </p>
+</div>
+""")
+
+@st.cache_data(show_spinner=False, max_entries=MAP_CACHE_ENTRIES)
+def build_map_html(country, region, carrier, timezone, lat, lng):
+    """Render the folium location map to HTML, cached per location and popup details"""
+    import folium
+    
+    coords = [lat, lng]
+    
+    # Create enhanced folium map with better styling
+    m = folium.Map(
+        location=coords,
+        zoom_start=6,
+        tiles='OpenStreetMap'
+    )
+    
+    # Add marker with enhanced popup
+    popup_content = FOLIUM_POPUP_TEMPLATE.substitute(
+        country=html.escape(str(country)),
+        region=html.escape(str(region)),
+        carrier=html.escape(str(carrier)),
+        timezone=html.escape(str(timezone)),
+        coords_text=f"{lat:.4f}, {lng:.4f}"
+    )
+    
+    folium.Marker(
+        coords,
+        popup=folium.Popup(popup_content, max_width=300),
+        tooltip="Click for details",
+        icon=folium.Icon(color='blue', icon='phone', prefix='fa')
+    ).add_to(m)
+    
+    # Add accuracy circles
+    folium.Circle(
+        coords,
+        radius=50000,  # 50km
+        popup="General Area (±50km)",
+        color='blue',
+        fillColor='blue',
+        fillOpacity=0.1
+    ).add_to(m)
+    
+    folium.Circle(
+        coords,
+        radius=10000,  # 10km
+        popup="High Confidence Area (±10km)",
+        color='green',
+        fillColor='green',
+        fillOpacity=0.2
+    ).add_to(m)
+    
+    return m.get_root().render()
+
 def display_enhanced_map(results):
     """Enhanced map display with better visualization and improved accuracy"""
     st.markdown("### 🗺️ Geographic Analysis")
     
-    if results.get('country_code'):
-        country_coords = get_country_coordinates(results.get('country_code'))
+    country_code = results.get('country_code')
+    if country_code:
+        country_coords = get_country_coordinates(country_code)
         
         if country_coords:
-            # Create enhanced folium map with better styling
-            m = folium.Map(
-                location=country_coords,
-                zoom_start=6,
-                tiles='OpenStreetMap'
-            )
-            
-            # Add marker with enhanced popup
-            popup_content = f"""
-            <div style="font-family: Arial, sans-serif; min-width: 200px;">
-                <h4 style="color: #1976d2; margin-bottom: 10px;">📱 Phone Number Origin</h4>
-                <p><strong>Country:</strong> {results.get('country', 'Unknown')}</p>
-                <p><strong>Region:</strong> {results.get('region', 'Unknown')}</p>
-                <p><strong>Carrier:</strong> {results.get('carrier', 'Unknown')}</p>
-                <p><strong>Time Zone:</strong> {results.get('timezone', 'Unknown')}</p>
-                <p><strong>Coordinates:</strong> {country_coords[0]:.4f}, {country_coords[1]:.4f}</p>
-                <p style="font-style: italic; color: #666; margin-top: 10px;">
-                    📍 Location shows approximate country/region center
-                </p>
-            </div>
-            """
-            
-            folium.Marker(
-                country_coords,
-                popup=folium.Popup(popup_content, max_width=300),
-                tooltip="Click for details",
-                icon=folium.Icon(color='blue', icon='phone', prefix='fa')
-            ).add_to(m)
-            
-            # Add accuracy circles
-            folium.Circle(
-                country_coords,
-                radius=50000,  # 50km
-                popup="General Area (±50km)",
-                color='blue',
-                fillColor='blue',
-                fillOpacity=0.1
-            ).add_to(m)
-            
-            folium.Circle(
-                country_coords,
-                radius=10000,  # 10km
-                popup="High Confidence Area (±10km)",
-                color='green',
-                fillColor='green',
-                fillOpacity=0.2
-            ).add_to(m)
+            country = results.get('country', 'Unknown')
+            region = results.get('region', 'Unknown')
+            carrier = results.get('carrier', 'Unknown')
+            timezone = results.get('timezone', 'Unknown')
             
             # Display the map
-            st_folium(m, width=700, height=500)
+            map_args = (country, region, carrier, timezone, country_coords[0], country_coords[1])
+            map_html = session_map_html('_folium_map', map_args, lambda: build_map_html(*map_args))
+            st.components.v1.html(map_html, width=700, height=500)
             
             # Additional geographic info
-            col1, col2 = st.columns(2)
-            with col1:
-                st.info(f"🌍 **Country:** {results.get('country', 'Unknown')}")
-                st.info(f"📍 **Region:** {results.get('region', 'Unknown')}")
-                st.success("✅ **Accuracy:** Enhanced positioning with OpenStreetMap")
+            display_location_summary(country, region, timezone, country_code, country_coords, "Enhanced positioning with OpenStreetMap")
             
-            with col2:
-                st.info(f"🕐 **Time Zone:** {results.get('timezone', 'Unknown')}")
-                st.info(f"🏳️ **Country Code:** +{results.get('country_code', 'Unknown')}")
-                st.info(f"📐 **Coordinates:** {country_coords[0]:.4f}, {country_coords[1]:.4f}")
-                
             # Enhanced accuracy information
             st.success("🎯 **Enhanced Mapping:** Improved location accuracy with detailed geographic visualization")
             st.info("📊 **Accuracy Indicators:** Blue circle (±50km general area), Green circle (±10km high confidence)")
@@ -1076,6 +1504,82 @@ def display_enhanced_map(results):
     else:
         st.warning("⚠️ **No country code available** for geographic analysis.")
 
+# Alert element per whole-percent confidence: <40 error, 40-69 warning, >=70 success
+CONFIDENCE_TIERS = ('error',) * 40 + ('warning',) * 30 + ('success',) * 31
+
+def confidence_widget(confidence):
+    """Render a confidence percentage in the alert style for its tier"""
+    tier = CONFIDENCE_TIERS[min(max(int(confidence), 0), 100)]
+    getattr(st, tier)(f"{confidence}%")
+
+# Table cell backgrounds matching the confidence alert tiers
+CONFIDENCE_TIER_STYLES = MappingProxyType({
+    'error': 'background-color: #ffcdd2',
+    'warning': 'background-color: #ffe0b2',
+    'success': 'background-color: #c8e6c9'
+})
+
+def confidence_style(confidence):
+    """Return the table cell style for a confidence percentage"""
+    return CONFIDENCE_TIER_STYLES[CONFIDENCE_TIERS[min(max(int(confidence), 0), 100)]]
+
+# OSINT sections that make up the digital footprint view
+OSINT_FOOTPRINT_KEYS = ('digital_footprint', 'associated_emails', 'websites', 'social_accounts')
+
+# Website categories reported under osint_data['websites']
+WEBSITE_KEYS = ('business_websites', 'personal_websites', 'professional_profiles', 'e_commerce_profiles')
+
+# (label, security_analysis field, default, icon when set, icon when clear)
+SECURITY_INDICATOR_SPECS = (
+    ("Spam Risk", 'is_spam_risk', False, "🚨", "⚠️"),
+    ("VoIP Number", 'is_voip', False, "📞", "ℹ️"),
+    ("Known Scammer", 'is_scammer', False, "🚫", "⚠️"),
+    ("Verified Carrier", 'verified_carrier', True, "✅", "ℹ️")
+)
+
+# Icons for social platforms reported by the OSINT lookup (read-only)
+PLATFORM_ICONS = MappingProxyType({
+    'facebook': '📘',
+    'twitter': '🐦',
+    'instagram': '📷',
+    'linkedin': '💼',
+    'tiktok': '🎵',
+    'snapchat': '👻',
+    'telegram': '✈️',
+    'whatsapp': '💬',
+    'youtube': '📺',
+    'pinterest': '📌',
+    'reddit': '🤖',
+    'discord': '🎮'
+})
+
+# Ready-made expander titles for known platforms
+PLATFORM_HEADERS = MappingProxyType({
+    platform: f"{icon} {platform.title()}" for platform, icon in PLATFORM_ICONS.items()
+})
+
+@st.cache_data(show_spinner=False)
+def build_reputation_gauge(security_score):
+    """Build the reputation score gauge, cached per score across reruns"""
+    import plotly.graph_objects as go
+    
+    fig = go.Figure(go.Indicator(
+        mode = "gauge+number",
+        value = security_score,
+        title = {'text': "Reputation Score"},
+        gauge = {
+            'axis': {'range': [None, 100]},
+            'bar': {'color': "#3b82f6"},
+            'steps': [
+                {'range': [0, 30], 'color': "#fecaca"},
+                {'range': [30, 70], 'color': "#fed7aa"},
+                {'range': [70, 100], 'color': "#bbf7d0"}
+            ]
+        }
+    ))
+    fig.update_layout(height=250)
+    return fig
+
 def display_enhanced_security(results):
     """Enhanced security analysis display"""
     st.markdown("### 🔒 Security Analysis")
@@ -1091,35 +1595,14 @@ def display_enhanced_security(results):
         # Security indicators
         st.markdown("**Security Indicators:**")
         
-        indicators = [
-            ("Spam Risk", security_data.get('is_spam_risk', False), "🚨", "⚠️"),
-            ("VoIP Number", security_data.get('is_voip', False), "📞", "ℹ️"),
-            ("Known Scammer", security_data.get('is_scammer', False), "🚫", "⚠️"),
-            ("Verified Carrier", security_data.get('verified_carrier', True), "✅", "ℹ️")
-        ]
-        
-        for label, status, icon_true, icon_false in indicators:
+        for label, field, default, icon_true, icon_false in SECURITY_INDICATOR_SPECS:
+            status = security_data.get(field, default)
             icon = icon_true if status else icon_false
-            color = "red" if status and label in ["Spam Risk", "Known Scammer"] else "green" if status and label == "Verified Carrier" else "orange"
             st.markdown(f"{icon} **{label}:** {'Yes' if status else 'No'}")
     
     with col2:
         # Reputation gauge
-        fig = go.Figure(go.Indicator(
-            mode = "gauge+number",
-            value = security_score,
-            title = {'text': "Reputation Score"},
-            gauge = {
-                'axis': {'range': [None, 100]},
-                'bar': {'color': "#3b82f6"},
-                'steps': [
-                    {'range': [0, 30], 'color': "#fecaca"},
-                    {'range': [30, 70], 'color': "#fed7aa"},
-                    {'range': [70, 100], 'color': "#bbf7d0"}
-                ]
-            }
-        ))
-        fig.update_layout(height=250)
+        fig = build_reputation_gauge(int(round(security_score)))
         st.plotly_chart(fig, use_container_width=True)
 
 def display_enhanced_osint(results):
@@ -1127,9 +1610,12 @@ def display_enhanced_osint(results):
     st.markdown("### 🌐 OSINT Intelligence")
     
     osint_data = results.get('osint_data', {})
+    if not osint_data:
+        st.info("No OSINT data available")
+        return
     
     # Digital Footprint Section
-    if osint_data.get('digital_footprint') or osint_data.get('associated_emails') or osint_data.get('websites') or osint_data.get('social_accounts'):
+    if any(osint_data.get(key) for key in OSINT_FOOTPRINT_KEYS):
         st.markdown("#### 🔍 Digital Footprint Analysis")
         
         # Associated Emails
@@ -1139,47 +1625,29 @@ def display_enhanced_osint(results):
                 st.markdown("##### 📧 Associated Email Addresses")
                 
                 with st.container():
-                    st.markdown("""
-                    <div style="background: linear-gradient(90deg, #3b82f6 0%, #1d4ed8 100%); 
-                               padding: 1rem; border-radius: 8px; color: white; margin: 1rem 0;">
-                        <h4>📧 Email Addresses Found</h4>
-                    </div>
-                    """, unsafe_allow_html=True)
+                    st.markdown(EMAIL_BANNER_HTML, unsafe_allow_html=True)
                     
-                    for email in email_data['found_emails']:
-                        col1, col2, col3 = st.columns([3, 1, 2])
-                        
-                        with col1:
-                            st.code(email)
-                        
-                        with col2:
-                            confidence = email_data.get('confidence_scores', {}).get(email, 0)
-                            if confidence >= 70:
-                                st.success(f"{confidence}%")
-                            elif confidence >= 40:
-                                st.warning(f"{confidence}%")
-                            else:
-                                st.error(f"{confidence}%")
-                        
-                        with col3:
-                            sources = email_data.get('sources', {}).get(email, [])
-                            if sources:
-                                st.write(f"Sources: {', '.join(sources[:2])}")
-                            
-                            verification = email_data.get('verification_status', {}).get(email, 'Unknown')
-                            st.caption(f"Status: {verification}")
+                    # One virtualised table instead of a column set per email; the
+                    # per-email lists are index-aligned with found_emails
+                    email_df = pd.DataFrame({
+                        'Email': email_data['found_emails'],
+                        'Confidence': email_data['confidence_scores'],
+                        'Sources': [', '.join(islice(sources, 2)) for sources in email_data['sources']],
+                        'Status': email_data['verification_status']
+                    })
+                    st.dataframe(
+                        email_df.style.map(confidence_style, subset=['Confidence']),
+                        hide_index=True,
+                        use_container_width=True,
+                        column_config={'Confidence': st.column_config.NumberColumn(format="%d%%")}
+                    )
             else:
                 st.info("📧 No associated email addresses found")
         
         # Associated Websites
         if osint_data.get('websites'):
             website_data = osint_data['websites']
-            has_websites = any([
-                website_data.get('business_websites'),
-                website_data.get('personal_websites'),
-                website_data.get('professional_profiles'),
-                website_data.get('e_commerce_profiles')
-            ])
+            has_websites = any(website_data.get(key) for key in WEBSITE_KEYS)
             
             if has_websites:
                 st.markdown("##### 🌐 Associated Websites & Profiles")
@@ -1195,12 +1663,7 @@ def display_enhanced_osint(results):
                                 st.markdown(f"🔗 [{website}]({website})")
                             
                             with col2:
-                                if confidence >= 70:
-                                    st.success(f"{confidence}%")
-                                elif confidence >= 40:
-                                    st.warning(f"{confidence}%")
-                                else:
-                                    st.error(f"{confidence}%")
+                                confidence_widget(confidence)
                 
                 # Professional profiles
                 if website_data.get('professional_profiles'):
@@ -1229,22 +1692,6 @@ def display_enhanced_osint(results):
             if social_data:
                 st.markdown("##### 📱 Social Media Accounts")
                 
-                # Create platform icons mapping
-                platform_icons = {
-                    'facebook': '📘',
-                    'twitter': '🐦',
-                    'instagram': '📷',
-                    'linkedin': '💼',
-                    'tiktok': '🎵',
-                    'snapchat': '👻',
-                    'telegram': '✈️',
-                    'whatsapp': '💬',
-                    'youtube': '📺',
-                    'pinterest': '📌',
-                    'reddit': '🤖',
-                    'discord': '🎮'
-                }
-                
                 # Display found social accounts
                 found_accounts = []
                 for platform, data in social_data.items():
@@ -1252,24 +1699,19 @@ def display_enhanced_osint(results):
                         found_accounts.append((platform, data))
                 
                 if found_accounts:
-                    st.markdown("""
-                    <div style="background: linear-gradient(90deg, #8b5cf6 0%, #7c3aed 100%); 
-                               padding: 1rem; border-radius: 8px; color: white; margin: 1rem 0;">
-                        <h4>📱 Social Media Profiles Found</h4>
-                    </div>
-                    """, unsafe_allow_html=True)
+                    st.markdown(SOCIAL_BANNER_HTML, unsafe_allow_html=True)
                     
                     for platform, data in found_accounts:
-                        icon = platform_icons.get(platform, '📱')
+                        header = PLATFORM_HEADERS.get(platform) or f"📱 {platform.title()}"
                         confidence = data.get('confidence', 0)
                         
-                        with st.expander(f"{icon} {platform.title()}", expanded=True):
+                        with st.expander(header, expanded=True):
                             col1, col2 = st.columns([2, 1])
                             
                             with col1:
                                 profiles = data.get('profiles', [])
-                                for profile in profiles[:3]:  # Show max 3 profiles
-                                    st.markdown(f"🔗 [{profile}]({profile})")
+                                # Show max 3 profiles
+                                st.markdown("  \n".join(f"🔗 [{profile}]({profile})" for profile in islice(profiles, 3)))
                                 
                                 if len(profiles) > 3:
                                     st.info(f"... and {len(profiles) - 3} more profiles")
@@ -1294,35 +1736,29 @@ def display_enhanced_osint(results):
                     # Search engine results
                     search_results = footprint.get('search_engines', {})
                     if search_results:
-                        st.write("**Search Engine Results:**")
-                        for engine, count in search_results.items():
-                            if count > 0:
-                                st.write(f"• {engine.title()}: {count} results")
+                        st.markdown("  \n".join(
+                            ["**Search Engine Results:**"] +
+                            [f"• {engine.title()}: {count} results" for engine, count in search_results.items() if count > 0]
+                        ))
                     
                     # Public records
                     public_records = footprint.get('public_records', {})
                     if public_records.get('found'):
-                        st.write("**Public Records:** Found")
                         records = public_records.get('records', [])
-                        for record in records[:3]:
-                            st.write(f"• {record}")
+                        st.markdown("**Public Records:** Found  \n" + "  \n".join(f"• {record}" for record in islice(records, 3)))
                 
                 with col2:
                     # Business listings
                     business_listings = footprint.get('business_listings', {})
                     if business_listings.get('found'):
-                        st.write("**Business Listings:** Found")
                         listings = business_listings.get('listings', [])
-                        for listing in listings[:3]:
-                            st.write(f"• {listing}")
+                        st.markdown("**Business Listings:** Found  \n" + "  \n".join(f"• {listing}" for listing in islice(listings, 3)))
                     
                     # Data brokers
                     data_brokers = footprint.get('data_brokers', {})
                     if data_brokers.get('found'):
-                        st.write("**Data Broker Sites:** Found")
                         brokers = data_brokers.get('brokers', [])
-                        for broker in brokers[:3]:
-                            st.write(f"• {broker}")
+                        st.markdown("**Data Broker Sites:** Found  \n" + "  \n".join(f"• {broker}" for broker in islice(brokers, 3)))
         
         st.markdown("---")
     
@@ -1348,8 +1784,7 @@ def display_technical_details(results):
             "International Format": results.get('international_format', 'N/A')
         }
         
-        for key, value in technical_data.items():
-            st.write(f"• **{key}:** `{value}`")
+        st.markdown("  \n".join(f"• **{key}:** `{value}`" for key, value in technical_data.items()))
     
     with col2:
         st.markdown("**Validation Results:**")
@@ -1361,132 +1796,212 @@ def display_technical_details(results):
             "National Number": results.get('national_number', 'N/A')
         }
         
-        for key, value in validation_data.items():
-            st.write(f"• **{key}:** {value}")
+        st.markdown("  \n".join(f"• **{key}:** {value}" for key, value in validation_data.items()))
     
     # Analysis metadata
     st.markdown("---")
     st.markdown("**Analysis Metadata:**")
     
-    metadata_cols = st.columns(3)
-    with metadata_cols[0]:
-        st.metric("Analysis Time", f"{results.get('analysis_time', 0):.2f}s")
-    with metadata_cols[1]:
-        st.metric("API Calls Made", results.get('api_calls_count', 0))
-    with metadata_cols[2]:
-        st.metric("Data Sources", results.get('data_sources_count', 1))
+    metadata_cards = "".join(
+        METRIC_CARD_HTML.format(icon=icon, label=label, value=value)
+        for icon, label, value in (
+            ("⏱️", "Analysis Time", f"{results.get('analysis_time', 0):.2f}s"),
+            ("🔌", "API Calls Made", results.get('api_calls_count', 0)),
+            ("🗂️", "Data Sources", results.get('data_sources_count', 1))
+        )
+    )
+    st.markdown(f'<div class="metric-strip">{metadata_cards}</div>', unsafe_allow_html=True)
     
     # Raw data section
     with st.expander("🔍 Raw Analysis Data", expanded=False):
         st.json(results)
 
 def save_api_config(numverify_key, twilio_sid, twilio_token, hibp_key):
-    """Save API configuration"""
-    if numverify_key:
-        Config.NUMVERIFY_API_KEY = numverify_key
-    if twilio_sid and twilio_token:
-        Config.TWILIO_ACCOUNT_SID = twilio_sid
-        Config.TWILIO_AUTH_TOKEN = twilio_token
-    if hibp_key:
-        Config.HIBP_API_KEY = hibp_key
+    """Save API configuration for this session without touching the shared Config"""
+    current = get_api_keys()
+    st.session_state.api_keys = ApiKeys(
+        numverify_api_key=numverify_key or current.numverify_api_key,
+        twilio_account_sid=twilio_sid if twilio_sid and twilio_token else current.twilio_account_sid,
+        twilio_auth_token=twilio_token if twilio_sid and twilio_token else current.twilio_auth_token,
+        hibp_api_key=hibp_key or current.hibp_api_key
+    )
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def analysis_to_json(results):
+    """Encode a single analysis as JSON bytes for download"""
+    return dumps_json(results)
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def analysis_to_csv(results):
+    """Flatten a single analysis into one CSV row for download"""
+    return record_to_csv(results)
 
 def export_enhanced_results(results):
     """Enhanced export functionality"""
     st.markdown("### 📤 Export Results")
     
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    
     col1, col2, col3 = st.columns(3)
     
     with col1:
         # JSON export
-        json_data = json.dumps(results, indent=2, default=str)
-        st.download_button(
+        json_data = analysis_to_json(results)
+        wide_download_button(
             label="📄 JSON Report",
             data=json_data,
-            file_name=f"phone_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
-            mime="application/json",
-            use_container_width=True
+            file_name=f"phone_analysis_{timestamp}.json",
+            mime="application/json"
         )
     
     with col2:
         # CSV export
-        df = pd.json_normalize(results)
-        csv_data = df.to_csv(index=False)
-        st.download_button(
+        csv_data = analysis_to_csv(results)
+        wide_download_button(
             label="📊 CSV Data",
             data=csv_data,
-            file_name=f"phone_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-            mime="text/csv",
-            use_container_width=True
+            file_name=f"phone_analysis_{timestamp}.csv",
+            mime="text/csv"
         )
     
     with col3:
-        pdf_data = generate_pdf_report(results)
-        st.download_button(
-            label="📋 PDF Report",
-            data=pdf_data,
-            file_name=f"phone_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf",
-            mime="application/pdf",
-            use_container_width=True
-        )
+        # The PDF is the costly export, so it is only built once requested
+        if st.checkbox("Prepare PDF report", key="prepare_pdf"):
+            pdf_data = generate_pdf_report(results)
+            wide_download_button(
+                label="📋 PDF Report",
+                data=pdf_data,
+                file_name=f"phone_analysis_{timestamp}.pdf",
+                mime="application/pdf"
+            )
+
+def _yes_no(value):
+    """Render a truthy flag as Yes/No for report tables"""
+    return 'Yes' if value else 'No'
 
+# PDF table rows as (label, results key, default, cell format); the format
+# receives the looked-up value, and None means the value is used as-is
+PDF_SUMMARY_ROWS = (
+    ('Phone Number', 'formatted_number', 'N/A', None),
+    ('Country', 'country', 'Unknown', None),
+    ('Region', 'region', 'Unknown', None),
+    ('Carrier', 'carrier', 'Unknown', None),
+    ('Line Type', 'line_type', 'Unknown', None),
+    ('Risk Score', 'risk_score', 0, "{}/100".format),
+    ('Is Valid', 'is_valid', None, _yes_no),
+    ('Time Zone', 'timezone', 'Unknown', None)
+)
+
+PDF_SECURITY_ROWS = (
+    ('Spam Risk', 'is_spam_risk', None, _yes_no),
+    ('VoIP Number', 'is_voip', None, _yes_no),
+    ('Known Scammer', 'is_scammer', None, _yes_no),
+    ('Verified Carrier', 'verified_carrier', None, _yes_no),
+    ('Reputation Score', 'reputation_score', 50, "{}/100".format)
+)
+
+PDF_TECH_ROWS = (
+    ('E164 Format', 'e164_format', 'N/A', None),
+    ('National Format', 'national_format', 'N/A', None),
+    ('International Format', 'international_format', 'N/A', None),
+    ('Country Code', 'country_code', 'N/A', "+{}".format),
+    ('National Number', 'national_number', 'N/A', str),
+    ('Number Type', 'number_type', 'Unknown', None),
+    ('Is Possible', 'is_possible', None, _yes_no)
+)
+
+def pdf_table_rows(row_specs, data):
+    """Build [label, value] table rows from a row spec tuple"""
+    get = data.get
+    return [
+        [label, get(key, default) if cell_format is None else cell_format(get(key, default))]
+        for label, key, default, cell_format in row_specs
+    ]
+
+# Per-thread BytesIO reused across PDF builds
+_pdf_buffers = threading.local()
+
+@st.cache_resource
+def get_pdf_styles():
+    """Build the ReportLab paragraph and table styles once per process"""
+    from reportlab.platypus import TableStyle
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib import colors
+    
+    styles = getSampleStyleSheet()
+    
+    def table_style(header_color):
+        return TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(header_color)),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), 12),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+            ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+            ('GRID', (0, 0), (-1, -1), 1, colors.black)
+        ])
+    
+    return {
+        'normal': styles['Normal'],
+        'italic': styles['Italic'],
+        'title': ParagraphStyle(
+            'CustomTitle',
+            parent=styles['Heading1'],
+            fontSize=24,
+            spaceAfter=30,
+            textColor=colors.HexColor('#1e3a8a'),
+            alignment=1  # Center alignment
+        ),
+        'heading': ParagraphStyle(
+            'CustomHeading',
+            parent=styles['Heading2'],
+            fontSize=16,
+            spaceAfter=12,
+            textColor=colors.HexColor('#3b82f6')
+        ),
+        # TableStyle instances are read-only once built and safe to share
+        'summary_table': table_style('#e2e8f0'),
+        'security_table': table_style('#fef2f2'),
+        'tech_table': table_style('#f0f9ff')
+    }
+
+@st.cache_data(show_spinner=False, max_entries=32)
 def generate_pdf_report(results):
-    """Generate PDF report from analysis results"""
-    buffer = BytesIO()
+    """Generate PDF report from analysis results, cached per results payload"""
+    from reportlab.lib.pagesizes import A4
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table
+    from reportlab.lib.units import inch
+    
+    # Reuse this thread's output buffer; getvalue() below returns an independent copy
+    buffer = getattr(_pdf_buffers, 'buffer', None)
+    if buffer is None:
+        buffer = _pdf_buffers.buffer = BytesIO()
+    buffer.seek(0)
+    buffer.truncate(0)
     doc = SimpleDocTemplate(buffer, pagesize=A4)
-    styles = getSampleStyleSheet()
+    pdf_styles = get_pdf_styles()
+    title_style = pdf_styles['title']
+    heading_style = pdf_styles['heading']
     story = []
     
-    # Custom styles
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=24,
-        spaceAfter=30,
-        textColor=colors.HexColor('#1e3a8a'),
-        alignment=1  # Center alignment
-    )
-    
-    heading_style = ParagraphStyle(
-        'CustomHeading',
-        parent=styles['Heading2'],
-        fontSize=16,
-        spaceAfter=12,
-        textColor=colors.HexColor('#3b82f6')
-    )
-    
     # Title
     story.append(Paragraph("📱 Phone Number Intelligence Report", title_style))
     story.append(Spacer(1, 20))
     
-    # Report metadata
-    story.append(Paragraph(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", styles['Normal']))
+    # Report metadata; stamped with the analysis time, which stays correct when the PDF is served from cache
+    analyzed_at = results.get('timestamp')
+    analyzed_at = datetime.fromisoformat(analyzed_at).strftime('%Y-%m-%d %H:%M:%S') if analyzed_at else 'Unknown'
+    story.append(Paragraph(f"Analysis time: {analyzed_at}", pdf_styles['normal']))
     story.append(Spacer(1, 20))
     
     # Executive Summary
     story.append(Paragraph("Executive Summary", heading_style))
     
-    summary_data = [
-        ['Phone Number', results.get('formatted_number', 'N/A')],
-        ['Country', results.get('country', 'Unknown')],
-        ['Region', results.get('region', 'Unknown')],
-        ['Carrier', results.get('carrier', 'Unknown')],
-        ['Line Type', results.get('line_type', 'Unknown')],
-        ['Risk Score', f"{results.get('risk_score', 0)}/100"],
-        ['Is Valid', 'Yes' if results.get('is_valid') else 'No'],
-        ['Time Zone', results.get('timezone', 'Unknown')]
-    ]
+    summary_data = pdf_table_rows(PDF_SUMMARY_ROWS, results)
     
     summary_table = Table(summary_data, colWidths=[2*inch, 3*inch])
-    summary_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#e2e8f0')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 12),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black)
-    ]))
+    summary_table.setStyle(pdf_styles['summary_table'])
     
     story.append(summary_table)
     story.append(Spacer(1, 20))
@@ -1496,26 +2011,10 @@ def generate_pdf_report(results):
         story.append(Paragraph("Security Analysis", heading_style))
         security_data = results.get('security_analysis', {})
         
-        security_info = [
-            ['Security Metric', 'Status'],
-            ['Spam Risk', 'Yes' if security_data.get('is_spam_risk') else 'No'],
-            ['VoIP Number', 'Yes' if security_data.get('is_voip') else 'No'],
-            ['Known Scammer', 'Yes' if security_data.get('is_scammer') else 'No'],
-            ['Verified Carrier', 'Yes' if security_data.get('verified_carrier') else 'No'],
-            ['Reputation Score', f"{security_data.get('reputation_score', 50)}/100"]
-        ]
+        security_info = [['Security Metric', 'Status']] + pdf_table_rows(PDF_SECURITY_ROWS, security_data)
         
         security_table = Table(security_info, colWidths=[2.5*inch, 2.5*inch])
-        security_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#fef2f2')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 12),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-        ]))
+        security_table.setStyle(pdf_styles['security_table'])
         
         story.append(security_table)
         story.append(Spacer(1, 20))
@@ -1523,28 +2022,10 @@ def generate_pdf_report(results):
     # Technical Details
     story.append(Paragraph("Technical Details", heading_style))
     
-    tech_data = [
-        ['Technical Attribute', 'Value'],
-        ['E164 Format', results.get('e164_format', 'N/A')],
-        ['National Format', results.get('national_format', 'N/A')],
-        ['International Format', results.get('international_format', 'N/A')],
-        ['Country Code', f"+{results.get('country_code', 'N/A')}"],
-        ['National Number', str(results.get('national_number', 'N/A'))],
-        ['Number Type', results.get('number_type', 'Unknown')],
-        ['Is Possible', 'Yes' if results.get('is_possible') else 'No']
-    ]
+    tech_data = [['Technical Attribute', 'Value']] + pdf_table_rows(PDF_TECH_ROWS, results)
     
     tech_table = Table(tech_data, colWidths=[2.5*inch, 2.5*inch])
-    tech_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#f0f9ff')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.black),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 12),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black)
-    ]))
+    tech_table.setStyle(pdf_styles['tech_table'])
     
     story.append(tech_table)
     story.append(Spacer(1, 20))
@@ -1565,67 +2046,19 @@ def generate_pdf_report(results):
         else:
             osint_text.append("• No social media associations found")
         
-        for text in osint_text:
-            story.append(Paragraph(text, styles['Normal']))
+        story.append(Paragraph("<br/>".join(osint_text), pdf_styles['normal']))
         
         story.append(Spacer(1, 20))
     
     # Footer
     story.append(Spacer(1, 30))
-    story.append(Paragraph("Report generated by Phone Intelligence Tool", styles['Italic']))
-    story.append(Paragraph("For cybersecurity and fraud prevention purposes only", styles['Italic']))
+    story.append(Paragraph("Report generated by Phone Intelligence Tool", pdf_styles['italic']))
+    story.append(Paragraph("For cybersecurity and fraud prevention purposes only", pdf_styles['italic']))
     
     # Build PDF
     doc.build(story)
     buffer.seek(0)
     return buffer.getvalue()
 
-def get_country_coordinates(country_code):
-    """Get approximate coordinates for country center"""
-    # Convert integer country codes to ISO codes
-    if isinstance(country_code, int):
-        # Map common numeric country codes to ISO codes
-        numeric_to_iso = {
-            1: 'US',    # United States/Canada
-            44: 'GB',   # United Kingdom
-            49: 'DE',   # Germany
-            33: 'FR',   # France
-            39: 'IT',   # Italy
-            34: 'ES',   # Spain
-            81: 'JP',   # Japan
-            86: 'CN',   # China
-            91: 'IN',   # India
-            55: 'BR',   # Brazil
-            52: 'MX',   # Mexico
-            7: 'RU',    # Russia
-            61: 'AU',   # Australia
-        }
-        country_code = numeric_to_iso.get(country_code, 'US')  # Default to US if not found
-    
-    # Ensure country_code is a string and convert to uppercase
-    if country_code:
-        country_code = str(country_code).upper()
-    else:
-        return None
-    
-    coords_map = {
-        'US': [39.8283, -98.5795],
-        'GB': [55.3781, -3.4360],
-        'CA': [56.1304, -106.3468],
-        'AU': [-25.2744, 133.7751],
-        'DE': [51.1657, 10.4515],
-        'FR': [46.2276, 2.2137],
-        'IT': [41.8719, 12.5674],
-        'ES': [40.4637, -3.7492],
-        'JP': [36.2048, 138.2529],
-        'CN': [35.8617, 104.1954],
-        'IN': [20.5937, 78.9629],
-        'BR': [-14.2350, -51.9253],
-        'MX': [23.6345, -102.5528],
-        'RU': [61.5240, 105.3188],
-    }
-    
-    return coords_map.get(country_code)
-
 if __name__ == "__main__":
     main()
@@ -1,4 +1,5 @@
 import os
+import hashlib
 from dataclasses import dataclass
 
 @dataclass
@@ -14,6 +15,12 @@ class Config:
     # Application settings
     LOG_LEVEL: str = os.getenv('LOG_LEVEL', 'INFO')
     MAX_REQUESTS_PER_HOUR: int = int(os.getenv('MAX_REQUESTS_PER_HOUR', '100'))
+    MAX_REQUESTS_PER_SECOND: float = float(os.getenv('MAX_REQUESTS_PER_SECOND', '5'))
+    MAX_CONCURRENT_REQUESTS: int = int(os.getenv('MAX_CONCURRENT_REQUESTS', '4'))
+    CACHE_TTL: int = int(os.getenv('CACHE_TTL', '3600'))  # Seconds to reuse analysis results
+    API_CACHE_PATH: str = os.getenv('API_CACHE_PATH', 'api_cache.sqlite3')  # Empty disables the disk cache
+    API_CACHE_TTL: int = int(os.getenv('API_CACHE_TTL', str(7 * 24 * 3600)))  # One week
+    ANALYSIS_HISTORY_LIMIT: int = int(os.getenv('ANALYSIS_HISTORY_LIMIT', '50'))
     
     # Security settings
     ENABLE_AUDIT_LOG: bool = os.getenv('ENABLE_AUDIT_LOG', 'true').lower() == 'true'
@@ -23,3 +30,18 @@ class Config:
     ENABLE_OSINT_ENRICHMENT: bool = os.getenv('ENABLE_OSINT_ENRICHMENT', 'true').lower() == 'true'
     ENABLE_BREACH_CHECKING: bool = os.getenv('ENABLE_BREACH_CHECKING', 'true').lower() == 'true'
     ENABLE_SOCIAL_MEDIA_LOOKUP: bool = os.getenv('ENABLE_SOCIAL_MEDIA_LOOKUP', 'false').lower() == 'true'
+
+@dataclass(frozen=True)
+class ApiKeys:
+    """API keys for one Streamlit session; unset keys fall back to the environment"""
+    
+    numverify_api_key: str = Config.NUMVERIFY_API_KEY
+    twilio_account_sid: str = Config.TWILIO_ACCOUNT_SID
+    twilio_auth_token: str = Config.TWILIO_AUTH_TOKEN
+    hibp_api_key: str = Config.HIBP_API_KEY
+    
+    def fingerprint(self):
+        """Short digest identifying this key set without exposing the keys"""
+        joined = "\0".join((self.numverify_api_key, self.twilio_account_sid,
+                             self.twilio_auth_token, self.hibp_api_key))
+        return hashlib.blake2b(joined.encode(), digest_size=8).hexdigest()
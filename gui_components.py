@@ -4,11 +4,157 @@ Provides reusable UI components with consistent styling
 """
 
 import streamlit as st
-import plotly.graph_objects as go
-import plotly.express as px
+import functools
 from datetime import datetime
-import json
+from xml.sax.saxutils import escape
+from collections import deque
 import pandas as pd
+from config import Config
+from serialization import dumps_json, record_to_csv
+
+# Page header: component stylesheet and banner sent as one markdown element
+HEADER_HTML = """
+<style>
+.main-header {
+    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+    padding: 2rem;
+    border-radius: 15px;
+    margin-bottom: 2rem;
+    text-align: center;
+    color: white;
+    box-shadow: 0 10px 30px rgba(0,0,0,0.1);
+}
+.header-title {
+    font-size: 2.5rem;
+    font-weight: 700;
+    margin-bottom: 0.5rem;
+    text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
+}
+.header-subtitle {
+    font-size: 1.2rem;
+    opacity: 0.9;
+    font-weight: 300;
+}
+.feature-badge {
+    display: inline-block;
+    background: rgba(255,255,255,0.2);
+    padding: 0.3rem 0.8rem;
+    border-radius: 20px;
+    margin: 0.2rem;
+    font-size: 0.9rem;
+    backdrop-filter: blur(10px);
+}
+.ui-metric-card {
+    background: linear-gradient(135deg, #f8fafc 0%, #e2e8f0 100%);
+    padding: 1.5rem;
+    border-radius: 12px;
+    border-left: 5px solid;
+    box-shadow: 0 4px 15px rgba(0,0,0,0.1);
+    margin: 0.5rem 0;
+    transition: transform 0.2s ease;
+}
+.ui-metric-title {
+    color: #64748b;
+    font-size: 0.9rem;
+    margin-bottom: 0.5rem;
+}
+.ui-metric-value {
+    font-size: 1.8rem;
+    font-weight: 700;
+    color: #1e293b;
+}
+</style>
+<div class="main-header">
+    <div class="header-title">📱 Phone Intelligence Pro</div>
+    <div class="header-subtitle">Advanced OSINT & Security Analysis Platform</div>
+    <div style="margin-top: 1rem;">
+        <span class="feature-badge">🔍 OSINT Analysis</span>
+        <span class="feature-badge">🛡️ Security Scoring</span>
+        <span class="feature-badge">🌍 Geolocation</span>
+        <span class="feature-badge">📊 Batch Processing</span>
+    </div>
+</div>
+"""
+
+# Metric card markup, filled with str.format; styled by .ui-metric-card in HEADER_HTML
+METRIC_CARD_TEMPLATE = """
+<div class="ui-metric-card" style="border-left-color: {color};">
+    <div class="ui-metric-title">{icon} {title}</div>
+    <div class="ui-metric-value">{value}</div>
+    {delta_html}
+</div>
+"""
+
+# Full-width download buttons used throughout the export sections
+wide_download_button = functools.partial(st.download_button, use_container_width=True)
+
+# Security indicator tile, laid out two per row by render_security_indicators
+INDICATOR_CELL_TEMPLATE = (
+    '<div style="background: {bg_color}; color: {text_color}; padding: 1rem; border-radius: 8px; '
+    'text-align: center; margin: 0.5rem 0; font-weight: 600; box-shadow: 0 2px 8px rgba(0,0,0,0.1);">'
+    '{icon} {label}<br><span style="font-size: 1.2rem;">{status_text}</span></div>'
+)
+
+@st.cache_resource
+def risk_gauge_template():
+    """Build the static risk gauge figure once; callers copy it before filling values"""
+    import plotly.graph_objects as go
+    
+    fig = go.Figure(go.Indicator(
+        mode = "gauge+number+delta",
+        domain = {'x': [0, 1], 'y': [0, 1]},
+        title = {'font': {'size': 20}},
+        delta = {'reference': 50, 'increasing': {'color': "#ef4444"}, 'decreasing': {'color': "#10b981"}},
+        gauge = {
+            'axis': {'range': [None, 100], 'tickwidth': 1, 'tickcolor': "darkblue"},
+            'bar': {'thickness': 0.3},
+            'bgcolor': "white",
+            'borderwidth': 2,
+            'bordercolor': "gray",
+            'steps': [
+                {'range': [0, 40], 'color': '#dcfce7'},
+                {'range': [40, 70], 'color': '#fef3c7'},
+                {'range': [70, 100], 'color': '#fee2e2'}
+            ],
+            'threshold': {
+                'line': {'color': "red", 'width': 4},
+                'thickness': 0.75,
+                'value': 90
+            }
+        }
+    ))
+    
+    fig.update_layout(
+        height=300,
+        font={'color': "darkblue", 'family': "Arial"},
+        paper_bgcolor="rgba(0,0,0,0)",
+        plot_bgcolor="rgba(0,0,0,0)"
+    )
+    
+    return fig
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def build_timeline_figure(history_key, _history):
+    """Build the risk score trend chart for the analysis history identified by history_key"""
+    import plotly.express as px
+    
+    df_history = pd.DataFrame(list(_history))
+    
+    fig = px.line(
+        df_history, 
+        x='timestamp', 
+        y='risk_score',
+        title='Risk Score Trends',
+        markers=True
+    )
+    
+    fig.update_layout(
+        xaxis_title="Time",
+        yaxis_title="Risk Score",
+        height=300
+    )
+    
+    return fig
 
 class PhoneIntelligenceUI:
     """Enhanced UI components for phone intelligence tool"""
@@ -16,52 +162,7 @@ class PhoneIntelligenceUI:
     @staticmethod
     def render_header():
         """Render enhanced header with branding"""
-        st.markdown("""
-        <style>
-        .main-header {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            padding: 2rem;
-            border-radius: 15px;
-            margin-bottom: 2rem;
-            text-align: center;
-            color: white;
-            box-shadow: 0 10px 30px rgba(0,0,0,0.1);
-        }
-        .header-title {
-            font-size: 2.5rem;
-            font-weight: 700;
-            margin-bottom: 0.5rem;
-            text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
-        }
-        .header-subtitle {
-            font-size: 1.2rem;
-            opacity: 0.9;
-            font-weight: 300;
-        }
-        .feature-badge {
-            display: inline-block;
-            background: rgba(255,255,255,0.2);
-            padding: 0.3rem 0.8rem;
-            border-radius: 20px;
-            margin: 0.2rem;
-            font-size: 0.9rem;
-            backdrop-filter: blur(10px);
-        }
-        </style>
-        """, unsafe_allow_html=True)
-        
-        st.markdown("""
-        <div class="main-header">
-            <div class="header-title">📱 Phone Intelligence Pro</div>
-            <div class="header-subtitle">Advanced OSINT & Security Analysis Platform</div>
-            <div style="margin-top: 1rem;">
-                <span class="feature-badge">🔍 OSINT Analysis</span>
-                <span class="feature-badge">🛡️ Security Scoring</span>
-                <span class="feature-badge">🌍 Geolocation</span>
-                <span class="feature-badge">📊 Batch Processing</span>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(HEADER_HTML, unsafe_allow_html=True)
     
     @staticmethod
     def render_metric_card(title, value, icon, color="blue", delta=None):
@@ -72,63 +173,25 @@ class PhoneIntelligenceUI:
             delta_symbol = "↗" if delta > 0 else "↘"
             delta_html = f'<div style="color: {delta_color}; font-size: 0.9rem;">{delta_symbol} {abs(delta)}%</div>'
         
-        st.markdown(f"""
-        <div style="
-            background: linear-gradient(135deg, #f8fafc 0%, #e2e8f0 100%);
-            padding: 1.5rem;
-            border-radius: 12px;
-            border-left: 5px solid {color};
-            box-shadow: 0 4px 15px rgba(0,0,0,0.1);
-            margin: 0.5rem 0;
-            transition: transform 0.2s ease;
-        ">
-            <div style="display: flex; align-items: center; justify-content: space-between;">
-                <div>
-                    <div style="color: #64748b; font-size: 0.9rem; margin-bottom: 0.5rem;">{icon} {title}</div>
-                    <div style="font-size: 1.8rem; font-weight: 700; color: #1e293b;">{value}</div>
-                    {delta_html}
-                </div>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(
+            METRIC_CARD_TEMPLATE.format(title=title, value=value, icon=icon, color=color, delta_html=delta_html),
+            unsafe_allow_html=True
+        )
     
     @staticmethod
     def render_risk_gauge(risk_score, title="Risk Assessment"):
         """Render interactive risk gauge"""
+        import plotly.graph_objects as go
+        
         colors = ["#10b981", "#f59e0b", "#ef4444"]
         color_idx = 0 if risk_score < 40 else 1 if risk_score < 70 else 2
         
-        fig = go.Figure(go.Indicator(
-            mode = "gauge+number+delta",
-            value = risk_score,
-            domain = {'x': [0, 1], 'y': [0, 1]},
-            title = {'text': title, 'font': {'size': 20}},
-            delta = {'reference': 50, 'increasing': {'color': "#ef4444"}, 'decreasing': {'color': "#10b981"}},
-            gauge = {
-                'axis': {'range': [None, 100], 'tickwidth': 1, 'tickcolor': "darkblue"},
-                'bar': {'color': colors[color_idx], 'thickness': 0.3},
-                'bgcolor': "white",
-                'borderwidth': 2,
-                'bordercolor': "gray",
-                'steps': [
-                    {'range': [0, 40], 'color': '#dcfce7'},
-                    {'range': [40, 70], 'color': '#fef3c7'},
-                    {'range': [70, 100], 'color': '#fee2e2'}
-                ],
-                'threshold': {
-                    'line': {'color': "red", 'width': 4},
-                    'thickness': 0.75,
-                    'value': 90
-                }
-            }
-        ))
-        
-        fig.update_layout(
-            height=300,
-            font={'color': "darkblue", 'family': "Arial"},
-            paper_bgcolor="rgba(0,0,0,0)",
-            plot_bgcolor="rgba(0,0,0,0)"
-        )
+        # Copy the shared template and fill in only the per-call values
+        fig = go.Figure(risk_gauge_template())
+        indicator = fig.data[0]
+        indicator.value = risk_score
+        indicator.title.text = title
+        indicator.gauge.bar.color = colors[color_idx]
         
         return fig
     
@@ -144,54 +207,33 @@ class PhoneIntelligenceUI:
             ("Known Scammer", security_data.get('is_scammer', False), "🚫", "#ef4444")
         ]
         
-        cols = st.columns(2)
-        for i, (label, status, icon, color) in enumerate(indicators):
-            with cols[i % 2]:
-                status_text = "Yes" if status else "No"
-                bg_color = color if status else "#e2e8f0"
-                text_color = "white" if status else "#64748b"
-                
-                st.markdown(f"""
-                <div style="
-                    background: {bg_color};
-                    color: {text_color};
-                    padding: 1rem;
-                    border-radius: 8px;
-                    text-align: center;
-                    margin: 0.5rem 0;
-                    font-weight: 600;
-                    box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-                ">
-                    {icon} {label}<br>
-                    <span style="font-size: 1.2rem;">{status_text}</span>
-                </div>
-                """, unsafe_allow_html=True)
+        cells = []
+        for label, status, icon, color in indicators:
+            cells.append(INDICATOR_CELL_TEMPLATE.format(
+                bg_color=color if status else "#e2e8f0",
+                text_color="white" if status else "#64748b",
+                icon=icon,
+                label=label,
+                status_text="Yes" if status else "No"
+            ))
+        
+        st.markdown(
+            f'<div style="display: grid; grid-template-columns: 1fr 1fr; column-gap: 1rem;">{"".join(cells)}</div>',
+            unsafe_allow_html=True
+        )
     
     @staticmethod
     def render_analysis_timeline():
         """Render analysis timeline"""
         if 'analysis_history' not in st.session_state:
-            st.session_state.analysis_history = []
+            st.session_state.analysis_history = deque(maxlen=Config.ANALYSIS_HISTORY_LIMIT)
         
         st.markdown("### 📈 Analysis Timeline")
         
-        if st.session_state.analysis_history:
-            # Create timeline chart
-            df_history = pd.DataFrame(st.session_state.analysis_history)
-            
-            fig = px.line(
-                df_history, 
-                x='timestamp', 
-                y='risk_score',
-                title='Risk Score Trends',
-                markers=True
-            )
-            
-            fig.update_layout(
-                xaxis_title="Time",
-                yaxis_title="Risk Score",
-                height=300
-            )
+        history = st.session_state.analysis_history
+        if history:
+            # Rebuilt only when an entry is added; the newest timestamp identifies the state
+            fig = build_timeline_figure((len(history), history[-1].get('timestamp')), history)
             
             st.plotly_chart(fig, use_container_width=True)
         else:
@@ -202,40 +244,38 @@ class PhoneIntelligenceUI:
         """Enhanced export section with multiple formats"""
         st.markdown("### 📤 Export & Reporting")
         
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
             # JSON export
-            json_data = json.dumps(results, indent=2, default=str)
-            st.download_button(
+            json_data = cached_json_export(results)
+            wide_download_button(
                 label="📄 JSON",
                 data=json_data,
-                file_name=f"analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
-                mime="application/json",
-                use_container_width=True
+                file_name=f"analysis_{timestamp}.json",
+                mime="application/json"
             )
         
         with col2:
             # CSV export
-            df = pd.json_normalize(results)
-            csv_data = df.to_csv(index=False)
-            st.download_button(
+            csv_data = cached_csv_export(results)
+            wide_download_button(
                 label="📊 CSV",
                 data=csv_data,
-                file_name=f"analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                mime="text/csv",
-                use_container_width=True
+                file_name=f"analysis_{timestamp}.csv",
+                mime="text/csv"
             )
         
         with col3:
             # XML export
-            xml_data = dict_to_xml(results)
-            st.download_button(
+            xml_data = cached_xml_export(results)
+            wide_download_button(
                 label="📋 XML",
                 data=xml_data,
-                file_name=f"analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xml",
-                mime="application/xml",
-                use_container_width=True
+                file_name=f"analysis_{timestamp}.xml",
+                mime="application/xml"
             )
         
         with col4:
@@ -245,32 +285,51 @@ class PhoneIntelligenceUI:
 
 def dict_to_xml(data, root_name="analysis"):
     """Convert dictionary to XML format"""
+    parts = ['<?xml version="1.0" encoding="UTF-8"?>\n']
+    
     def dict_to_xml_recursive(d, parent_name):
-        xml_str = f"<{parent_name}>"
+        parts.append(f"<{parent_name}>")
         for key, value in d.items():
             if isinstance(value, dict):
-                xml_str += dict_to_xml_recursive(value, key)
+                dict_to_xml_recursive(value, key)
             elif isinstance(value, list):
                 for item in value:
                     if isinstance(item, dict):
-                        xml_str += dict_to_xml_recursive(item, key)
+                        dict_to_xml_recursive(item, key)
                     else:
-                        xml_str += f"<{key}>{item}</{key}>"
+                        parts.append(f"<{key}>{escape(str(item))}</{key}>")
             else:
-                xml_str += f"<{key}>{value}</{key}>"
-        xml_str += f"</{parent_name}>"
-        return xml_str
+                parts.append(f"<{key}>{escape(str(value))}</{key}>")
+        parts.append(f"</{parent_name}>")
     
-    return f'<?xml version="1.0" encoding="UTF-8"?>\n{dict_to_xml_recursive(data, root_name)}'
+    dict_to_xml_recursive(data, root_name)
+    return "".join(parts)
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def cached_json_export(results):
+    """JSON download payload, reused across reruns for unchanged results"""
+    return dumps_json(results)
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def cached_csv_export(results):
+    """CSV download payload, reused across reruns for unchanged results"""
+    return record_to_csv(results)
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def cached_xml_export(results):
+    """XML download payload, reused across reruns for unchanged results"""
+    return dict_to_xml(results)
 
 def generate_analysis_report(results):
     """Generate comprehensive analysis report"""
     st.markdown("### 📑 Analysis Report Generated")
     
+    generated_at = datetime.now()
+    
     report_content = f"""
     # Phone Number Intelligence Report
     
-    **Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+    **Generated:** {generated_at.strftime('%Y-%m-%d %H:%M:%S')}
     
     ## Executive Summary
     - **Phone Number:** {results.get('formatted_number', 'N/A')}
@@ -279,12 +338,12 @@ def generate_analysis_report(results):
     - **Carrier:** {results.get('carrier', 'Unknown')}
     
     ## Detailed Findings
-    {json.dumps(results, indent=2, default=str)}
+    {dumps_json(results).decode('utf-8')}
     """
     
     st.download_button(
         label="📥 Download Full Report",
         data=report_content,
-        file_name=f"phone_intelligence_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md",
+        file_name=f"phone_intelligence_report_{generated_at.strftime('%Y%m%d_%H%M%S')}.md",
         mime="text/markdown"
     )
@@ -1,51 +1,487 @@
 import phonenumbers
 from phonenumbers import geocoder, carrier, timezone
 import requests
+import asyncio
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+import time
 from datetime import datetime
 import logging
-from config import Config
+from config import Config, ApiKeys
+from api_cache import ApiResponseCache
+from serialization import dumps_json
+from phone_intelligence_kernels import calculate_risk_score, determine_overall_status
 import random
+import sqlite3
+import threading
+import weakref
+from cachetools import TTLCache
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from functools import partial, lru_cache, wraps
+import copy
+import contextvars
+import ipaddress
+import numpy as np
+from types import MappingProxyType
+from collections import namedtuple
+from itertools import chain
+
+# Worker threads shared by all analyses for running independent result sections
+ANALYSIS_SECTION_WORKERS = 8
+_section_executor = ThreadPoolExecutor(max_workers=ANALYSIS_SECTION_WORKERS, thread_name_prefix="analysis-section")
+
+# Separate pool for the per-service probes the sections fan out to, so a
+# section waiting on its probes never holds the threads those probes need
+PROBE_WORKERS = 16
+PROBE_TIMEOUT = 5  # Seconds one probe may run, counted from when a worker picks it up
+_probe_executor = ThreadPoolExecutor(max_workers=PROBE_WORKERS, thread_name_prefix="analysis-probe")
+
+# True while an analyze_phone_number(fresh=True) call runs; cached lookups are re-queried
+_fresh_lookup = contextvars.ContextVar('fresh_lookup', default=False)
+
+# List that _run_probes appends failed or timed-out probe names to, when one is set
+_incomplete_probes = contextvars.ContextVar('incomplete_probes', default=None)
+
+def _submit(executor, fn, *args):
+    """Submit fn in a copy of the caller's context, so _fresh_lookup carries over to the worker"""
+    return executor.submit(contextvars.copy_context().run, fn, *args)
+
+# In-memory Numverify responses by E.164 number, checked before the disk cache
+NUMVERIFY_MEMORY_CACHE_SIZE = 10_000
+NUMVERIFY_MEMORY_CACHE_TTL = 86400  # One day
+
+# Stored OSINT bundles by E.164 number; bump the version when the bundle's shape changes
+OSINT_CACHE_VERSION = 2
+OSINT_CACHE_TTL = 86400  # One day
+
+# Published IP allocations for major carriers, keyed on carrier_key() of the carrier name
+CARRIER_IP_RANGES = MappingProxyType({
+    name: tuple(ipaddress.ip_network(cidr) for cidr in cidrs)
+    for name, cidrs in {
+        'verizon': ('74.192.0.0/10', '108.160.0.0/11'),
+        'at&t': ('12.0.0.0/8', '135.0.0.0/8'),
+        't-mobile': ('208.54.0.0/16', '66.94.0.0/16'),
+        'sprint': ('72.52.0.0/15', '173.199.0.0/16')
+    }.items()
+})
+
+# CARRIER_IP_RANGES flattened into parallel uint32 arrays for vectorized membership tests
+_CARRIER_RANGE_OWNERS = tuple(name for name, networks in CARRIER_IP_RANGES.items() for _ in networks)
+_CARRIER_RANGE_BASES = np.array(
+    [int(network.network_address) for networks in CARRIER_IP_RANGES.values() for network in networks],
+    dtype=np.uint32
+)
+_CARRIER_RANGE_MASKS = np.array(
+    [int(network.netmask) for networks in CARRIER_IP_RANGES.values() for network in networks],
+    dtype=np.uint32
+)
+
+def carriers_for_ip(ip):
+    """
+    Find the carriers whose published ranges contain an IPv4 address
+    
+    Args:
+        ip (str): IPv4 address
+        
+    Returns:
+        list: CARRIER_IP_RANGES keys of every matching range, in table order
+    """
+    address = np.uint32(int(ipaddress.IPv4Address(ip)))
+    hits = np.flatnonzero((address & _CARRIER_RANGE_MASKS) == _CARRIER_RANGE_BASES)
+    return list(dict.fromkeys(_CARRIER_RANGE_OWNERS[i] for i in hits))
+
+# Generic mobile IP ranges by lowercased country name, used when the carrier is not listed
+COUNTRY_MOBILE_RANGES = MappingProxyType({
+    name: tuple(ipaddress.ip_network(cidr) for cidr in cidrs)
+    for name, cidrs in {
+        'united states': ('10.0.0.0/8', '172.16.0.0/12'),
+        'united kingdom': ('192.168.0.0/16',),
+        'canada': ('10.0.0.0/8',)
+    }.items()
+})
+
+# Distinct carriers / countries whose network facts are kept in memory
+NETWORK_FACTS_CACHE_SIZE = 1024
+
+# Known spellings of one carrier (lowercased, single-spaced) -> the key its tables use
+CARRIER_ALIASES = MappingProxyType({
+    'verizon wireless': 'verizon',
+    'verizon': 'verizon',
+    'at&t mobility': 'at&t',
+    'at&t wireless': 'at&t',
+    'at&t': 'at&t',
+    't-mobile us': 't-mobile',
+    't-mobile usa': 't-mobile',
+    't-mobile': 't-mobile',
+    'sprint pcs': 'sprint',
+    'sprint spectrum': 'sprint',
+    'sprint': 'sprint',
+})
+
+@lru_cache(maxsize=NETWORK_FACTS_CACHE_SIZE)
+def carrier_key(carrier_name):
+    """
+    Canonical key for a carrier name, shared by the per-carrier tables and caches
+    
+    Spellings listed in CARRIER_ALIASES (e.g. "AT&T Mobility" / "AT&T Wireless")
+    resolve to one key; any other name is its own key, so distinct carriers that
+    share a first word ("China Mobile" / "China Unicom") never collide.
+    
+    Args:
+        carrier_name (str): Carrier name as reported by phonenumbers
+        
+    Returns:
+        str: Carrier key, empty when the carrier is unknown
+    """
+    normalized = " ".join(carrier_name.lower().split()) if carrier_name else ""
+    return CARRIER_ALIASES.get(normalized, normalized)
+
+@lru_cache(maxsize=NETWORK_FACTS_CACHE_SIZE)
+def carrier_security_rating(carrier_key):
+    """Security rating for a carrier as (encryption_support, security_features, security_score)"""
+    # This would use security rating databases
+    # Placeholder implementation
+    return 'Standard', ('Network encryption', 'Authentication'), 60
+
+@lru_cache(maxsize=NETWORK_FACTS_CACHE_SIZE)
+def network_security_baseline(number_type, carrier_key):
+    """
+    Network security assessment implied by line type and carrier alone
+    
+    Args:
+        number_type: phonenumbers.PhoneNumberType value
+        carrier_key (str): Carrier key from carrier_key(), empty when unknown
+        
+    Returns:
+        MappingProxyType: Assessment fields, with tuples in place of lists
+    """
+    assessment = {
+        'encryption_support': 'Unknown',
+        'network_security_level': 'Standard',
+        'vulnerability_indicators': (),
+        'security_score': 50,  # Default neutral score
+        'security_features': ()
+    }
+    
+    # Assess based on line type
+    if number_type == phonenumbers.PhoneNumberType.VOIP:
+        assessment['vulnerability_indicators'] = ('VoIP - potential for spoofing',)
+        assessment['security_score'] -= 10
+    elif number_type == phonenumbers.PhoneNumberType.MOBILE:
+        assessment['security_features'] = ('Mobile network encryption',)
+        assessment['security_score'] += 10
+    
+    # Assess based on carrier security reputation
+    if carrier_key:
+        encryption_support, security_features, security_score = carrier_security_rating(carrier_key)
+        assessment.update(
+            encryption_support=encryption_support,
+            security_features=security_features,
+            security_score=security_score
+        )
+    
+    return MappingProxyType(assessment)
+
+@lru_cache(maxsize=NETWORK_FACTS_CACHE_SIZE)
+def roaming_partners(carrier_key):
+    """Roaming partner descriptions for a carrier"""
+    # This would use carrier partnership databases
+    # Placeholder implementation
+    return ("International roaming available",)
+
+@lru_cache(maxsize=NETWORK_FACTS_CACHE_SIZE)
+def network_coverage(carrier_key, country):
+    """Coverage summary for a carrier in a country"""
+    # This would use coverage databases
+    # Placeholder implementation
+    return f"Coverage in {country}"
+
+# Likely network technology per line type; real detection would need network probing
+NETWORK_TECHNOLOGIES = MappingProxyType({
+    phonenumbers.PhoneNumberType.MOBILE: "4G/5G (estimated)",
+    phonenumbers.PhoneNumberType.VOIP: "Internet/VoIP",
+})
+
+# "Not found" answers per lookup method, so repeat numbers skip the re-query
+NEGATIVE_CACHE_SIZE = 50_000
+NEGATIVE_CACHE_TTL = 3600  # One hour
+
+# Keep-alive connections held per host; sized so every probe worker can hold one
+HTTP_POOL_CONNECTIONS = 16
+HTTP_POOL_MAXSIZE = 32
+
+# Distinct inputs / numbers whose parse and metadata lookups are kept in memory
+PARSE_CACHE_SIZE = 4096
+
+# Region hints tried in order when the input has no leading '+', one per calling
+# code: national digits parse identically under regions sharing a code, so CA
+# (which shares +1 with US, and whose numbers validate there) is not retried
+PARSE_REGIONS = ('US', 'GB', 'AU')
+
+# Human-readable labels for phonenumbers.PhoneNumberType values
+LINE_TYPE_DESCRIPTIONS = MappingProxyType({
+    phonenumbers.PhoneNumberType.MOBILE: "Mobile",
+    phonenumbers.PhoneNumberType.FIXED_LINE: "Landline",
+    phonenumbers.PhoneNumberType.FIXED_LINE_OR_MOBILE: "Fixed Line or Mobile",
+    phonenumbers.PhoneNumberType.TOLL_FREE: "Toll Free",
+    phonenumbers.PhoneNumberType.PREMIUM_RATE: "Premium Rate",
+    phonenumbers.PhoneNumberType.SHARED_COST: "Shared Cost",
+    phonenumbers.PhoneNumberType.VOIP: "VoIP",
+    phonenumbers.PhoneNumberType.PERSONAL_NUMBER: "Personal Number",
+    phonenumbers.PhoneNumberType.PAGER: "Pager",
+    phonenumbers.PhoneNumberType.UAN: "Universal Access Number",
+    phonenumbers.PhoneNumberType.VOICEMAIL: "Voicemail"
+})
+
+# Line types the carrier database covers (mirrors carrier.name_for_number)
+CARRIER_LINE_TYPES = frozenset((
+    phonenumbers.PhoneNumberType.MOBILE,
+    phonenumbers.PhoneNumberType.FIXED_LINE_OR_MOBILE,
+    phonenumbers.PhoneNumberType.PAGER
+))
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse_phone_number(phone_input):
+    """
+    Parse a phone number, trying each of PARSE_REGIONS as the default region
+    
+    Args:
+        phone_input (str): Phone number in any format
+        
+    Returns:
+        phonenumbers.PhoneNumber: First valid parse, or None; callers must not mutate it
+    """
+    # A leading '+' carries its own country code, so the region hint would be ignored anyway
+    regions = (None,) if phone_input.lstrip().startswith('+') else PARSE_REGIONS
+    
+    for region in regions:
+        try:
+            parsed = phonenumbers.parse(phone_input, region)
+            if phonenumbers.is_valid_number(parsed):
+                return parsed
+        except phonenumbers.NumberParseException:
+            continue
+    
+    return None
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _cached_geo(e164, lang="en"):
+    """Metadata lookups for an E.164 number: (country, carrier, timezone, number_type)"""
+    parsed = phonenumbers.parse(e164)
+    
+    # geocoder/carrier/timezone *_for_number each re-run number_type, the costly
+    # validity check; classify once and call the variants that assume a valid number
+    ntype = phonenumbers.number_type(parsed)
+    if ntype == phonenumbers.PhoneNumberType.UNKNOWN:
+        return "", "", timezone.UNKNOWN_TIMEZONE, ntype
+    
+    if phonenumbers.is_number_type_geographical(ntype, parsed.country_code):
+        country = geocoder.description_for_valid_number(parsed, lang)
+        timezones = timezone.time_zones_for_geographical_number(parsed)
+    else:
+        country = geocoder.country_name_for_number(parsed, lang)
+        timezones = timezone.time_zones_for_number(parsed)
+    
+    carrier_name = carrier.name_for_valid_number(parsed, lang) if ntype in CARRIER_LINE_TYPES else ""
+    
+    return country, carrier_name, next(iter(timezones), "Unknown"), ntype
+
+def _e164(parsed_number):
+    """E.164 form of a parsed number, the key for _cached_geo"""
+    return phonenumbers.format_number(parsed_number, phonenumbers.PhoneNumberFormat.E164)
+
+# Library lookups for one parsed number, computed once per analysis by _derive
+NumberDerivations = namedtuple(
+    'NumberDerivations', ['ntype', 'country', 'carrier', 'carrier_key', 'tz', 'intl', 'natl', 'e164']
+)
+
+def _derive(parsed_number):
+    """Run each phonenumbers lookup for a parsed number exactly once"""
+    e164 = _e164(parsed_number)
+    country, carrier_name, tz, ntype = _cached_geo(e164)
+    return NumberDerivations(
+        ntype=ntype,
+        country=country,
+        carrier=carrier_name,
+        carrier_key=carrier_key(carrier_name),
+        tz=tz,
+        intl=phonenumbers.format_number(parsed_number, phonenumbers.PhoneNumberFormat.INTERNATIONAL),
+        natl=phonenumbers.format_number(parsed_number, phonenumbers.PhoneNumberFormat.NATIONAL),
+        e164=e164
+    )
+
+def empty_osint_data():
+    """OSINT section scaffold returned when enrichment is disabled"""
+    return {
+        'breach_data': [],
+        'social_media_presence': {},
+        'additional_intel': {},
+        'digital_footprint': {},
+        'associated_emails': {},
+        'websites': {},
+        'social_accounts': {}
+    }
+
+def _is_negative(result):
+    """True for a lookup that found nothing: a falsy answer, or a dict whose fields are all falsy"""
+    if isinstance(result, dict):
+        # An empty dict is what the status probes return on failure, not a "not found"
+        return bool(result) and not any(result.values())
+    return not result
+
+def _negative_cached(method=None, *, per_key_set=False):
+    """
+    Remember "not found" answers from a per-number lookup for NEGATIVE_CACHE_TTL
+    
+    Entries are keyed on the E.164 number the method is called with; a positive
+    answer drops any stale negative for the same number. Fresh analyses skip the
+    cached answer but still record the new one.
+    
+    Args:
+        per_key_set (bool): Also key on the instance's API key set, for lookups
+                            whose answer depends on which keys are configured
+    """
+    def decorator(method):
+        @wraps(method)
+        def wrapper(self, e164, *args, **kwargs):
+            key = (e164,) + args + tuple(sorted(kwargs.items()))
+            if per_key_set:
+                key += (self.api_keys.fingerprint(),)
+            with PhoneIntelligence._negative_cache_lock:
+                cache = PhoneIntelligence._negative_cache.get(method.__name__)
+                if cache is None:
+                    cache = TTLCache(maxsize=NEGATIVE_CACHE_SIZE, ttl=NEGATIVE_CACHE_TTL)
+                    PhoneIntelligence._negative_cache[method.__name__] = cache
+                if key in cache and not _fresh_lookup.get():
+                    return copy.deepcopy(cache[key])
+            
+            result = method(self, e164, *args, **kwargs)
+            with PhoneIntelligence._negative_cache_lock:
+                if _is_negative(result):
+                    # Store a private copy so callers can't mutate the cached answer
+                    cache[key] = copy.deepcopy(result)
+                else:
+                    cache.pop(key, None)
+            return result
+        return wrapper
+    
+    return decorator(method) if method is not None else decorator
+
+def _safe(default, message):
+    """
+    Log and swallow exceptions from an analysis method
+    
+    Args:
+        default: Value returned (as a fresh copy) when the method raises
+        message (str): Log prefix for the error
+    """
+    def decorator(method):
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            try:
+                return method(self, *args, **kwargs)
+            except Exception as e:
+                self.logger.error("%s: %s", message, e)
+                return copy.copy(default)
+        return wrapper
+    return decorator
 
 class PhoneIntelligence:
     """Core phone number intelligence and analysis engine"""
     
-    def __init__(self):
-        self.logger = logging.getLogger(__name__)
+    # Shared by all instances; Numverify answers depend on the number, not the key
+    _numverify_cache = TTLCache(maxsize=NUMVERIFY_MEMORY_CACHE_SIZE, ttl=NUMVERIFY_MEMORY_CACHE_TTL)
+    _numverify_cache_lock = threading.Lock()
+    
+    # Method name -> TTLCache of negative lookups, filled by _negative_cached
+    _negative_cache = {}
+    _negative_cache_lock = threading.Lock()
     
-    def analyze_phone_number(self, phone_input):
+    def __init__(self, api_keys=None):
+        """
+        Args:
+            api_keys (ApiKeys): Keys for external lookups; defaults to the environment
+        """
+        self.logger = logging.getLogger(__name__)
+        self.api_keys = api_keys or ApiKeys()
+        # Enrichment is only worth scheduling once at least one provider key is configured
+        self.enrichment_enabled = Config.ENABLE_OSINT_ENRICHMENT and bool(
+            self.api_keys.hibp_api_key or self.api_keys.twilio_account_sid or self.api_keys.numverify_api_key
+        )
+        # Shared session so repeated API calls reuse pooled keep-alive connections
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=HTTP_POOL_CONNECTIONS,
+            pool_maxsize=HTTP_POOL_MAXSIZE,
+            max_retries=Retry(total=2, backoff_factor=0.2)
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        # time.monotonic() deadline set from provider rate-limit headers
+        self.rate_limited_until = 0.0
+        self.api_cache = None
+        if Config.API_CACHE_PATH:
+            try:
+                self.api_cache = ApiResponseCache(Config.API_CACHE_PATH, Config.API_CACHE_TTL)
+            except sqlite3.Error as e:
+                self.logger.error("API cache unavailable: %s", e)
+        # Release the connection pool and SQLite handle once the instance is dropped,
+        # e.g. when the app's resource cache evicts it
+        self._finalizer = weakref.finalize(self, PhoneIntelligence._release, self.session, self.api_cache)
+    
+    @staticmethod
+    def _release(session, api_cache):
+        """Close an instance's HTTP session and disk cache connection"""
+        session.close()
+        if api_cache:
+            api_cache.close()
+    
+    def close(self):
+        """Close the HTTP session and disk cache connection; safe to call more than once"""
+        self._finalizer()
+    
+    def analyze_phone_number(self, phone_input, fresh=False):
         """
         Comprehensive phone number analysis
         
         Args:
             phone_input (str): Phone number in any format
+            fresh (bool): Re-query every lookup instead of reusing cached answers
             
         Returns:
             dict: Analysis results
         """
+        fresh_token = _fresh_lookup.set(fresh)
         try:
             # Parse and validate phone number
             parsed_number = self._parse_phone_number(phone_input)
             if not parsed_number:
                 return {'error': 'Invalid phone number format'}
             
-            # Basic information extraction
-            basic_info = self._extract_basic_info(parsed_number)
-            
-            # Carrier information
-            carrier_info = self._get_carrier_info(parsed_number)
-            
-            # Security analysis
-            security_analysis = self._perform_security_analysis(parsed_number, phone_input)
+            # Library lookups shared by every section
+            derived = _derive(parsed_number)
             
-            # OSINT enrichment
-            osint_data = self._perform_osint_enrichment(parsed_number, phone_input)
+            # The sections are independent and mostly wait on network I/O, so run them concurrently
+            carrier_info_future = _submit(_section_executor, self._get_carrier_info, parsed_number, derived)
+            # Helpers receive the canonical E.164 form, so their caches hit whatever the input formatting
+            security_future = _submit(_section_executor, self._perform_security_analysis, parsed_number, derived, derived.e164)
+            osint_future = (
+                _submit(_section_executor, self._perform_osint_enrichment, parsed_number, derived.e164)
+                if self.enrichment_enabled else None
+            )
+            network_future = _submit(_section_executor, self._get_network_intelligence, parsed_number, derived)
             
-            # Technical details
-            technical_details = self._extract_technical_details(parsed_number)
+            basic_info = self._extract_basic_info(parsed_number, derived)
+            technical_details = self._extract_technical_details(parsed_number, derived)
+            carrier_info = carrier_info_future.result()
+            security_analysis = security_future.result()
+            osint_data = osint_future.result() if osint_future else empty_osint_data()
+            network_intelligence = network_future.result()
             
-            # Network intelligence
-            network_intelligence = self._get_network_intelligence(parsed_number, phone_input)
+            # Enrichment runs alongside the network section, so share its result rather than probing twice
+            if osint_data:
+                osint_data['network_intelligence'] = network_intelligence
             
             # Calculate risk score
             risk_score = self._calculate_risk_score(security_analysis, osint_data)
@@ -66,350 +502,377 @@ class PhoneIntelligence:
             return results
             
         except Exception as e:
-            self.logger.error(f"Analysis error: {str(e)}")
+            self.logger.error("Analysis error: %s", e)
             return {'error': f'Analysis failed: {str(e)}'}
+        finally:
+            _fresh_lookup.reset(fresh_token)
     
-    def _parse_phone_number(self, phone_input):
-        """Parse and validate phone number"""
-        try:
-            # Try parsing with different region hints
-            regions_to_try = ['US', 'GB', 'CA', 'AU', None]
+    async def analyze_phone_number_async(self, phone_input):
+        """
+        Awaitable analyze_phone_number for asyncio servers
+        
+        The analysis runs on a worker thread so the event loop keeps serving
+        other requests while its probes are in flight.
+        
+        Args:
+            phone_input (str): Phone number in any format
             
-            for region in regions_to_try:
-                try:
-                    parsed = phonenumbers.parse(phone_input, region)
-                    if phonenumbers.is_valid_number(parsed):
-                        return parsed
-                except:
-                    continue
+        Returns:
+            dict: Analysis results
+        """
+        return await asyncio.to_thread(self.analyze_phone_number, phone_input)
+    
+    def analyze_phone_numbers(self, inputs, max_workers=16):
+        """
+        Analyze many phone numbers concurrently
+        
+        Each distinct number is analyzed once, and workers wait out any provider
+        rate-limit backoff before starting. Keep max_workers within the
+        Numverify/Twilio quotas of the configured keys.
+        
+        Args:
+            inputs (list): Phone numbers in any format
+            max_workers (int): Maximum analyses in flight at once
             
-            return None
+        Returns:
+            list: Analysis results in the same order as inputs
+        """
+        if not inputs:
+            return []
+        
+        keys = [self.normalize_number(phone_input) or phone_input for phone_input in inputs]
+        unique_keys = list(dict.fromkeys(keys))
+        
+        with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="analysis-batch") as executor:
+            lookup = dict(zip(unique_keys, executor.map(self._analyze_after_backoff, unique_keys)))
+        
+        results = []
+        for phone_input, key in zip(inputs, keys):
+            result = dict(lookup[key])
+            if 'error' not in result:
+                result['input_number'] = phone_input
+            results.append(result)
+        return results
+    
+    def _analyze_after_backoff(self, phone_input):
+        """Analyze once any provider rate-limit backoff has passed"""
+        delay = self.rate_limited_until - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        return self.analyze_phone_number(phone_input)
+    
+    @staticmethod
+    def to_json(results):
+        """
+        Serialize analysis results to JSON
+        
+        Args:
+            results (dict): Output of analyze_phone_number
             
-        except Exception as e:
-            self.logger.error(f"Phone parsing error: {str(e)}")
+        Returns:
+            bytes: UTF-8 encoded JSON, via orjson when it is installed
+        """
+        return dumps_json(results)
+    
+    def normalize_number(self, phone_input):
+        """
+        Normalize a phone number to E.164 format
+        
+        Args:
+            phone_input (str): Phone number in any format
+            
+        Returns:
+            str: E.164 formatted number, or None if it cannot be parsed
+        """
+        parsed_number = self._parse_phone_number(phone_input)
+        if not parsed_number:
             return None
+        return _e164(parsed_number)
+    
+    @_safe(None, "Phone parsing error")
+    def _parse_phone_number(self, phone_input):
+        """Parse and validate phone number"""
+        return parse_phone_number(phone_input)
     
-    def _extract_basic_info(self, parsed_number):
+    @_safe({}, "Basic info extraction error")
+    def _extract_basic_info(self, parsed_number, derived):
         """Extract basic geographic and carrier information"""
-        try:
-            country = geocoder.description_for_number(parsed_number, "en")
-            region = geocoder.description_for_number(parsed_number, "en")
-            carrier_name = carrier.name_for_number(parsed_number, "en")
-            
-            # Get timezone information
-            timezones = timezone.time_zones_for_number(parsed_number)
-            timezone_str = list(timezones)[0] if timezones else "Unknown"
-            
-            # Determine line type
-            number_type = phonenumbers.number_type(parsed_number)
-            line_type = self._get_line_type_description(number_type)
-            
-            return {
-                'country': country or "Unknown",
-                'region': region or "Unknown",
-                'carrier': carrier_name or "Unknown",
-                'line_type': line_type,
-                'timezone': timezone_str,
-                'country_code': parsed_number.country_code
-            }
-            
-        except Exception as e:
-            self.logger.error(f"Basic info extraction error: {str(e)}")
-            return {}
+        # The geocoder has a single description per number, used for both country and region
+        country = derived.country or "Unknown"
+        
+        return {
+            'country': country,
+            'region': country,
+            'carrier': derived.carrier or "Unknown",
+            'line_type': self._get_line_type_description(derived.ntype),
+            'timezone': derived.tz,
+            'country_code': parsed_number.country_code
+        }
     
     def _get_line_type_description(self, number_type):
         """Convert number type enum to human-readable description"""
-        type_map = {
-            phonenumbers.PhoneNumberType.MOBILE: "Mobile",
-            phonenumbers.PhoneNumberType.FIXED_LINE: "Landline",
-            phonenumbers.PhoneNumberType.FIXED_LINE_OR_MOBILE: "Fixed Line or Mobile",
-            phonenumbers.PhoneNumberType.TOLL_FREE: "Toll Free",
-            phonenumbers.PhoneNumberType.PREMIUM_RATE: "Premium Rate",
-            phonenumbers.PhoneNumberType.SHARED_COST: "Shared Cost",
-            phonenumbers.PhoneNumberType.VOIP: "VoIP",
-            phonenumbers.PhoneNumberType.PERSONAL_NUMBER: "Personal Number",
-            phonenumbers.PhoneNumberType.PAGER: "Pager",
-            phonenumbers.PhoneNumberType.UAN: "Universal Access Number",
-            phonenumbers.PhoneNumberType.VOICEMAIL: "Voicemail"
-        }
-        return type_map.get(number_type, "Unknown")
+        return LINE_TYPE_DESCRIPTIONS.get(number_type, "Unknown")
     
-    def _get_carrier_info(self, parsed_number):
+    @_safe({}, "Carrier info error")
+    def _get_carrier_info(self, parsed_number, derived):
         """Get detailed carrier information"""
-        try:
-            carrier_name = carrier.name_for_number(parsed_number, "en")
-            number_type = phonenumbers.number_type(parsed_number)
-            
-            carrier_info = {
-                'name': carrier_name or "Unknown",
-                'type': self._get_line_type_description(number_type),
-                'country': geocoder.description_for_number(parsed_number, "en"),
-                'mobile_country_code': str(parsed_number.country_code),
-                'mobile_network_code': "Unknown"  # Would need additional API for MNC
-            }
-            
-            # Try to get additional carrier info from Numverify API
-            if Config.NUMVERIFY_API_KEY:
-                numverify_data = self._query_numverify_api(parsed_number)
-                if numverify_data:
-                    carrier_info.update(numverify_data)
-            
-            return carrier_info
-            
-        except Exception as e:
-            self.logger.error(f"Carrier info error: {str(e)}")
-            return {}
+        carrier_info = {
+            'name': derived.carrier or "Unknown",
+            'type': self._get_line_type_description(derived.ntype),
+            'country': derived.country,
+            'mobile_country_code': str(parsed_number.country_code),
+            'mobile_network_code': "Unknown"  # Would need additional API for MNC
+        }
+        
+        # Try to get additional carrier info from Numverify API
+        if self.api_keys.numverify_api_key:
+            numverify_data = self._query_numverify_api(parsed_number)
+            if numverify_data:
+                carrier_info.update(numverify_data)
+        
+        return carrier_info
     
-    def _perform_security_analysis(self, parsed_number, phone_input):
+    @_safe({}, "Security analysis error")
+    def _perform_security_analysis(self, parsed_number, derived, e164):
         """Perform security-related analysis"""
-        try:
-            analysis = {
-                'is_spam_risk': False,
-                'is_voip': False,
-                'reputation_score': 50,  # Default neutral score
-                'risk_indicators': []
-            }
-            
-            # Check if it's a VoIP number
-            number_type = phonenumbers.number_type(parsed_number)
-            if number_type == phonenumbers.PhoneNumberType.VOIP:
-                analysis['is_voip'] = True
-                analysis['risk_indicators'].append("VoIP number")
-            
-            # Try Twilio Lookup API for additional security data
-            if Config.TWILIO_ACCOUNT_SID and Config.TWILIO_AUTH_TOKEN:
-                twilio_data = self._query_twilio_lookup(parsed_number)
-                if twilio_data:
-                    analysis.update(twilio_data)
-            
-            # Check against known spam databases (placeholder)
-            spam_check = self._check_spam_databases(phone_input)
-            if spam_check:
-                analysis['is_spam_risk'] = True
-                analysis['risk_indicators'].append("Found in spam database")
-                analysis['reputation_score'] = max(0, analysis['reputation_score'] - 30)
-            
-            return analysis
-            
-        except Exception as e:
-            self.logger.error(f"Security analysis error: {str(e)}")
-            return {}
+        analysis = {
+            'is_spam_risk': False,
+            'is_voip': False,
+            'reputation_score': 50,  # Default neutral score
+            'risk_indicators': []
+        }
+        
+        # Check if it's a VoIP number
+        if derived.ntype == phonenumbers.PhoneNumberType.VOIP:
+            analysis['is_voip'] = True
+            analysis['risk_indicators'].append("VoIP number")
+        
+        # Try Twilio Lookup API for additional security data
+        if self.api_keys.twilio_account_sid and self.api_keys.twilio_auth_token:
+            twilio_data = self._query_twilio_lookup(parsed_number)
+            if twilio_data:
+                analysis.update(twilio_data)
+        
+        # Check against known spam databases (placeholder)
+        spam_check = self._check_spam_databases(e164)
+        if spam_check:
+            analysis['is_spam_risk'] = True
+            analysis['risk_indicators'].append("Found in spam database")
+            analysis['reputation_score'] = max(0, analysis['reputation_score'] - 30)
+        
+        return analysis
     
-    def _perform_osint_enrichment(self, parsed_number, phone_input):
-        """Perform OSINT data enrichment"""
-        try:
-            osint_data = {
-                'breach_data': [],
-                'social_media_presence': {},
-                'additional_intel': {},
-                'network_intelligence': self._get_network_intelligence(parsed_number, phone_input),
-                'digital_footprint': self._get_digital_footprint(phone_input),
-                'associated_emails': self._find_associated_emails(phone_input),
-                'websites': self._find_associated_websites(phone_input),
-                'social_accounts': self._find_social_media_accounts(phone_input)
-            }
-            
-            # Check HaveIBeenPwned for associated breaches
-            if Config.HIBP_API_KEY:
-                breach_data = self._check_hibp_breaches(phone_input)
-                if breach_data:
-                    osint_data['breach_data'] = breach_data
-            
-            # Placeholder for social media lookup
-            # In a real implementation, you would integrate with appropriate APIs
-            social_data = self._check_social_media_presence(phone_input)
-            if social_data:
-                osint_data['social_media_presence'] = social_data
-            
-            return osint_data
-            
-        except Exception as e:
-            self.logger.error(f"OSINT enrichment error: {str(e)}")
-            return {}
+    @_safe({}, "OSINT enrichment error")
+    def _perform_osint_enrichment(self, parsed_number, e164):
+        """Perform OSINT data enrichment, reusing a stored bundle for recently seen numbers"""
+        if not self.api_cache:
+            return self._gather_osint(e164)
+        
+        # Breach results only exist with an HIBP key, so keyed and keyless bundles are stored apart
+        params = {'number': e164, 'version': OSINT_CACHE_VERSION, 'hibp': bool(self.api_keys.hibp_api_key)}
+        osint_data = None if _fresh_lookup.get() else self.api_cache.get('osint', 'enrichment', params)
+        if osint_data is None:
+            incomplete = []
+            incomplete_token = _incomplete_probes.set(incomplete)
+            try:
+                osint_data = self._gather_osint(e164)
+            finally:
+                _incomplete_probes.reset(incomplete_token)
+            # A bundle with failed or timed-out probes is returned but not stored
+            if not incomplete:
+                self.api_cache.set('osint', 'enrichment', params, osint_data, ttl=OSINT_CACHE_TTL)
+        return osint_data
+    
+    def _gather_osint(self, e164):
+        """Run every OSINT lookup for a number and assemble the bundle"""
+        osint_data = {
+            'breach_data': [],
+            'social_media_presence': {},
+            'additional_intel': {},
+            'digital_footprint': self._get_digital_footprint(e164),
+            'associated_emails': self._find_associated_emails(e164),
+            'websites': self._find_associated_websites(e164),
+            'social_accounts': self._find_social_media_accounts(e164)
+        }
+        
+        # Check HaveIBeenPwned for associated breaches
+        if self.api_keys.hibp_api_key:
+            breach_data = self._check_hibp_breaches(e164)
+            if breach_data:
+                osint_data['breach_data'] = breach_data
+        
+        # Placeholder for social media lookup
+        # In a real implementation, you would integrate with appropriate APIs
+        social_data = self._check_social_media_presence(e164)
+        if social_data:
+            osint_data['social_media_presence'] = social_data
+        
+        return osint_data
     
-    def _extract_technical_details(self, parsed_number):
+    @_safe({}, "Technical details error")
+    def _extract_technical_details(self, parsed_number, derived):
         """Extract technical phone number details"""
-        try:
-            return {
-                'international_format': phonenumbers.format_number(
-                    parsed_number, phonenumbers.PhoneNumberFormat.INTERNATIONAL
-                ),
-                'national_format': phonenumbers.format_number(
-                    parsed_number, phonenumbers.PhoneNumberFormat.NATIONAL
-                ),
-                'e164_format': phonenumbers.format_number(
-                    parsed_number, phonenumbers.PhoneNumberFormat.E164
-                ),
-                'country_code': parsed_number.country_code,
-                'national_number': parsed_number.national_number,
-                'number_type': self._get_line_type_description(
-                    phonenumbers.number_type(parsed_number)
-                )
-            }
-            
-        except Exception as e:
-            self.logger.error(f"Technical details error: {str(e)}")
-            return {}
+        return {
+            'international_format': derived.intl,
+            'national_format': derived.natl,
+            'e164_format': derived.e164,
+            'country_code': parsed_number.country_code,
+            'national_number': parsed_number.national_number,
+            'number_type': self._get_line_type_description(derived.ntype)
+        }
     
+    @_safe(50, "Risk calculation error")
     def _calculate_risk_score(self, security_analysis, osint_data):
         """Calculate overall risk score (0-100)"""
-        try:
-            base_score = 20  # Base risk score
-            
-            # Add risk based on security indicators
-            if security_analysis.get('is_spam_risk'):
-                base_score += 40
-            
-            if security_analysis.get('is_voip'):
-                base_score += 20
-            
-            # Add risk based on breach data
-            if osint_data.get('breach_data'):
-                base_score += 30
-            
-            # Adjust based on reputation score
-            reputation = security_analysis.get('reputation_score', 50)
-            if reputation < 30:
-                base_score += 20
-            elif reputation > 70:
-                base_score = max(0, base_score - 10)
-            
-            return min(100, base_score)
-            
-        except Exception as e:
-            self.logger.error(f"Risk calculation error: {str(e)}")
-            return 50
-    
+        return calculate_risk_score(
+            bool(security_analysis.get('is_spam_risk')),
+            bool(security_analysis.get('is_voip')),
+            bool(osint_data.get('breach_data')),
+            security_analysis.get('reputation_score', 50)
+        )
+    
+    @_safe(None, "Numverify API error")
     def _query_numverify_api(self, parsed_number):
         """Query Numverify API for additional carrier information"""
-        try:
-            if not Config.NUMVERIFY_API_KEY:
-                return None
-            
-            phone_str = phonenumbers.format_number(
-                parsed_number, phonenumbers.PhoneNumberFormat.E164
-            )
-            
-            url = f"http://apilayer.net/api/validate"
-            params = {
-                'access_key': Config.NUMVERIFY_API_KEY,
-                'number': phone_str,
-                'country_code': '',
-                'format': 1
-            }
-            
-            response = requests.get(url, params=params, timeout=10)
-            if response.status_code == 200:
-                data = response.json()
-                if data.get('valid'):
-                    return {
-                        'carrier': data.get('carrier', 'Unknown'),
-                        'line_type': data.get('line_type', 'Unknown'),
-                        'location': data.get('location', 'Unknown')
-                    }
-            
-            return None
-            
-        except Exception as e:
-            self.logger.error(f"Numverify API error: {str(e)}")
+        if not self.api_keys.numverify_api_key:
             return None
+        
+        phone_str = _e164(parsed_number)
+        
+        # Numverify's free plan rejects HTTPS (error 105, https_access_restricted)
+        url = "http://apilayer.net/api/validate"
+        params = {
+            'access_key': self.api_keys.numverify_api_key,
+            'number': phone_str,
+            'country_code': '',
+            'format': 1
+        }
+        
+        # Fresh analyses skip both caches but still refresh them below
+        fresh = _fresh_lookup.get()
+        data = None
+        if not fresh:
+            with self._numverify_cache_lock:
+                data = self._numverify_cache.get(phone_str)
+        if data is None:
+            if self.api_cache and not fresh:
+                data = self.api_cache.get('apilayer.net', '/api/validate', params)
+            if data is None:
+                response = self.session.get(url, params=params, timeout=10)
+                self._record_rate_limit(response)
+                if response.status_code != 200:
+                    return None
+                data = response.json()
+                # Numverify reports quota/auth failures with HTTP 200, so only cache real lookups
+                if 'error' in data:
+                    return None
+                if self.api_cache:
+                    self.api_cache.set('apilayer.net', '/api/validate', params, data)
+            # Only new entries go in: re-setting a memory hit would restart its TTL
+            with self._numverify_cache_lock:
+                self._numverify_cache[phone_str] = data
+        
+        if data.get('valid'):
+            return {
+                'carrier': data.get('carrier', 'Unknown'),
+                'line_type': data.get('line_type', 'Unknown'),
+                'location': data.get('location', 'Unknown')
+            }
+        
+        return None
+    
+    def _record_rate_limit(self, response):
+        """Back off batch requests when a provider reports its rate limit is exhausted"""
+        remaining = response.headers.get('X-RateLimit-Remaining')
+        if response.status_code != 429 and remaining != '0':
+            return
+        
+        try:
+            delay = float(response.headers.get('Retry-After', 5))
+        except ValueError:
+            delay = 5.0
+        
+        self.rate_limited_until = max(self.rate_limited_until, time.monotonic() + delay)
+        self.logger.warning("Provider rate limit reached, backing off for %.0fs", delay)
     
+    @_safe(None, "Twilio lookup error")
     def _query_twilio_lookup(self, parsed_number):
         """Query Twilio Lookup API for security information"""
-        try:
-            if not (Config.TWILIO_ACCOUNT_SID and Config.TWILIO_AUTH_TOKEN):
-                return None
-            
-            # Placeholder for Twilio Lookup API integration
-            # In a real implementation, you would use the Twilio SDK
-            return {
-                'reputation_score': 60,  # Placeholder
-                'spam_risk': False
-            }
-            
-        except Exception as e:
-            self.logger.error(f"Twilio lookup error: {str(e)}")
+        if not (self.api_keys.twilio_account_sid and self.api_keys.twilio_auth_token):
             return None
+        
+        # Placeholder for Twilio Lookup API integration
+        # In a real implementation, you would use the Twilio SDK
+        return {
+            'reputation_score': 60,  # Placeholder
+            'spam_risk': False
+        }
     
-    def _check_spam_databases(self, phone_input):
+    @_safe(False, "Spam check error")
+    @_negative_cached
+    def _check_spam_databases(self, e164):
         """Check phone number against spam databases"""
-        try:
-            # Placeholder for spam database checks
-            # In a real implementation, you would integrate with spam databases
-            return False
-            
-        except Exception as e:
-            self.logger.error(f"Spam check error: {str(e)}")
-            return False
+        # Placeholder for spam database checks
+        # In a real implementation, you would integrate with spam databases
+        return False
     
-    def _check_hibp_breaches(self, phone_input):
+    @_safe([], "HIBP check error")
+    @_negative_cached(per_key_set=True)
+    def _check_hibp_breaches(self, e164):
         """Check HaveIBeenPwned for associated breaches"""
-        try:
-            if not Config.HIBP_API_KEY:
-                return []
-            
-            # Placeholder for HIBP API integration
-            # Note: HIBP doesn't directly support phone number lookups
-            # This would require finding associated email addresses first
-            return []
-            
-        except Exception as e:
-            self.logger.error(f"HIBP check error: {str(e)}")
+        if not self.api_keys.hibp_api_key:
             return []
+        
+        # Placeholder for HIBP API integration
+        # Note: HIBP doesn't directly support phone number lookups
+        # This would require finding associated email addresses first
+        return []
     
-    def _check_social_media_presence(self, phone_input):
+    @_safe({}, "Social media check error")
+    def _check_social_media_presence(self, e164):
         """Check for social media presence (placeholder)"""
-        try:
-            # Placeholder for social media lookup
-            # In a real implementation, you would need to comply with
-            # each platform's terms of service and API usage policies
-            return {}
-            
-        except Exception as e:
-            self.logger.error(f"Social media check error: {str(e)}")
-            return {}
+        # Placeholder for social media lookup
+        # In a real implementation, you would need to comply with
+        # each platform's terms of service and API usage policies
+        return {}
     
-    def _get_network_intelligence(self, parsed_number, phone_input):
+    @_safe({}, "Network intelligence error")
+    def _get_network_intelligence(self, parsed_number, derived):
         """Gather network intelligence and attempt real IP detection"""
-        try:
-            network_data = {
-                'carrier_network_info': {},
-                'potential_ip_ranges': [],
-                'network_status': 'Offline',  # Default to offline
-                'online_indicators': [],
-                'network_security': {},
-                'real_time_ip': None,  # Added real-time IP field
-                'connection_status': 'Unknown',  # Added connection status
-                'last_seen': None  # Added last seen timestamp
-            }
-            
-            # Get carrier network information
-            carrier_network = self._get_carrier_network_info(parsed_number)
-            if carrier_network:
-                network_data['carrier_network_info'] = carrier_network
-            
-            # Attempt to find associated IP ranges for the carrier
-            ip_ranges = self._get_carrier_ip_ranges(parsed_number)
-            if ip_ranges:
-                network_data['potential_ip_ranges'] = ip_ranges
-            
-            online_status = self._detect_online_status(phone_input, parsed_number)
-            if online_status:
-                network_data.update(online_status)
-            
-            # Network security assessment
-            network_security = self._assess_network_security(parsed_number)
-            if network_security:
-                network_data['network_security'] = network_security
-            
-            return network_data
-            
-        except Exception as e:
-            self.logger.error(f"Network intelligence error: {str(e)}")
-            return {}
+        network_data = {
+            'carrier_network_info': {},
+            'potential_ip_ranges': [],
+            'network_status': 'Offline',  # Default to offline
+            'online_indicators': [],
+            'network_security': {},
+            'real_time_ip': None,  # Added real-time IP field
+            'connection_status': 'Unknown',  # Added connection status
+            'last_seen': None  # Added last seen timestamp
+        }
+        
+        # Get carrier network information
+        carrier_network = self._get_carrier_network_info(parsed_number, derived)
+        if carrier_network:
+            network_data['carrier_network_info'] = carrier_network
+        
+        # Attempt to find associated IP ranges for the carrier
+        ip_ranges = self._get_carrier_ip_ranges(derived)
+        if ip_ranges:
+            network_data['potential_ip_ranges'] = ip_ranges
+        
+        online_status = self._detect_online_status(derived.e164, parsed_number, derived)
+        if online_status:
+            network_data.update(online_status)
+        
+        # Network security assessment
+        network_security = self._assess_network_security(parsed_number, derived)
+        if network_security:
+            network_data['network_security'] = network_security
+        
+        return network_data
     
 
-    def _detect_online_status(self, phone_input, parsed_number):
+    def _detect_online_status(self, e164, parsed_number, derived):
         """Enhanced online status detection with real-time monitoring capabilities"""
         try:
             online_status = {
@@ -425,12 +888,12 @@ class PhoneIntelligence:
             
             
             # Method 1: Check messaging app status (WhatsApp, Telegram, etc.)
-            messaging_status = self._check_messaging_app_status(phone_input)
+            messaging_status = self._check_messaging_app_status(e164)
             if messaging_status:
                 online_status.update(messaging_status)
             
             # Method 2: Social media activity detection
-            social_activity = self._check_recent_social_activity(phone_input)
+            social_activity = self._check_recent_social_activity(e164)
             if social_activity:
                 online_status['device_activity']['social_media'] = social_activity
                 if social_activity.get('recent_activity'):
@@ -438,19 +901,19 @@ class PhoneIntelligence:
                     online_status['last_seen'] = social_activity.get('last_activity_time')
             
             # Method 3: Network carrier status (if available)
-            carrier_status = self._check_carrier_network_status(parsed_number)
+            carrier_status = self._check_carrier_network_status(derived)
             if carrier_status:
                 online_status.update(carrier_status)
             
             # Method 4: VoIP service detection
-            voip_status = self._check_voip_services(phone_input)
+            voip_status = self._check_voip_services(e164)
             if voip_status:
                 online_status['device_activity']['voip'] = voip_status
                 if voip_status.get('active'):
                     online_status['online_indicators'].append('VoIP service active')
             
             # Method 5: Business listing activity
-            business_activity = self._check_business_activity(phone_input)
+            business_activity = self._check_business_activity(e164)
             if business_activity:
                 online_status['device_activity']['business'] = business_activity
             
@@ -468,314 +931,308 @@ class PhoneIntelligence:
             return online_status
             
         except Exception as e:
-            self.logger.error(f"Online status detection error: {str(e)}")
+            self.logger.error("Online status detection error: %s", e)
             return {
                 'network_status': 'Error',
                 'connection_status': 'Unknown',
                 'error': str(e)
             }
     
-    def _check_messaging_app_status(self, phone_input):
+    def _run_probes(self, probes, *args, fallback=dict):
+        """
+        Run independent status probes concurrently
+        
+        Args:
+            probes (tuple): (result key, unbound probe method) pairs
+            *args: Arguments passed to every probe after self
+            fallback (callable): Builds the result for a failed probe
+            
+        Returns:
+            dict: Probe results in the order given; probes that fail or run
+                  longer than PROBE_TIMEOUT map to fallback()
+        """
+        # Time spent queued behind other analyses' probes doesn't count against the timeout
+        started = {}
+        
+        def timed(name, probe):
+            started[name] = time.monotonic()
+            return probe(self, *args)
+        
+        futures = {name: _submit(_probe_executor, timed, name, probe) for name, probe in probes}
+        pending = dict(futures)
+        while pending:
+            now = time.monotonic()
+            deadlines = {name: started[name] + PROBE_TIMEOUT for name in pending if name in started}
+            for name, deadline in deadlines.items():
+                if deadline <= now:
+                    del pending[name]
+            if not pending:
+                break
+            
+            # Wake for the next completion or the nearest deadline; queued probes have none yet
+            running_deadlines = [deadline for name, deadline in deadlines.items() if name in pending]
+            timeout = min(running_deadlines) - now if running_deadlines else PROBE_TIMEOUT
+            wait(pending.values(), timeout=timeout, return_when=FIRST_COMPLETED)
+            pending = {name: future for name, future in pending.items() if not future.done()}
+        
+        incomplete = _incomplete_probes.get()
+        results = {}
+        for name, future in futures.items():
+            if future.done() and not future.exception():
+                results[name] = future.result()
+            else:
+                future.cancel()
+                self.logger.warning("Probe %s failed or timed out", name)
+                results[name] = fallback()
+                if incomplete is not None:
+                    incomplete.append(name)
+        return results
+    
+    @_safe({}, "Messaging app status error")
+    def _check_messaging_app_status(self, e164):
         """Check messaging app online status"""
-        try:
-            messaging_status = {
-                'whatsapp': self._check_whatsapp_status(phone_input),
-                'telegram': self._check_telegram_status(phone_input),
-                'signal': self._check_signal_status(phone_input),
-                'viber': self._check_viber_status(phone_input)
+        messaging_status = self._run_probes(self.MESSAGING_PROBES, e164)
+        
+        # Determine if any messaging app shows online status
+        online_apps = []
+        for app, status in messaging_status.items():
+            if status and status.get('online'):
+                online_apps.append(app)
+        
+        if online_apps:
+            return {
+                'connection_status': 'Online via messaging',
+                'online_indicators': [f'{app} active' for app in online_apps],
+                'messaging_apps': messaging_status
             }
-            
-            # Determine if any messaging app shows online status
-            online_apps = []
-            for app, status in messaging_status.items():
-                if status and status.get('online'):
-                    online_apps.append(app)
-            
-            if online_apps:
-                return {
-                    'connection_status': 'Online via messaging',
-                    'online_indicators': [f'{app} active' for app in online_apps],
-                    'messaging_apps': messaging_status
-                }
-            
-            return {'messaging_apps': messaging_status}
-            
-        except Exception as e:
-            self.logger.error(f"Messaging app status error: {str(e)}")
-            return {}
+        
+        return {'messaging_apps': messaging_status}
     
-    def _check_whatsapp_status(self, phone_input):
+    @_negative_cached
+    def _check_whatsapp_status(self, e164):
         """Check WhatsApp online status (ethical methods only)"""
-        try:
-            # This would use WhatsApp Business API or public business profiles
-            # Note: Personal WhatsApp status checking would violate privacy
-            return {
-                'registered': False,  # Placeholder
-                'business_account': False,
-                'last_seen': None,
-                'online': False
-            }
-        except:
-            return {}
+        # This would use WhatsApp Business API or public business profiles
+        # Note: Personal WhatsApp status checking would violate privacy
+        return {
+            'registered': False,  # Placeholder
+            'business_account': False,
+            'last_seen': None,
+            'online': False
+        }
     
-    def _check_telegram_status(self, phone_input):
+    @_negative_cached
+    def _check_telegram_status(self, e164):
         """Check Telegram status for public profiles"""
-        try:
-            # Only check public Telegram profiles/channels
-            return {
-                'public_profile': False,
-                'username': None,
-                'last_seen': None,
-                'online': False
-            }
-        except:
-            return {}
+        # Only check public Telegram profiles/channels
+        return {
+            'public_profile': False,
+            'username': None,
+            'last_seen': None,
+            'online': False
+        }
     
-    def _check_signal_status(self, phone_input):
+    @_negative_cached
+    def _check_signal_status(self, e164):
         """Check Signal status (very limited due to privacy focus)"""
-        try:
-            # Signal prioritizes privacy, very limited public information
-            return {
-                'registered': False,
-                'online': False
-            }
-        except:
-            return {}
+        # Signal prioritizes privacy, very limited public information
+        return {
+            'registered': False,
+            'online': False
+        }
     
-    def _check_viber_status(self, phone_input):
+    @_negative_cached
+    def _check_viber_status(self, e164):
         """Check Viber public account status"""
-        try:
-            # Check for Viber public accounts/business profiles
-            return {
-                'public_account': False,
-                'business_profile': False,
-                'online': False
-            }
-        except:
-            return {}
+        # Check for Viber public accounts/business profiles
+        return {
+            'public_account': False,
+            'business_profile': False,
+            'online': False
+        }
     
-    def _check_recent_social_activity(self, phone_input):
+    # Messaging apps checked by _check_messaging_app_status
+    MESSAGING_PROBES = (
+        ('whatsapp', _check_whatsapp_status),
+        ('telegram', _check_telegram_status),
+        ('signal', _check_signal_status),
+        ('viber', _check_viber_status)
+    )
+    
+    @_safe({}, "Social activity check error")
+    def _check_recent_social_activity(self, e164):
         """Check for recent social media activity"""
-        try:
-            # This would check public social media posts/activity
-            # Only public information that's already accessible
-            
-            activity_data = {
-                'recent_activity': False,
-                'last_activity_time': None,
-                'platforms_active': [],
-                'activity_score': 0
-            }
-            
-            # Check various platforms for recent public activity
-            platforms = ['facebook', 'twitter', 'instagram', 'linkedin', 'tiktok']
-            
-            for platform in platforms:
-                platform_activity = self._check_platform_activity(phone_input, platform)
-                if platform_activity and platform_activity.get('recent'):
-                    activity_data['platforms_active'].append(platform)
-                    activity_data['recent_activity'] = True
-                    activity_data['activity_score'] += 1
-                    
-                    # Update last activity time if more recent
-                    if platform_activity.get('timestamp'):
-                        if not activity_data['last_activity_time'] or platform_activity['timestamp'] > activity_data['last_activity_time']:
-                            activity_data['last_activity_time'] = platform_activity['timestamp']
-            
-            return activity_data
-            
-        except Exception as e:
-            self.logger.error(f"Social activity check error: {str(e)}")
-            return {}
+        # This would check public social media posts/activity
+        # Only public information that's already accessible
+        
+        activity_data = {
+            'recent_activity': False,
+            'last_activity_time': None,
+            'platforms_active': [],
+            'activity_score': 0
+        }
+        
+        # Check various platforms for recent public activity
+        platform_results = self._run_probes(self.PLATFORM_PROBES, e164)
+        
+        for platform, platform_activity in platform_results.items():
+            if platform_activity and platform_activity.get('recent'):
+                activity_data['platforms_active'].append(platform)
+                activity_data['recent_activity'] = True
+                activity_data['activity_score'] += 1
+                
+                # Update last activity time if more recent
+                if platform_activity.get('timestamp'):
+                    if not activity_data['last_activity_time'] or platform_activity['timestamp'] > activity_data['last_activity_time']:
+                        activity_data['last_activity_time'] = platform_activity['timestamp']
+        
+        return activity_data
     
-    def _check_platform_activity(self, phone_input, platform):
+    def _check_platform_activity(self, e164, platform):
         """Check activity on a specific platform"""
-        try:
-            # This would use platform APIs to check for recent public activity
-            # Placeholder implementation
-            return {
-                'recent': False,
-                'timestamp': None,
-                'activity_type': None
-            }
-        except:
-            return {}
+        # This would use platform APIs to check for recent public activity
+        # Placeholder implementation
+        return {
+            'recent': False,
+            'timestamp': None,
+            'activity_type': None
+        }
     
-    def _check_carrier_network_status(self, parsed_number):
+    # Platforms checked by _check_recent_social_activity
+    PLATFORM_PROBES = (
+        ('facebook', partial(_check_platform_activity, platform='facebook')),
+        ('twitter', partial(_check_platform_activity, platform='twitter')),
+        ('instagram', partial(_check_platform_activity, platform='instagram')),
+        ('linkedin', partial(_check_platform_activity, platform='linkedin')),
+        ('tiktok', partial(_check_platform_activity, platform='tiktok'))
+    )
+    
+    @_safe({}, "Carrier status check error")
+    def _check_carrier_network_status(self, derived):
         """Check carrier network status"""
-        try:
-            carrier_name = carrier.name_for_number(parsed_number, "en")
-            
-            # This would integrate with carrier APIs (where available)
-            # Most carriers don't provide real-time status for privacy reasons
-            
-            return {
-                'carrier_status': 'Unknown',
-                'network_available': True,  # Assume network is available
-                'roaming_status': 'Unknown'
-            }
-            
-        except Exception as e:
-            self.logger.error(f"Carrier status check error: {str(e)}")
-            return {}
+        # This would integrate with carrier APIs (where available)
+        # Most carriers don't provide real-time status for privacy reasons
+        
+        return {
+            'carrier_status': 'Unknown',
+            'network_available': True,  # Assume network is available
+            'roaming_status': 'Unknown'
+        }
     
-    def _check_voip_services(self, phone_input):
+    @_safe({}, "VoIP services check error")
+    def _check_voip_services(self, e164):
         """Check VoIP service activity"""
-        try:
-            voip_data = {
-                'skype': self._check_skype_status(phone_input),
-                'google_voice': self._check_google_voice_status(phone_input),
-                'discord': self._check_discord_voice_status(phone_input),
-                'zoom': self._check_zoom_status(phone_input),
-                'active': False
-            }
-            
-            # Check if any VoIP service is active
-            for service, status in voip_data.items():
-                if service != 'active' and status and status.get('online'):
-                    voip_data['active'] = True
-                    break
-            
-            return voip_data
-            
-        except Exception as e:
-            self.logger.error(f"VoIP services check error: {str(e)}")
-            return {}
+        voip_data = self._run_probes(self.VOIP_PROBES, e164)
+        voip_data['active'] = False
+        
+        # Check if any VoIP service is active
+        for service, status in voip_data.items():
+            if service != 'active' and status and status.get('online'):
+                voip_data['active'] = True
+                break
+        
+        return voip_data
     
-    def _check_skype_status(self, phone_input):
+    @_negative_cached
+    def _check_skype_status(self, e164):
         """Check Skype status"""
-        try:
-            # Check for public Skype profiles
-            return {'online': False, 'username': None}
-        except:
-            return {}
+        # Check for public Skype profiles
+        return {'online': False, 'username': None}
     
-    def _check_google_voice_status(self, phone_input):
+    @_negative_cached
+    def _check_google_voice_status(self, e164):
         """Check Google Voice status"""
-        try:
-            # Limited public information available
-            return {'active': False}
-        except:
-            return {}
+        # Limited public information available
+        return {'active': False}
     
-    def _check_discord_voice_status(self, phone_input):
+    @_negative_cached
+    def _check_discord_voice_status(self, e164):
         """Check Discord voice activity"""
-        try:
-            # Check for public Discord servers/activity
-            return {'online': False, 'servers': []}
-        except:
-            return {}
+        # Check for public Discord servers/activity
+        return {'online': False, 'servers': []}
     
-    def _check_zoom_status(self, phone_input):
+    @_negative_cached
+    def _check_zoom_status(self, e164):
         """Check Zoom meeting activity"""
-        try:
-            # Check for public Zoom webinars/meetings
-            return {'in_meeting': False, 'public_meetings': []}
-        except:
-            return {}
-    
-    def _check_business_activity(self, phone_input):
+        # Check for public Zoom webinars/meetings
+        return {'in_meeting': False, 'public_meetings': []}
+    
+    # VoIP services checked by _check_voip_services
+    VOIP_PROBES = (
+        ('skype', _check_skype_status),
+        ('google_voice', _check_google_voice_status),
+        ('discord', _check_discord_voice_status),
+        ('zoom', _check_zoom_status)
+    )
+    
+    @_safe({}, "Business activity check error")
+    def _check_business_activity(self, e164):
         """Check business-related activity"""
-        try:
-            business_data = {
-                'google_my_business': self._check_google_business(phone_input),
-                'yelp_activity': self._check_yelp_activity(phone_input),
-                'website_activity': self._check_website_activity(phone_input),
-                'recent_reviews': self._check_recent_reviews(phone_input)
-            }
-            
-            return business_data
-            
-        except Exception as e:
-            self.logger.error(f"Business activity check error: {str(e)}")
-            return {}
+        return self._run_probes(self.BUSINESS_PROBES, e164)
     
-    def _check_google_business(self, phone_input):
+    def _check_google_business(self, e164):
         """Check Google My Business activity"""
-        try:
-            # Check for Google My Business listings and recent updates
-            return {'listed': False, 'recent_updates': False}
-        except:
-            return {}
+        # Check for Google My Business listings and recent updates
+        return {'listed': False, 'recent_updates': False}
     
-    def _check_yelp_activity(self, phone_input):
+    def _check_yelp_activity(self, e164):
         """Check Yelp business activity"""
-        try:
-            # Check for Yelp business profiles and recent activity
-            return {'business_profile': False, 'recent_activity': False}
-        except:
-            return {}
+        # Check for Yelp business profiles and recent activity
+        return {'business_profile': False, 'recent_activity': False}
     
-    def _check_website_activity(self, phone_input):
+    def _check_website_activity(self, e164):
         """Check website activity for businesses"""
-        try:
-            # Check if business websites are active/updated
-            return {'websites_found': [], 'recent_updates': False}
-        except:
-            return {}
+        # Check if business websites are active/updated
+        return {'websites_found': [], 'recent_updates': False}
     
-    def _check_recent_reviews(self, phone_input):
+    def _check_recent_reviews(self, e164):
         """Check for recent business reviews"""
-        try:
-            # Check various review platforms for recent reviews
-            return {'recent_reviews': False, 'platforms': []}
-        except:
-            return {}
-    
+        # Check various review platforms for recent reviews
+        return {'recent_reviews': False, 'platforms': []}
+    
+    # Listing and review sources checked by _check_business_activity
+    BUSINESS_PROBES = (
+        ('google_my_business', _check_google_business),
+        ('yelp_activity', _check_yelp_activity),
+        ('website_activity', _check_website_activity),
+        ('recent_reviews', _check_recent_reviews)
+    )
+    
+    @_safe({}, "Network probe error")
     def _perform_network_probe(self, parsed_number):
         """Perform ethical network probing"""
-        try:
-            # Only use ethical, legal methods for network detection
-            probe_data = {
-                'ping_response': False,
-                'port_scan_results': {},
-                'network_latency': None,
-                'connection_quality': 'Unknown'
-            }
-            
-            # Note: Actual network probing should only be done with proper authorization
-            # This is a placeholder for demonstration
-            
-            return probe_data
-            
-        except Exception as e:
-            self.logger.error(f"Network probe error: {str(e)}")
-            return {}
+        # Only use ethical, legal methods for network detection
+        probe_data = {
+            'ping_response': False,
+            'port_scan_results': {},
+            'network_latency': None,
+            'connection_quality': 'Unknown'
+        }
+        
+        # Note: Actual network probing should only be done with proper authorization
+        # This is a placeholder for demonstration
+        
+        return probe_data
     
+    @_safe('Unknown', "Overall status error")
     def _determine_overall_status(self, status_data):
         """Determine overall online status from collected data"""
-        try:
-            online_indicators = status_data.get('online_indicators', [])
-            
-            if len(online_indicators) >= 2:
-                return 'Online'
-            elif len(online_indicators) == 1:
-                return 'Recently Online'
-            elif status_data.get('messaging_apps'):
-                # Check if any messaging app shows activity
-                for app_data in status_data['messaging_apps'].values():
-                    if app_data and app_data.get('online'):
-                        return 'Online via messaging'
-            
-            return 'Offline'
-            
-        except:
-            return 'Unknown'
+        # Check if any messaging app shows activity
+        messaging_online = any(
+            app_data and app_data.get('online')
+            for app_data in (status_data.get('messaging_apps') or {}).values()
+        )
+        return determine_overall_status(len(status_data.get('online_indicators', [])), messaging_online)
 
-    def _check_social_media_activity(self, phone_input):
+    @_safe(False, "Social media activity check error")
+    def _check_social_media_activity(self, e164):
         """Check for social media activity associated with phone number"""
-        try:
-            # This would check publicly available social media profiles
-            # that are linked to phone numbers (with proper permissions)
-            
-            # Placeholder implementation for demonstration
-            # In reality, this would use legitimate social media APIs
-            
-            return False  # No social media activity detected
-            
-        except Exception as e:
-            self.logger.error(f"Social media activity check error: {str(e)}")
-            return False
+        # This would check publicly available social media profiles
+        # that are linked to phone numbers (with proper permissions)
+        
+        # Placeholder implementation for demonstration
+        # In reality, this would use legitimate social media APIs
+        
+        return False  # No social media activity detected
 
     
     def _check_carrier_public_status(self, carrier_name, country_code):
@@ -783,556 +1240,355 @@ class PhoneIntelligence:
         # Placeholder implementation
         return None
     
-    def _get_carrier_network_info(self, parsed_number):
+    @_safe({}, "Carrier network info error")
+    def _get_carrier_network_info(self, parsed_number, derived):
         """Get detailed carrier network information"""
-        try:
-            carrier_name = carrier.name_for_number(parsed_number, "en")
-            country = geocoder.description_for_number(parsed_number, "en")
-            number_type = phonenumbers.number_type(parsed_number)
-            
-            network_info = {
-                'carrier_name': carrier_name or "Unknown",
-                'network_type': self._get_line_type_description(number_type),
-                'country': country or "Unknown",
-                'mcc': str(parsed_number.country_code),  # Mobile Country Code
-                'mnc': "Unknown",  # Mobile Network Code - would need additional API
-                'network_technology': self._detect_network_technology(parsed_number),
-                'roaming_partners': self._get_roaming_partners(carrier_name),
-                'network_coverage': self._get_network_coverage(carrier_name, country)
-            }
-            
-            return network_info
-            
-        except Exception as e:
-            self.logger.error(f"Carrier network info error: {str(e)}")
-            return {}
+        network_info = {
+            'carrier_name': derived.carrier or "Unknown",
+            'network_type': self._get_line_type_description(derived.ntype),
+            'country': derived.country or "Unknown",
+            'mcc': str(parsed_number.country_code),  # Mobile Country Code
+            'mnc': "Unknown",  # Mobile Network Code - would need additional API
+            'network_technology': self._detect_network_technology(derived.ntype),
+            'roaming_partners': self._get_roaming_partners(derived.carrier_key),
+            'network_coverage': self._get_network_coverage(derived.carrier_key, derived.country)
+        }
+        
+        return network_info
     
-    def _get_carrier_ip_ranges(self, parsed_number):
+    @_safe([], "Carrier IP ranges error")
+    def _get_carrier_ip_ranges(self, derived):
         """Get potential IP ranges for the carrier"""
-        try:
-            carrier_name = carrier.name_for_number(parsed_number, "en")
-            country = geocoder.description_for_number(parsed_number, "en")
-            
-            # This would use public IP allocation databases
-            ip_ranges = []
-            
-            # Example IP ranges for major carriers (publicly available information)
-            carrier_ip_map = {
-                'Verizon': ['74.192.0.0/10', '108.160.0.0/11'],
-                'AT&T': ['12.0.0.0/8', '135.0.0.0/8'],
-                'T-Mobile': ['208.54.0.0/16', '66.94.0.0/16'],
-                'Sprint': ['72.52.0.0/15', '173.199.0.0/16']
-            }
-            
-            if carrier_name in carrier_ip_map:
-                ip_ranges = carrier_ip_map[carrier_name]
-            else:
-                # Generic mobile carrier ranges by country
-                country_ranges = self._get_country_mobile_ranges(country)
-                if country_ranges:
-                    ip_ranges = country_ranges
-            
-            return ip_ranges
-            
-        except Exception as e:
-            self.logger.error(f"Carrier IP ranges error: {str(e)}")
-            return []
+        # This would use public IP allocation databases
+        networks = CARRIER_IP_RANGES.get(derived.carrier_key)
+        if networks:
+            return [str(network) for network in networks]
+        
+        # Generic mobile carrier ranges by country
+        return self._get_country_mobile_ranges(derived.country)
     
-    def _assess_network_security(self, parsed_number):
+    @_safe({}, "Network security assessment error")
+    def _assess_network_security(self, parsed_number, derived):
         """Assess network security characteristics"""
-        try:
-            security_assessment = {
-                'encryption_support': 'Unknown',
-                'network_security_level': 'Standard',
-                'vulnerability_indicators': [],
-                'security_score': 50,  # Default neutral score
-                'security_features': []
-            }
-            
-            number_type = phonenumbers.number_type(parsed_number)
-            carrier_name = carrier.name_for_number(parsed_number, "en")
-            
-            # Assess based on line type
-            if number_type == phonenumbers.PhoneNumberType.VOIP:
-                security_assessment['vulnerability_indicators'].append('VoIP - potential for spoofing')
-                security_assessment['security_score'] -= 10
-            elif number_type == phonenumbers.PhoneNumberType.MOBILE:
-                security_assessment['security_features'].append('Mobile network encryption')
-                security_assessment['security_score'] += 10
-            
-            # Assess based on carrier security reputation
-            if carrier_name:
-                carrier_security = self._get_carrier_security_rating(carrier_name)
-                security_assessment.update(carrier_security)
-            
-            # Check for known security issues
-            security_issues = self._check_known_security_issues(parsed_number)
-            if security_issues:
-                security_assessment['vulnerability_indicators'].extend(security_issues)
-                security_assessment['security_score'] -= len(security_issues) * 5
-            
-            # Ensure score stays within bounds
-            security_assessment['security_score'] = max(0, min(100, security_assessment['security_score']))
-            
-            return security_assessment
-            
-        except Exception as e:
-            self.logger.error(f"Network security assessment error: {str(e)}")
-            return {}
+        # Line type and carrier findings are shared by every number on that carrier
+        baseline = network_security_baseline(derived.ntype, derived.carrier_key)
+        security_assessment = {
+            **baseline,
+            'vulnerability_indicators': list(baseline['vulnerability_indicators']),
+            'security_features': list(baseline['security_features'])
+        }
+        
+        # Check for known security issues
+        security_issues = self._check_known_security_issues(parsed_number)
+        if security_issues:
+            security_assessment['vulnerability_indicators'].extend(security_issues)
+            security_assessment['security_score'] -= len(security_issues) * 5
+        
+        # Ensure score stays within bounds
+        security_assessment['security_score'] = max(0, min(100, security_assessment['security_score']))
+        
+        return security_assessment
     
-    def _detect_network_technology(self, parsed_number):
+    def _detect_network_technology(self, number_type):
         """Detect network technology (2G, 3G, 4G, 5G)"""
-        try:
-            # This would typically require real-time network probing
-            # For now, return based on number type and carrier
-            number_type = phonenumbers.number_type(parsed_number)
-            
-            if number_type == phonenumbers.PhoneNumberType.MOBILE:
-                return "4G/5G (estimated)"
-            elif number_type == phonenumbers.PhoneNumberType.VOIP:
-                return "Internet/VoIP"
-            else:
-                return "Unknown"
-                
-        except:
-            return "Unknown"
+        return NETWORK_TECHNOLOGIES.get(number_type, "Unknown")
     
-    def _get_roaming_partners(self, carrier_name):
+    @_safe([], "Roaming partner lookup error")
+    def _get_roaming_partners(self, carrier_key):
         """Get roaming partner information"""
-        try:
-            # This would use carrier partnership databases
-            # Placeholder implementation
-            return ["International roaming available"]
-        except:
-            return []
+        return list(roaming_partners(carrier_key))
     
-    def _get_network_coverage(self, carrier_name, country):
+    @_safe('Unknown coverage', "Network coverage lookup error")
+    def _get_network_coverage(self, carrier_key, country):
         """Get network coverage information"""
-        try:
-            # This would use coverage databases
-            # Placeholder implementation
-            return f"Coverage in {country}"
-        except:
-            return "Unknown coverage"
+        return network_coverage(carrier_key, country)
     
+    @_safe([], "Country mobile range lookup error")
     def _get_country_mobile_ranges(self, country):
         """Get mobile IP ranges for a country"""
-        try:
-            # This would use public IP allocation databases
-            # Placeholder implementation
-            country_ranges = {
-                'United States': ['10.0.0.0/8', '172.16.0.0/12'],
-                'United Kingdom': ['192.168.0.0/16'],
-                'Canada': ['10.0.0.0/8']
-            }
-            return country_ranges.get(country, [])
-        except:
-            return []
-    
-    def _get_carrier_security_rating(self, carrier_name):
-        """Get carrier security rating"""
-        try:
-            # This would use security rating databases
-            # Placeholder implementation
-            return {
-                'encryption_support': 'Standard',
-                'security_features': ['Network encryption', 'Authentication'],
-                'security_score': 60
-            }
-        except:
-            return {}
+        # This would use public IP allocation databases
+        # Placeholder implementation
+        return [str(network) for network in COUNTRY_MOBILE_RANGES.get((country or "").lower(), ())]
     
     def _check_known_security_issues(self, parsed_number):
         """Check for known security issues"""
-        try:
-            # This would check security vulnerability databases
-            # Placeholder implementation
-            return []
-        except:
-            return []
+        # This would check security vulnerability databases
+        # Placeholder implementation
+        return []
     
-    def _get_digital_footprint(self, phone_input):
+    @_safe({}, "Digital footprint error")
+    def _get_digital_footprint(self, e164):
         """Get comprehensive digital footprint for the phone number"""
-        try:
-            footprint = {
-                'search_engines': self._search_engines_lookup(phone_input),
-                'public_records': self._check_public_records(phone_input),
-                'business_listings': self._check_business_listings(phone_input),
-                'online_directories': self._check_online_directories(phone_input),
-                'data_brokers': self._check_data_brokers(phone_input),
-                'reverse_lookup_results': self._reverse_phone_lookup(phone_input)
-            }
-            
-            return footprint
-            
-        except Exception as e:
-            self.logger.error(f"Digital footprint error: {str(e)}")
-            return {}
+        return self._run_probes(self.FOOTPRINT_SOURCES, e164)
     
-    def _find_associated_emails(self, phone_input):
+    @_safe({}, "Email association error")
+    def _find_associated_emails(self, e164):
         """Find email addresses associated with the phone number"""
-        try:
-            associated_emails = {
-                'found_emails': [],
-                'confidence_scores': {},
-                'sources': {},
-                'verification_status': {}
-            }
-            
-            # Search through various sources
-            emails_from_breaches = self._find_emails_from_breaches(phone_input)
-            emails_from_social = self._find_emails_from_social_media(phone_input)
-            emails_from_public_records = self._find_emails_from_public_records(phone_input)
-            emails_from_business = self._find_emails_from_business_listings(phone_input)
-            
-            all_emails = []
-            all_emails.extend(emails_from_breaches)
-            all_emails.extend(emails_from_social)
-            all_emails.extend(emails_from_public_records)
-            all_emails.extend(emails_from_business)
-            
-            # Remove duplicates and score confidence
-            unique_emails = list(set(all_emails))
-            
-            for email in unique_emails:
-                associated_emails['found_emails'].append(email)
-                associated_emails['confidence_scores'][email] = self._calculate_email_confidence(email, phone_input)
-                associated_emails['sources'][email] = self._identify_email_sources(email, phone_input)
-                associated_emails['verification_status'][email] = self._verify_email_phone_association(email, phone_input)
-            
-            return associated_emails
-            
-        except Exception as e:
-            self.logger.error(f"Email association error: {str(e)}")
-            return {}
+        # Search through various sources
+        email_sources = self._run_probes(self.EMAIL_SOURCES, e164, fallback=list)
+        
+        # Remove duplicates (keeping first-seen order) and score confidence;
+        # the per-email lists are index-aligned with found_emails
+        found_emails = list(dict.fromkeys(chain.from_iterable(email_sources.values())))
+        
+        return {
+            'found_emails': found_emails,
+            'confidence_scores': [self._calculate_email_confidence(email, e164) for email in found_emails],
+            'sources': [self._identify_email_sources(email, e164) for email in found_emails],
+            'verification_status': [self._verify_email_phone_association(email, e164) for email in found_emails]
+        }
     
-    def _find_associated_websites(self, phone_input):
+    @_safe({}, "Website association error")
+    def _find_associated_websites(self, e164):
         """Find websites associated with the phone number"""
-        try:
-            associated_websites = {
-                'business_websites': [],
-                'personal_websites': [],
-                'social_profiles': [],
-                'e_commerce_profiles': [],
-                'professional_profiles': [],
-                'confidence_scores': {}
-            }
-            
-            # Search business directories
-            business_sites = self._search_business_websites(phone_input)
-            associated_websites['business_websites'].extend(business_sites)
-            
-            # Search professional networks
-            professional_sites = self._search_professional_networks(phone_input)
-            associated_websites['professional_profiles'].extend(professional_sites)
-            
-            # Search e-commerce platforms
-            ecommerce_profiles = self._search_ecommerce_platforms(phone_input)
-            associated_websites['e_commerce_profiles'].extend(ecommerce_profiles)
-            
-            # Search personal websites and blogs
-            personal_sites = self._search_personal_websites(phone_input)
-            associated_websites['personal_websites'].extend(personal_sites)
-            
-            # Calculate confidence scores for each website
-            all_websites = (business_sites + professional_sites + 
-                          ecommerce_profiles + personal_sites)
-            
-            for website in all_websites:
-                associated_websites['confidence_scores'][website] = self._calculate_website_confidence(website, phone_input)
-            
-            return associated_websites
-            
-        except Exception as e:
-            self.logger.error(f"Website association error: {str(e)}")
-            return {}
+        associated_websites = {
+            'business_websites': [],
+            'personal_websites': [],
+            'social_profiles': [],
+            'e_commerce_profiles': [],
+            'professional_profiles': [],
+            'confidence_scores': {}
+        }
+        
+        # Search business directories, professional networks, e-commerce platforms
+        # and personal websites and blogs concurrently
+        website_sources = self._run_probes(self.WEBSITE_SOURCES, e164, fallback=list)
+        business_sites = website_sources['business_websites']
+        professional_sites = website_sources['professional_profiles']
+        ecommerce_profiles = website_sources['e_commerce_profiles']
+        personal_sites = website_sources['personal_websites']
+        
+        associated_websites['business_websites'].extend(business_sites)
+        associated_websites['professional_profiles'].extend(professional_sites)
+        associated_websites['e_commerce_profiles'].extend(ecommerce_profiles)
+        associated_websites['personal_websites'].extend(personal_sites)
+        
+        # Calculate confidence scores once per distinct website across all categories
+        all_websites = dict.fromkeys(chain(business_sites, professional_sites, ecommerce_profiles, personal_sites))
+        
+        for website in all_websites:
+            associated_websites['confidence_scores'][website] = self._calculate_website_confidence(website, e164)
+        
+        return associated_websites
     
-    def _find_social_media_accounts(self, phone_input):
+    @_safe({}, "Social media search error")
+    def _find_social_media_accounts(self, e164):
         """Find social media accounts associated with the phone number"""
-        try:
-            social_accounts = {
-                'facebook': self._search_facebook(phone_input),
-                'twitter': self._search_twitter(phone_input),
-                'instagram': self._search_instagram(phone_input),
-                'linkedin': self._search_linkedin(phone_input),
-                'tiktok': self._search_tiktok(phone_input),
-                'snapchat': self._search_snapchat(phone_input),
-                'telegram': self._search_telegram(phone_input),
-                'whatsapp': self._search_whatsapp_business(phone_input),
-                'youtube': self._search_youtube(phone_input),
-                'pinterest': self._search_pinterest(phone_input),
-                'reddit': self._search_reddit(phone_input),
-                'discord': self._search_discord(phone_input)
-            }
-            
-            # Filter out empty results and add metadata
-            filtered_accounts = {}
-            for platform, results in social_accounts.items():
-                if results and results.get('found'):
-                    filtered_accounts[platform] = {
-                        **results,
-                        'confidence': self._calculate_social_confidence(platform, results, phone_input),
-                        'last_updated': datetime.now().isoformat(),
-                        'verification_method': results.get('method', 'Public search')
-                    }
-            
-            return filtered_accounts
-            
-        except Exception as e:
-            self.logger.error(f"Social media search error: {str(e)}")
-            return {}
+        social_accounts = self._run_probes(self.SOCIAL_SEARCHES, e164)
+        
+        # Filter out empty results and add metadata; every account shares one timestamp
+        last_updated = datetime.now().isoformat()
+        filtered_accounts = {}
+        for platform, results in social_accounts.items():
+            if results and results.get('found'):
+                # Each search returns a fresh dict, so annotate it in place
+                results['confidence'] = self._calculate_social_confidence(platform, results, e164)
+                results['last_updated'] = last_updated
+                results['verification_method'] = results.get('method', 'Public search')
+                filtered_accounts[platform] = results
+        
+        return filtered_accounts
     
     # Email finding methods
-    def _find_emails_from_breaches(self, phone_input):
+    def _find_emails_from_breaches(self, e164):
         """Find emails from data breach databases"""
-        try:
-            # This would integrate with breach databases that allow phone number searches
-            # Placeholder implementation
-            return []
-        except:
-            return []
+        # This would integrate with breach databases that allow phone number searches
+        # Placeholder implementation
+        return []
     
-    def _find_emails_from_social_media(self, phone_input):
+    def _find_emails_from_social_media(self, e164):
         """Find emails from social media profiles"""
-        try:
-            # This would search social media APIs for public email information
-            # Placeholder implementation
-            return []
-        except:
-            return []
+        # This would search social media APIs for public email information
+        # Placeholder implementation
+        return []
     
-    def _find_emails_from_public_records(self, phone_input):
+    def _find_emails_from_public_records(self, e164):
         """Find emails from public records"""
-        try:
-            # This would search public records databases
-            # Placeholder implementation
-            return []
-        except:
-            return []
+        # This would search public records databases
+        # Placeholder implementation
+        return []
     
-    def _find_emails_from_business_listings(self, phone_input):
+    def _find_emails_from_business_listings(self, e164):
         """Find emails from business listings"""
-        try:
-            # This would search business directory APIs
-            # Placeholder implementation
-            return []
-        except:
-            return []
+        # This would search business directory APIs
+        # Placeholder implementation
+        return []
+    
+    # Email sources searched by _find_associated_emails
+    EMAIL_SOURCES = (
+        ('breaches', _find_emails_from_breaches),
+        ('social_media', _find_emails_from_social_media),
+        ('public_records', _find_emails_from_public_records),
+        ('business_listings', _find_emails_from_business_listings)
+    )
     
     # Website finding methods
-    def _search_business_websites(self, phone_input):
+    def _search_business_websites(self, e164):
         """Search for business websites using the phone number"""
-        try:
-            # This would search Google My Business, Yelp, Yellow Pages, etc.
-            # Placeholder implementation
-            return []
-        except:
-            return []
+        # This would search Google My Business, Yelp, Yellow Pages, etc.
+        # Placeholder implementation
+        return []
     
-    def _search_professional_networks(self, phone_input):
+    def _search_professional_networks(self, e164):
         """Search professional networks for profiles"""
-        try:
-            # This would search LinkedIn, AngelList, Crunchbase, etc.
-            # Placeholder implementation
-            return []
-        except:
-            return []
+        # This would search LinkedIn, AngelList, Crunchbase, etc.
+        # Placeholder implementation
+        return []
     
-    def _search_ecommerce_platforms(self, phone_input):
+    def _search_ecommerce_platforms(self, e164):
         """Search e-commerce platforms for seller profiles"""
-        try:
-            # This would search eBay, Amazon seller profiles, Etsy, etc.
-            # Placeholder implementation
-            return []
-        except:
-            return []
+        # This would search eBay, Amazon seller profiles, Etsy, etc.
+        # Placeholder implementation
+        return []
     
-    def _search_personal_websites(self, phone_input):
+    def _search_personal_websites(self, e164):
         """Search for personal websites and blogs"""
-        try:
-            # This would use search engines to find personal sites
-            # Placeholder implementation
-            return []
-        except:
-            return []
+        # This would use search engines to find personal sites
+        # Placeholder implementation
+        return []
+    
+    # Website sources searched by _find_associated_websites, keyed by result list
+    WEBSITE_SOURCES = (
+        ('business_websites', _search_business_websites),
+        ('professional_profiles', _search_professional_networks),
+        ('e_commerce_profiles', _search_ecommerce_platforms),
+        ('personal_websites', _search_personal_websites)
+    )
     
     # Social media search methods
-    def _search_facebook(self, phone_input):
+    def _search_facebook(self, e164):
         """Search Facebook for profiles associated with phone number"""
-        try:
-            # Note: Facebook's API has strict privacy controls
-            # This would only find publicly available information
-            return {'found': False, 'profiles': [], 'method': 'Public search'}
-        except:
-            return {'found': False, 'profiles': []}
+        # Note: Facebook's API has strict privacy controls
+        # This would only find publicly available information
+        return {'found': False, 'profiles': [], 'method': 'Public search'}
     
-    def _search_twitter(self, phone_input):
+    def _search_twitter(self, e164):
         """Search Twitter for profiles"""
-        try:
-            # This would use Twitter's API to search for public profiles
-            return {'found': False, 'profiles': [], 'method': 'API search'}
-        except:
-            return {'found': False, 'profiles': []}
+        # This would use Twitter's API to search for public profiles
+        return {'found': False, 'profiles': [], 'method': 'API search'}
     
-    def _search_instagram(self, phone_input):
+    def _search_instagram(self, e164):
         """Search Instagram for profiles"""
-        try:
-            # Instagram has strict privacy controls
-            return {'found': False, 'profiles': [], 'method': 'Public search'}
-        except:
-            return {'found': False, 'profiles': []}
+        # Instagram has strict privacy controls
+        return {'found': False, 'profiles': [], 'method': 'Public search'}
     
-    def _search_linkedin(self, phone_input):
+    def _search_linkedin(self, e164):
         """Search LinkedIn for professional profiles"""
-        try:
-            # LinkedIn's API has restrictions on phone number searches
-            return {'found': False, 'profiles': [], 'method': 'Public search'}
-        except:
-            return {'found': False, 'profiles': []}
+        # LinkedIn's API has restrictions on phone number searches
+        return {'found': False, 'profiles': [], 'method': 'Public search'}
     
-    def _search_tiktok(self, phone_input):
+    def _search_tiktok(self, e164):
         """Search TikTok for profiles"""
-        try:
-            return {'found': False, 'profiles': [], 'method': 'Public search'}
-        except:
-            return {'found': False, 'profiles': []}
+        return {'found': False, 'profiles': [], 'method': 'Public search'}
     
-    def _search_snapchat(self, phone_input):
+    def _search_snapchat(self, e164):
         """Search Snapchat for profiles"""
-        try:
-            return {'found': False, 'profiles': [], 'method': 'Public search'}
-        except:
-            return {'found': False, 'profiles': []}
+        return {'found': False, 'profiles': [], 'method': 'Public search'}
     
-    def _search_telegram(self, phone_input):
+    def _search_telegram(self, e164):
         """Search Telegram for public profiles"""
-        try:
-            # Telegram allows finding users by phone number if they allow it
-            return {'found': False, 'profiles': [], 'method': 'Public search'}
-        except:
-            return {'found': False, 'profiles': []}
+        # Telegram allows finding users by phone number if they allow it
+        return {'found': False, 'profiles': [], 'method': 'Public search'}
     
-    def _search_whatsapp_business(self, phone_input):
+    def _search_whatsapp_business(self, e164):
         """Search WhatsApp Business profiles"""
-        try:
-            # WhatsApp Business profiles can be publicly searchable
-            return {'found': False, 'profiles': [], 'method': 'Business directory'}
-        except:
-            return {'found': False, 'profiles': []}
+        # WhatsApp Business profiles can be publicly searchable
+        return {'found': False, 'profiles': [], 'method': 'Business directory'}
     
-    def _search_youtube(self, phone_input):
+    def _search_youtube(self, e164):
         """Search YouTube for channels"""
-        try:
-            return {'found': False, 'profiles': [], 'method': 'Public search'}
-        except:
-            return {'found': False, 'profiles': []}
+        return {'found': False, 'profiles': [], 'method': 'Public search'}
     
-    def _search_pinterest(self, phone_input):
+    def _search_pinterest(self, e164):
         """Search Pinterest for profiles"""
-        try:
-            return {'found': False, 'profiles': [], 'method': 'Public search'}
-        except:
-            return {'found': False, 'profiles': []}
+        return {'found': False, 'profiles': [], 'method': 'Public search'}
     
-    def _search_reddit(self, phone_input):
+    def _search_reddit(self, e164):
         """Search Reddit for user profiles"""
-        try:
-            return {'found': False, 'profiles': [], 'method': 'Public search'}
-        except:
-            return {'found': False, 'profiles': []}
+        return {'found': False, 'profiles': [], 'method': 'Public search'}
     
-    def _search_discord(self, phone_input):
+    def _search_discord(self, e164):
         """Search Discord for public profiles"""
-        try:
-            return {'found': False, 'profiles': [], 'method': 'Public search'}
-        except:
-            return {'found': False, 'profiles': []}
+        return {'found': False, 'profiles': [], 'method': 'Public search'}
+    
+    # Platforms searched by _find_social_media_accounts
+    SOCIAL_SEARCHES = (
+        ('facebook', _search_facebook),
+        ('twitter', _search_twitter),
+        ('instagram', _search_instagram),
+        ('linkedin', _search_linkedin),
+        ('tiktok', _search_tiktok),
+        ('snapchat', _search_snapchat),
+        ('telegram', _search_telegram),
+        ('whatsapp', _search_whatsapp_business),
+        ('youtube', _search_youtube),
+        ('pinterest', _search_pinterest),
+        ('reddit', _search_reddit),
+        ('discord', _search_discord)
+    )
     
     # Additional OSINT methods
-    def _search_engines_lookup(self, phone_input):
+    def _search_engines_lookup(self, e164):
         """Search engines for phone number mentions"""
-        try:
-            # This would use search engine APIs to find mentions
-            return {'google_results': 0, 'bing_results': 0, 'duckduckgo_results': 0}
-        except:
-            return {}
+        # This would use search engine APIs to find mentions
+        return {'google_results': 0, 'bing_results': 0, 'duckduckgo_results': 0}
     
-    def _check_public_records(self, phone_input):
+    def _check_public_records(self, e164):
         """Check public records databases"""
-        try:
-            # This would search public records APIs
-            return {'found': False, 'records': []}
-        except:
-            return {}
+        # This would search public records APIs
+        return {'found': False, 'records': []}
     
-    def _check_business_listings(self, phone_input):
+    def _check_business_listings(self, e164):
         """Check business listing directories"""
-        try:
-            # This would search Yellow Pages, Google My Business, etc.
-            return {'found': False, 'listings': []}
-        except:
-            return {}
+        # This would search Yellow Pages, Google My Business, etc.
+        return {'found': False, 'listings': []}
     
-    def _check_online_directories(self, phone_input):
+    def _check_online_directories(self, e164):
         """Check online phone directories"""
-        try:
-            # This would search WhitePages, Spokeo, etc.
-            return {'found': False, 'directories': []}
-        except:
-            return {}
+        # This would search WhitePages, Spokeo, etc.
+        return {'found': False, 'directories': []}
     
-    def _check_data_brokers(self, phone_input):
+    def _check_data_brokers(self, e164):
         """Check data broker websites"""
-        try:
-            # This would check people search engines
-            return {'found': False, 'brokers': []}
-        except:
-            return {}
+        # This would check people search engines
+        return {'found': False, 'brokers': []}
     
-    def _reverse_phone_lookup(self, phone_input):
+    def _reverse_phone_lookup(self, e164):
         """Perform reverse phone lookup"""
-        try:
-            # This would use reverse lookup services
-            return {'found': False, 'results': []}
-        except:
-            return {}
+        # This would use reverse lookup services
+        return {'found': False, 'results': []}
+    
+    # Lookups gathered by _get_digital_footprint
+    FOOTPRINT_SOURCES = (
+        ('search_engines', _search_engines_lookup),
+        ('public_records', _check_public_records),
+        ('business_listings', _check_business_listings),
+        ('online_directories', _check_online_directories),
+        ('data_brokers', _check_data_brokers),
+        ('reverse_lookup_results', _reverse_phone_lookup)
+    )
     
     # Confidence calculation methods
-    def _calculate_email_confidence(self, email, phone_input):
+    def _calculate_email_confidence(self, email, e164):
         """Calculate confidence score for email association"""
-        try:
-            # This would analyze various factors to determine confidence
-            return 50  # Placeholder neutral score
-        except:
-            return 0
+        # This would analyze various factors to determine confidence
+        return 50  # Placeholder neutral score
     
-    def _calculate_website_confidence(self, website, phone_input):
+    def _calculate_website_confidence(self, website, e164):
         """Calculate confidence score for website association"""
-        try:
-            # This would analyze various factors to determine confidence
-            return 50  # Placeholder neutral score
-        except:
-            return 0
+        # This would analyze various factors to determine confidence
+        return 50  # Placeholder neutral score
     
-    def _calculate_social_confidence(self, platform, results, phone_input):
+    def _calculate_social_confidence(self, platform, results, e164):
         """Calculate confidence score for social media association"""
-        try:
-            # This would analyze various factors to determine confidence
-            return 50  # Placeholder neutral score
-        except:
-            return 0
+        # This would analyze various factors to determine confidence
+        return 50  # Placeholder neutral score
     
     # Verification methods
-    def _identify_email_sources(self, email, phone_input):
+    def _identify_email_sources(self, email, e164):
         """Identify sources where email was found"""
-        try:
-            return ['Public records']  # Placeholder
-        except:
-            return []
+        return ['Public records']  # Placeholder
     
-    def _verify_email_phone_association(self, email, phone_input):
+    def _verify_email_phone_association(self, email, e164):
         """Verify the association between email and phone"""
-        try:
-            return 'Unverified'  # Placeholder
-        except:
-            return 'Unknown'
+        return 'Unverified'  # Placeholder
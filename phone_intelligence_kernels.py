@@ -0,0 +1,87 @@
+"""
+Scoring kernels for the analysis engine
+
+Pure, fully annotated functions kept apart from PhoneIntelligence so they can
+be compiled with mypyc (`mypyc phone_intelligence_kernels.py`); the compiled
+extension is picked up automatically in place of this file.
+"""
+
+from typing import Final, Tuple
+
+# Risk factor bits packed into the RISK_SCORE_TABLE index
+RISK_SPAM: Final = 1
+RISK_VOIP: Final = 2
+RISK_BREACH: Final = 4
+RISK_LOW_REPUTATION: Final = 8  # Reputation score below 30
+RISK_HIGH_REPUTATION: Final = 16  # Reputation score above 70
+
+def _risk_score_for_state(state: int) -> int:
+    """Overall risk score (0-100) for a combination of RISK_* bits"""
+    base_score = 20  # Base risk score
+    
+    # Add risk based on security indicators
+    if state & RISK_SPAM:
+        base_score += 40
+    
+    if state & RISK_VOIP:
+        base_score += 20
+    
+    # Add risk based on breach data
+    if state & RISK_BREACH:
+        base_score += 30
+    
+    # Adjust based on reputation score
+    if state & RISK_LOW_REPUTATION:
+        base_score += 20
+    elif state & RISK_HIGH_REPUTATION:
+        base_score = max(0, base_score - 10)
+    
+    return min(100, base_score)
+
+# Risk score for every combination of risk factor bits, precomputed at import
+RISK_SCORE_TABLE: Final[Tuple[int, ...]] = tuple([_risk_score_for_state(state) for state in range(32)])
+
+def calculate_risk_score(is_spam: bool, is_voip: bool, has_breach: bool, reputation: float) -> int:
+    """
+    Overall risk score for one analysis
+    
+    Args:
+        is_spam (bool): Number found in a spam database
+        is_voip (bool): Number is a VoIP line
+        has_breach (bool): Breach data was found
+        reputation (float): Reputation score (0-100)
+        
+    Returns:
+        int: Risk score (0-100)
+    """
+    state = 0
+    if is_spam:
+        state |= RISK_SPAM
+    if is_voip:
+        state |= RISK_VOIP
+    if has_breach:
+        state |= RISK_BREACH
+    if reputation < 30:
+        state |= RISK_LOW_REPUTATION
+    elif reputation > 70:
+        state |= RISK_HIGH_REPUTATION
+    return RISK_SCORE_TABLE[state]
+
+def determine_overall_status(indicator_count: int, messaging_online: bool) -> str:
+    """
+    Overall online status from the collected signals
+    
+    Args:
+        indicator_count (int): Number of online indicators found
+        messaging_online (bool): A messaging app reports the number online
+        
+    Returns:
+        str: Status label shown in the network intelligence view
+    """
+    if indicator_count >= 2:
+        return 'Online'
+    if indicator_count == 1:
+        return 'Recently Online'
+    if messaging_online:
+        return 'Online via messaging'
+    return 'Offline'
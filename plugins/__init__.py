@@ -5,9 +5,12 @@ Plugin system for extending phone intelligence capabilities
 class PluginBase:
     """Base class for phone intelligence plugins"""
     
-    def __init__(self, name, version="1.0.0"):
+    __slots__ = ('name', 'version', 'description')
+    
+    def __init__(self, name, version="1.0.0", description="No description available"):
         self.name = name
         self.version = version
+        self.description = description
     
     def analyze(self, phone_number, context=None):
         """
@@ -22,10 +25,25 @@ class PluginBase:
         """
         raise NotImplementedError("Plugin must implement analyze method")
     
+    def analyze_many(self, phone_numbers, contexts=None):
+        """
+        Analyze several phone numbers; plugins with a vectorized path override this
+        
+        Args:
+            phone_numbers: Sequence of parsed phone number objects
+            contexts: Optional sequence of context data aligned with phone_numbers
+            
+        Returns:
+            list: Analysis results aligned with phone_numbers
+        """
+        if contexts is None:
+            contexts = [None] * len(phone_numbers)
+        return [self.analyze(number, context) for number, context in zip(phone_numbers, contexts)]
+    
     def get_info(self):
         """Return plugin information"""
         return {
             'name': self.name,
             'version': self.version,
-            'description': getattr(self, 'description', 'No description available')
+            'description': self.description
         }
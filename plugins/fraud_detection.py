@@ -4,13 +4,37 @@ Fraud detection plugin for phone intelligence
 
 from . import PluginBase
 import logging
+import numpy as np
+from functools import lru_cache
+
+# Example high-risk calling codes
+HIGH_RISK_COUNTRY_CODES = frozenset((234, 233, 254))
+# HIGH_RISK_COUNTRY_CODES as an array for np.isin over a batch of calling codes
+HIGH_RISK_COUNTRY_CODE_ARRAY = np.array(sorted(HIGH_RISK_COUNTRY_CODES), dtype=np.int32)
+
+def risk_level(fraud_score):
+    """Convert a fraud score (0-1) to a risk level"""
+    if fraud_score < 0.3:
+        return "Low"
+    elif fraud_score < 0.7:
+        return "Medium"
+    else:
+        return "High"
+
+@lru_cache(maxsize=1024)
+def fraud_indicators_for_country(country_code):
+    """Fraud indicators that follow from the calling code alone"""
+    if country_code in HIGH_RISK_COUNTRY_CODES:
+        return ("High-risk country code",)
+    return ()
 
 class FraudDetectionPlugin(PluginBase):
     """Plugin for detecting fraudulent phone numbers using ML models"""
     
+    __slots__ = ('logger',)
+    
     def __init__(self):
-        super().__init__("Fraud Detection", "1.0.0")
-        self.description = "Machine learning-based fraud detection for phone numbers"
+        super().__init__("Fraud Detection", "1.0.0", "Machine learning-based fraud detection for phone numbers")
         self.logger = logging.getLogger(__name__)
     
     def analyze(self, phone_number, context=None):
@@ -45,6 +69,40 @@ class FraudDetectionPlugin(PluginBase):
             self.logger.error(f"Fraud detection error: {str(e)}")
             return {'error': str(e)}
     
+    def analyze_many(self, phone_numbers, contexts=None):
+        """
+        Analyze a batch of phone numbers with one vectorized country-code check
+        
+        Args:
+            phone_numbers: Sequence of parsed phone number objects
+            contexts: Optional sequence of context data aligned with phone_numbers
+            
+        Returns:
+            list: Fraud analysis results aligned with phone_numbers
+        """
+        try:
+            # Numbers without a calling code get 0, which is never high-risk
+            country_codes = np.fromiter(
+                (getattr(number, 'country_code', 0) or 0 for number in phone_numbers),
+                dtype=np.int32, count=len(phone_numbers)
+            )
+            high_risk = np.isin(country_codes, HIGH_RISK_COUNTRY_CODE_ARRAY)
+            scores = np.minimum(1.0, 0.1 + 0.3 * high_risk)
+            
+            return [
+                {
+                    'fraud_probability': float(score),
+                    'risk_level': risk_level(float(score)),
+                    'indicators': list(fraud_indicators_for_country(int(code))),
+                    'confidence': 0.85  # Model confidence
+                }
+                for score, code in zip(scores, country_codes)
+            ]
+            
+        except Exception as e:
+            self.logger.error(f"Fraud detection error: {str(e)}")
+            return [{'error': str(e)} for _ in phone_numbers]
+    
     def _calculate_fraud_score(self, phone_number, context):
         """Calculate fraud probability score (0-1)"""
         # Placeholder implementation
@@ -54,28 +112,19 @@ class FraudDetectionPlugin(PluginBase):
         # Example risk factors
         if hasattr(phone_number, 'country_code'):
             # Higher risk for certain country codes (example)
-            high_risk_countries = [234, 233, 254]  # Example country codes
-            if phone_number.country_code in high_risk_countries:
+            if phone_number.country_code in HIGH_RISK_COUNTRY_CODES:
                 base_score += 0.3
         
         return min(1.0, base_score)
     
     def _get_risk_level(self, fraud_score):
         """Convert fraud score to risk level"""
-        if fraud_score < 0.3:
-            return "Low"
-        elif fraud_score < 0.7:
-            return "Medium"
-        else:
-            return "High"
+        return risk_level(fraud_score)
     
     def _get_fraud_indicators(self, phone_number, context):
         """Get list of fraud indicators"""
-        indicators = []
-        
-        # Example indicators
+        # Example indicators; only the calling code is used, so context is not part of the cache key
         if hasattr(phone_number, 'country_code'):
-            if phone_number.country_code in [234, 233, 254]:
-                indicators.append("High-risk country code")
+            return list(fraud_indicators_for_country(phone_number.country_code))
         
-        return indicators
+        return []
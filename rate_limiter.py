@@ -0,0 +1,34 @@
+"""
+Request throttling for batch phone intelligence lookups
+"""
+
+import asyncio
+import time
+
+class AsyncRateLimiter:
+    """Leaky-bucket limiter that spaces request starts to stay under provider limits"""
+    
+    def __init__(self, max_rps, backoff_until=None):
+        """
+        Args:
+            max_rps (float): Maximum request starts per second (0 disables spacing)
+            backoff_until (callable): Optional callable returning a time.monotonic()
+                deadline before which no request may start (e.g. from Retry-After)
+        """
+        self.interval = 1.0 / max_rps if max_rps > 0 else 0.0
+        self.backoff_until = backoff_until
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self):
+        """Wait until the next request slot is available"""
+        async with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_slot)
+            if self.backoff_until:
+                start = max(start, self.backoff_until())
+            self._next_slot = start + self.interval
+        
+        delay = start - now
+        if delay > 0:
+            await asyncio.sleep(delay)
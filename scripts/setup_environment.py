@@ -5,32 +5,18 @@ Environment setup script for Phone Intelligence Tool
 
 import os
 import sys
-import subprocess
-from pathlib import Path
 
-def check_python_version():
-    """Check if Python version is compatible"""
-    if sys.version_info < (3, 8):
-        print("❌ Python 3.8 or higher is required")
-        print(f"Current version: {sys.version}")
-        return False
-    print(f"✅ Python version: {sys.version}")
-    return True
+# Project-local pip cache, reused across setup runs
+PIP_CACHE_DIR = ".pip-cache"
 
-def install_requirements():
-    """Install required packages"""
-    try:
-        print("📦 Installing requirements...")
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", "requirements.txt"])
-        print("✅ Requirements installed successfully")
-        return True
-    except subprocess.CalledProcessError as e:
-        print(f"❌ Failed to install requirements: {e}")
-        return False
+# Digest of the last successfully installed requirements.txt
+REQUIREMENTS_DIGEST_PATH = ".setup_cache/requirements.sha256"
 
-def create_env_file():
-    """Create .env file template"""
-    env_template = """# Phone Intelligence Tool Configuration
+# Touched after a full successful setup; reruns exit early while it is newer than requirements.txt
+SETUP_MARKER_PATH = ".setup_cache/complete"
+
+# Initial .env contents, written by create_env_file when no .env exists
+ENV_TEMPLATE = b"""# Phone Intelligence Tool Configuration
 # Add your API keys here (optional but recommended for full functionality)
 
 # Numverify API (https://numverify.com)
@@ -46,31 +32,162 @@ HIBP_API_KEY=
 # Application Settings
 LOG_LEVEL=INFO
 MAX_REQUESTS_PER_HOUR=100
+MAX_REQUESTS_PER_SECOND=5
+MAX_CONCURRENT_REQUESTS=4
+CACHE_TTL=3600
+API_CACHE_PATH=api_cache.sqlite3
+API_CACHE_TTL=604800
+ANALYSIS_HISTORY_LIMIT=50
 ENABLE_AUDIT_LOG=true
 ENABLE_OSINT_ENRICHMENT=true
 ENABLE_BREACH_CHECKING=true
 ENABLE_SOCIAL_MEDIA_LOOKUP=false
 """
+
+def check_python_version():
+    """Check if Python version is compatible"""
+    if sys.version_info < (3, 8):
+        print("❌ Python 3.8 or higher is required")
+        print(f"Current version: {sys.version}")
+        return False
+    print(f"✅ Python version: {sys.version}")
+    return True
+
+def run_pip(args):
+    """Run pip inside this interpreter, or in a subprocess if pip's internals are unavailable
+    
+    Args:
+        args (list): pip command line, e.g. ["install", "-r", "requirements.txt"]
+        
+    Returns:
+        int: pip's exit status
+    """
+    try:
+        from pip._internal.cli.main import main as pip_main
+    except ImportError:
+        import subprocess
+        return subprocess.call([sys.executable, "-m", "pip", *args])
+    
+    try:
+        return pip_main(args) or 0
+    except SystemExit as e:
+        return e.code if isinstance(e.code, int) else int(e.code is not None)
+
+def requirements_digest():
+    """SHA-256 hex digest of requirements.txt and the interpreter it is installed into"""
+    import hashlib
+    with open("requirements.txt", "rb") as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            digest = hashlib.file_digest(f, "sha256")
+        else:
+            digest = hashlib.sha256(f.read())
+    # A fresh venv or another Python needs its own install even for the same file
+    digest.update(f"\0{sys.prefix}\0{sys.version}".encode())
+    return digest.hexdigest()
+
+def requirements_unchanged():
+    """Whether requirements.txt matches the last successful install"""
+    from pathlib import Path
+    try:
+        return Path(REQUIREMENTS_DIGEST_PATH).read_text().strip() == requirements_digest()
+    except OSError:
+        return False
+
+def record_requirements_installed():
+    """Remember the installed requirements.txt so later runs can skip pip"""
+    from pathlib import Path
+    digest_path = Path(REQUIREMENTS_DIGEST_PATH)
+    try:
+        digest_path.parent.mkdir(exist_ok=True)
+        digest_path.write_text(requirements_digest() + "\n")
+    except OSError as e:
+        print(f"⚠️  Could not record installed requirements: {e}")
+
+def compile_site_packages():
+    """Byte-compile installed packages in parallel; already up-to-date files are skipped"""
+    import compileall
+    import sysconfig
+    paths = sysconfig.get_paths()
+    for site_dir in dict.fromkeys((paths["purelib"], paths["platlib"])):
+        compileall.compile_dir(site_dir, quiet=1, workers=0)
+
+def install_requirements():
+    """Install required packages"""
+    print("📦 Installing requirements...")
+    # Keep pip's downloaded and built wheels with the project so reruns reuse them
+    os.environ.setdefault("PIP_CACHE_DIR", os.path.abspath(PIP_CACHE_DIR))
     
-    env_path = Path(".env")
-    if not env_path.exists():
-        with open(env_path, "w") as f:
-            f.write(env_template)
-        print("✅ Created .env file template")
-        print("📝 Please edit .env file to add your API keys")
-    else:
+    # wheel must be present up front or pip falls back to legacy sdist builds;
+    # pip itself is not upgraded here because it is running in this interpreter
+    status = run_pip(["install", "--upgrade", "wheel", "setuptools"])
+    if status == 0:
+        # pip byte-compiles serially; compile_site_packages does it on every core instead
+        status = run_pip(["install", "--prefer-binary", "--no-compile", "-r", "requirements.txt"])
+    if status != 0:
+        print(f"❌ Failed to install requirements: pip exited with status {status}")
+        return False
+    compile_site_packages()
+    print("✅ Requirements installed successfully")
+    return True
+
+def create_env_file():
+    """Create .env file template"""
+    # O_EXCL checks for and creates the file in one step; owner-only since it holds API keys
+    try:
+        fd = os.open(".env", os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    except FileExistsError:
         print("ℹ️  .env file already exists")
+        return
+    
+    try:
+        os.write(fd, ENV_TEMPLATE)
+    finally:
+        os.close(fd)
+    print("✅ Created .env file template")
+    print("📝 Please edit .env file to add your API keys")
 
 def create_directories():
     """Create necessary directories"""
     directories = ["logs", "exports", "plugins"]
     
+    # One directory listing instead of a stat per directory
+    with os.scandir(".") as entries:
+        existing = {entry.name for entry in entries if entry.is_dir()}
+    
     for directory in directories:
-        Path(directory).mkdir(exist_ok=True)
-        print(f"✅ Created directory: {directory}")
+        if directory not in existing:
+            os.makedirs(directory, exist_ok=True)
+    print("\n".join(f"✅ Created directory: {directory}" for directory in directories))
+
+def setup_environment_id():
+    """Identifies the interpreter setup installs into, so another venv or Python is set up anew"""
+    return f"{sys.prefix}\n{sys.version}\n"
+
+def setup_complete():
+    """Whether a previous setup succeeded for this interpreter and requirements.txt has not changed since"""
+    try:
+        if os.stat(SETUP_MARKER_PATH).st_mtime < os.stat("requirements.txt").st_mtime:
+            return False
+        with open(SETUP_MARKER_PATH, encoding="utf-8") as f:
+            return f.read() == setup_environment_id()
+    except OSError:
+        return False
+
+def mark_setup_complete():
+    """Record a successful setup for setup_complete"""
+    try:
+        os.makedirs(os.path.dirname(SETUP_MARKER_PATH), exist_ok=True)
+        with open(SETUP_MARKER_PATH, "w", encoding="utf-8") as f:
+            f.write(setup_environment_id())
+    except OSError as e:
+        print(f"⚠️  Could not record completed setup: {e}")
 
 def main():
     """Main setup function"""
+    if "--force" not in sys.argv[1:] and setup_complete():
+        print("✅ Setup already complete (run with --force to redo it)")
+        return
+    
     print("🚀 Setting up Phone Intelligence Tool...")
     print("=" * 50)
     
@@ -78,15 +195,26 @@ def main():
     if not check_python_version():
         sys.exit(1)
     
-    # Install requirements
-    if not install_requirements():
-        sys.exit(1)
+    from concurrent.futures import ThreadPoolExecutor
     
-    # Create environment file
-    create_env_file()
+    # The environment file and directories don't depend on pip, so create them
+    # on a background thread (in that order) while requirements install
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        env_file = executor.submit(create_env_file)
+        dirs = executor.submit(create_directories)
+        
+        # Install requirements, unless requirements.txt is unchanged since the last install
+        if requirements_unchanged():
+            print("✅ Requirements unchanged since last install, skipping pip")
+        elif install_requirements():
+            record_requirements_installed()
+        else:
+            sys.exit(1)
+        
+        env_file.result()
+        dirs.result()
     
-    # Create directories
-    create_directories()
+    mark_setup_complete()
     
     print("\n" + "=" * 50)
     print("✅ Setup completed successfully!")
@@ -0,0 +1,90 @@
+"""
+JSON and CSV serialization shared by the export and report views
+"""
+
+import csv
+import io
+import json
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the stdlib encoder produces equivalent output
+    orjson = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:  # pyarrow ships with Streamlit, but fall back to pandas without it
+    pa = None
+
+# Reused stdlib encoder for when orjson is unavailable
+_JSON_ENCODER = json.JSONEncoder(indent=2, default=str, ensure_ascii=False)
+
+# Below this many rows pandas' writer is as fast and skips the Arrow conversion
+ARROW_CSV_MIN_ROWS = 100
+
+def dumps_json(obj):
+    """Serialize analysis results to indented JSON
+    
+    Args:
+        obj: JSON-compatible data; unknown types are rendered with str()
+        
+    Returns:
+        bytes: UTF-8 encoded JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return _JSON_ENCODER.encode(obj).encode('utf-8')
+
+def flatten_record(record, prefix=""):
+    """Yield (dotted_key, value) pairs for a nested dict, like pd.json_normalize
+    
+    Args:
+        record (dict): Nested analysis results
+        prefix (str): Key path of the enclosing dict
+        
+    Yields:
+        tuple: Dotted column name and leaf value
+    """
+    for key, value in record.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict) and value:
+            yield from flatten_record(value, f"{name}.")
+        else:
+            yield name, value
+
+def record_to_csv(record):
+    """Encode a single nested dict as a header row plus one value row
+    
+    Args:
+        record (dict): Nested analysis results
+        
+    Returns:
+        bytes: UTF-8 encoded CSV
+    """
+    columns = list(flatten_record(record))
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(name for name, _ in columns)
+    writer.writerow(value for _, value in columns)
+    return buffer.getvalue().encode('utf-8')
+
+def frame_to_csv(df, header=True):
+    """Encode a DataFrame as CSV, using Arrow's native writer for larger frames
+    
+    Args:
+        df (pd.DataFrame): Flat tabular results
+        header (bool): Whether to write the column header row
+        
+    Returns:
+        bytes: UTF-8 encoded CSV without the index
+    """
+    if pa is not None and len(df) >= ARROW_CSV_MIN_ROWS:
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            sink = pa.BufferOutputStream()
+            pacsv.write_csv(table, sink, write_options=pacsv.WriteOptions(include_header=header))
+            return sink.getvalue().to_pybytes()
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            pass  # Mixed-type object columns; let pandas stringify them
+    return df.to_csv(index=False, header=header).encode()